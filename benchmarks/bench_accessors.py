@@ -0,0 +1,54 @@
+"""
+Per-update cost of entity reads for a 6 zone plant.
+
+Compares deep copy of the sensor table on each access (previous sensor_values behaviour)
+with the published snapshot and the per-sensor accessors.
+
+Usage: python benchmarks/bench_accessors.py [zones]
+"""
+import copy
+import sys
+from collections.abc import Mapping
+
+from common import entity_reads, load_ariston, make_handler, timeit
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    module = load_ariston()
+    handler = make_handler(module, zones=zones)
+    sensors = [sensor for sensor in handler.sensor_values if handler.get_value(sensor) is not None]
+    reads = entity_reads(zones, sensors)
+    # Sensor table as plain dictionaries like it was kept before records were introduced
+    legacy_table = {
+        sensor: {key: dict(value) if isinstance(value, Mapping) else value for key, value in record.items()}
+        for sensor, record in handler._ariston_sensors.items()}
+
+    def deepcopy_per_access():
+        for sensor, key in reads:
+            copy.deepcopy(legacy_table)[sensor][key]
+
+    def snapshot_access():
+        for sensor, key in reads:
+            handler.sensor_values[sensor][key]
+
+    def accessor_access():
+        for sensor, key in reads:
+            if key == "value":
+                handler.get_value(sensor)
+            else:
+                handler.get_sensor(sensor)[key]
+
+    print(f"{zones} zone(s), {len(sensors)} sensors with values, {len(reads)} reads per update")
+    legacy = timeit(deepcopy_per_access, repeat=3, number=1)
+    for name, func in (
+        ("deepcopy per access", deepcopy_per_access),
+        ("snapshot access", snapshot_access),
+        ("get_sensor/get_value", accessor_access),
+    ):
+        elapsed = legacy if func is deepcopy_per_access else timeit(func)
+        print(f"{name:>22}: {elapsed * 1000:10.3f} ms per update ({legacy / elapsed:8.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
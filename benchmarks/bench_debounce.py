@@ -0,0 +1,42 @@
+"""
+Set requests sent for a burst of set_http_data calls, like dragging a thermostat slider.
+
+Usage: python benchmarks/bench_debounce.py [calls] [interval ms] [path to other ariston.py revision]
+"""
+import sys
+import time
+
+from common import load_ariston, make_handler, sent_posts
+
+
+def run(module, calls, interval):
+    handler = make_handler(module, zones=1)
+    transport = handler._session
+    handler._started = True
+    for step in range(calls):
+        handler.set_http_data(dhw_set_temperature=51 + step % 10)
+        time.sleep(interval)
+    window = getattr(handler, "_SET_COALESCE_WINDOW", 0)
+    time.sleep(window + 0.5)
+    handler._started = False
+    sent = [json_data["new"] for url, json_data in sent_posts(transport) if "/dhwTemp" in url]
+    metrics = handler.set_metrics if hasattr(handler, "set_metrics") else None
+    return sent, metrics
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    interval = (int(sys.argv[2]) if len(sys.argv) > 2 else 150) / 1000
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 3:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[3])))
+    print(f"{calls} calls of set_http_data every {interval * 1000:.0f} ms")
+    for label, module in revisions:
+        sent, metrics = run(module, calls, interval)
+        print(f"{label:>16}: {len(sent)} set requests sent {sent}")
+        if metrics is not None:
+            print(f"{'':>16}  metrics {metrics}")
+
+
+if __name__ == "__main__":
+    main()
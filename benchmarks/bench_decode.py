@@ -0,0 +1,25 @@
+"""
+Decoding of main and additional responses depending on number of zones.
+
+Usage: python benchmarks/bench_decode.py [path to other ariston.py revision]
+"""
+import sys
+
+from common import additional_payload, fake_response, load_ariston, main_payload, make_handler, timeit
+
+
+def main():
+    module = load_ariston(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"{'zones':>5} {'items':>6} {'main':>12} {'additional':>12}")
+    for zones in range(1, 7):
+        handler = make_handler(module, zones=zones)
+        main_response = fake_response(main_payload(zones))
+        additional_response = fake_response(additional_payload())
+        items = len(main_payload(zones)["items"])
+        main_time = timeit(lambda: handler._store_data(main_response, "main"))
+        additional_time = timeit(lambda: handler._store_data(additional_response, "additional_params"))
+        print(f"{zones:>5} {items:>6} {main_time * 1000:>9.3f} ms {additional_time * 1000:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Fan-out of sensor changes to one subscriber per entity.
+
+Compares subscribers receiving all changes and filtering them by their own sensor
+with subscribers registered for their sensor only.
+Notifications are delivered synchronously to measure the work done by the handler and subscribers.
+
+Usage: python benchmarks/bench_fanout.py [zones] [changed sensors per update]
+"""
+import sys
+
+from common import SyncDispatcher, load_ariston, make_handler, set_sensor_value, timeit
+
+
+def run(module, zones, changes, per_sensor):
+    handler = make_handler(module, zones=zones)
+    dispatcher = SyncDispatcher()
+    handler._dispatcher = dispatcher
+    sensors = [sensor for sensor in handler.sensor_values if handler.get_value(sensor) is not None]
+    received = []
+
+    def entity_filtering(changed_data, sensor):
+        if sensor in changed_data:
+            received.append(sensor)
+
+    def entity_subscribed(changed_data, sensor):
+        received.append(sensor)
+
+    for sensor in sensors:
+        if per_sensor:
+            handler.subscribe_sensors(entity_subscribed, sensor, sensors=[sensor])
+        else:
+            handler.subscribe_sensors(entity_filtering, sensor)
+
+    changed = [sensor for sensor in sensors if isinstance(handler.get_value(sensor), (int, float))][:changes]
+    counter = [0]
+
+    def update():
+        counter[0] += 1
+        for sensor in changed:
+            set_sensor_value(handler, sensor, counter[0])
+        handler._publish_sensors()
+        handler._subscribers_sensors_inform()
+
+    elapsed = timeit(update, repeat=3, number=50)
+    updates = counter[0]
+    return len(sensors), elapsed, dispatcher.calls / updates, len(received) / updates
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    module = load_ariston()
+    print(f"{zones} zone(s), {changes} changed sensors per update")
+    print(f"{'':>12} {'subscribers':>12} {'per update':>12} {'calls':>7} {'received':>9}")
+    for label, per_sensor in (("all sensors", False), ("per sensor", True)):
+        subscribers, elapsed, calls, received = run(module, zones, changes, per_sensor)
+        print(f"{label:>12} {subscribers:>12} {elapsed * 1000:>9.3f} ms {calls:>7.0f} {received:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
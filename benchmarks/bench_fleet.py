@@ -0,0 +1,213 @@
+"""
+Load of a fleet of handlers polling the local simulator, used to size hosts and to catch scaling regressions.
+
+All handlers of a fleet are started at once, like integration setup of many plants. After every handler
+became available and one get period passed, steady state is measured for the given duration.
+Each fleet size runs in its own process so that threads and memory of previous fleets are not counted,
+the simulator runs in another process so that its CPU time is not counted either.
+
+Periods of handlers are divided by --scale to reach steady state quickly, request rate grows by the same factor.
+Reported values:
+    available   time from start until handler is available (p50 and max of the fleet)
+    threads     threads of the process in steady state (max of samples), listed by name at the end of run
+    RSS         resident memory of the process in steady state (max of samples)
+    CPU/poll    CPU time of the process per request sent
+    req/s       requests sent per second
+    latency     p50 and p99 latency of requests, failed requests are counted separately
+
+Usage: python benchmarks/bench_fleet.py [--handlers 10 100 500] [--zones 1] [--scale 10] [--duration 30]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from common import load_ariston
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PERIOD = 0.5
+
+
+def rss_bytes():
+    """Resident memory of the process, peak memory is returned where /proc is not available"""
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def percentile(values, fraction):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def timing_transport(module, requests_log):
+    """Transport of the module appending (end time, latency, ok) of each request to requests_log"""
+
+    class TimingTransport(module.AristonRequestsTransport):
+
+        def _timed(self, send, url, **kwargs):
+            start = time.perf_counter()
+            try:
+                resp = send(url, **kwargs)
+            except module.AristonTransportError:
+                end = time.perf_counter()
+                requests_log.append((end, end - start, False))
+                raise
+            end = time.perf_counter()
+            requests_log.append((end, end - start, resp.ok))
+            return resp
+
+        def post(self, url, timeout=None, json=None, verify=True):
+            return self._timed(super().post, url, timeout=timeout, json=json, verify=verify)
+
+        def get(self, url, timeout=None, verify=True):
+            return self._timed(super().get, url, timeout=timeout, verify=verify)
+
+    return TimingTransport()
+
+
+def scale_handler(handler, scale):
+    handler._TIME_SPLIT /= scale
+    handler._get_period_time /= scale
+    handler._set_period_time /= scale
+    handler._request_periods = {request: period / scale for request, period in handler._request_periods.items()}
+
+
+def run_fleet(url, count, scale, duration, timeout):
+    """Run fleet of handlers in this process and return its measurements"""
+    module = load_ariston()
+    requests_log = []
+    available_at = [None] * count
+    handlers = []
+    for index in range(count):
+        handler = module.AristonHandler(
+            f"fleet{count}_{index}@example.com", "password", sensors=list(module.AristonHandler._SENSOR_LIST),
+            logging_level="CRITICAL", transport=timing_transport(module, requests_log), url=url)
+        scale_handler(handler, scale)
+
+        def status_changed(changed_data, index=index, handler=handler):
+            if available_at[index] is None and handler.available:
+                available_at[index] = time.perf_counter()
+        handler.subscribe_statuses(status_changed)
+        handlers.append(handler)
+
+    base_threads = threading.active_count()
+    base_rss = rss_bytes()
+    start = time.perf_counter()
+    for handler in handlers:
+        handler.start()
+    deadline = start + timeout
+    while None in available_at and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    available = [moment - start for moment in available_at if moment is not None]
+    time.sleep(handlers[0]._get_period_time)
+
+    threads = []
+    rss = []
+    first = len(requests_log)
+    cpu_start = time.process_time()
+    window_start = time.perf_counter()
+    while time.perf_counter() - window_start < duration:
+        time.sleep(SAMPLE_PERIOD)
+        threads.append(threading.active_count())
+        rss.append(rss_bytes())
+    window = time.perf_counter() - window_start
+    cpu = time.process_time() - cpu_start
+    sent = requests_log[first:]
+    thread_names = {}
+    for thread in threading.enumerate():
+        name = thread.name.rstrip("0123456789_").split(" ")[0] or thread.name
+        thread_names[name] = thread_names.get(name, 0) + 1
+
+    for handler in handlers:
+        handler.stop()
+    latencies = [latency for _, latency, ok in sent if ok]
+    return {
+        "handlers": count,
+        "available": len(available),
+        "available_p50": percentile(available, 0.5),
+        "available_max": max(available) if available else float("nan"),
+        "base_threads": base_threads,
+        "threads": max(threads),
+        "thread_names": thread_names,
+        "base_rss": base_rss,
+        "rss": max(rss),
+        "cpu_per_poll": cpu / len(sent) if sent else float("nan"),
+        "rate": len(sent) / window,
+        "failed": len(sent) - len(latencies),
+        "latency_p50": percentile(latencies, 0.5),
+        "latency_p99": percentile(latencies, 0.99),
+    }
+
+
+def start_simulator(zones):
+    """Start simulator process and return it with its url"""
+    process = subprocess.Popen(
+        [sys.executable, "-u", os.path.join(BENCH_DIR, "simulator.py"), "--port", "0", "--zones", str(zones)],
+        stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Simulator listening on "):
+        process.kill()
+        raise Exception(f"Simulator did not start: {line!r}")
+    return process, line.split()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load of a fleet of handlers polling the local simulator")
+    parser.add_argument("--handlers", type=int, nargs="+", default=[10, 100, 500], help="fleet sizes")
+    parser.add_argument("--zones", type=int, default=1, help="zones of each plant")
+    parser.add_argument("--scale", type=float, default=10, help="divider of request periods")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of steady state measurement")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds to wait for handlers to be available")
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.url:
+        # Single fleet run in a child process
+        print(json.dumps(run_fleet(args.url, args.handlers[0], args.scale, args.duration, args.timeout)))
+        return
+
+    simulator, url = start_simulator(args.zones)
+    print(f"{args.zones} zone(s) per plant, periods divided by {args.scale:g}, {args.duration:g} s of steady state")
+    print(f"{'handlers':>8} {'available p50/max':>18} {'threads':>8} {'RSS MB':>7} {'CPU/poll':>9} "
+          f"{'req/s':>7} {'failed':>6} {'latency p50/p99':>16}")
+    try:
+        for count in args.handlers:
+            child = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--url", url, "--handlers", str(count),
+                 "--scale", str(args.scale), "--duration", str(args.duration), "--timeout", str(args.timeout)],
+                stdout=subprocess.PIPE, text=True, check=True)
+            result = json.loads(child.stdout.strip().splitlines()[-1])
+            not_available = result["handlers"] - result["available"]
+            print(f"{count:>8} "
+                  f"{result['available_p50']:>7.2f}s/{result['available_max']:>7.2f}s"
+                  f"{'!' if not_available else ' ':1} "
+                  f"{result['threads']:>8} "
+                  f"{result['rss'] / 2 ** 20:>7.1f} "
+                  f"{result['cpu_per_poll'] * 1000:>6.2f} ms "
+                  f"{result['rate']:>7.1f} "
+                  f"{result['failed']:>6} "
+                  f"{result['latency_p50'] * 1000:>6.1f}/{result['latency_p99'] * 1000:>6.1f} ms")
+            names = ", ".join(f"{name} {number}" for name, number in sorted(
+                result["thread_names"].items(), key=lambda item: -item[1]))
+            print(f"{'':>8} threads: {names}")
+            if not_available:
+                print(f"{'':>8} {not_available} handler(s) not available within {args.timeout:g} s")
+    finally:
+        simulator.terminate()
+        simulator.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Main request payload with and without cold items (heating and cooling flow settings).
+
+Reports size of main request and reply when cold items are included and when only hot items are fetched,
+average per main request for default periods, and checks that cold values are kept after a hot-only reply.
+
+Usage: python benchmarks/bench_hot_cold.py [zones]
+"""
+import json
+import sys
+
+from common import fake_response, load_ariston, main_payload, make_handler
+
+
+def sizes(handler, zones, cold):
+    request = handler._main_request(cold)
+    reply = fake_response(main_payload(zones, request["items"]))
+    return len(request["items"]), len(json.dumps(request)), len(reply.content), reply
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    module = load_ariston()
+    handler = make_handler(module, zones=zones)
+    handler_class = module.AristonHandler
+    cycles = handler_class._MAIN_COLD_PERIOD / handler_class._REQUEST_PERIODS["main"]
+
+    print(f"{zones} zone(s), all sensors configured, cold items every {cycles:.0f} main requests")
+    print(f"{'':>16} {'items':>6} {'request':>9} {'reply':>9}")
+    full = sizes(handler, zones, True)
+    hot = sizes(handler, zones, False)
+    for label, result in (("with cold items", full), ("hot items only", hot)):
+        print(f"{label:>16} {result[0]:>6} {result[1]:>7} B {result[2]:>7} B")
+    average = [(full[index] + hot[index] * (cycles - 1)) / cycles for index in range(3)]
+    print(f"{'average':>16} {average[0]:>6.1f} {average[1]:>7.0f} B {average[2]:>7.0f} B")
+
+    with handler._data_lock:
+        handler._store_data(hot[3], "main", partial=True)
+    flow = handler.get_sensor("ch_heating_flow_temp_zone1")
+    print(f"CH heating flow temperature after hot-only reply: {flow['value']} (min {flow['min']}, max {flow['max']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Cost of storing a response, publishing the snapshot and informing subscribers per request type.
+
+Usage: python benchmarks/bench_inform.py [zones] [path to other ariston.py revision]
+"""
+import sys
+
+from common import (
+    additional_payload,
+    energy_payload,
+    errors_payload,
+    fake_response,
+    last_month_payload,
+    load_ariston,
+    main_payload,
+    make_handler,
+    schedule_payload,
+    timeit,
+)
+
+
+def responses(zones):
+    return {
+        "main": fake_response(main_payload(zones)),
+        "additional_params": fake_response(additional_payload()),
+        "errors": fake_response(errors_payload()),
+        "ch_schedule": fake_response(schedule_payload("ChZn1")),
+        "dhw_schedule": fake_response(schedule_payload("Dhw")),
+        "last_month": fake_response(last_month_payload()),
+        "energy": fake_response(energy_payload()),
+    }
+
+
+def run(module, zones):
+    handler = make_handler(module, zones=zones)
+    handler.subscribe_sensors(lambda changed_data: None)
+    results = {}
+    for request, resp in responses(zones).items():
+
+        def store():
+            with handler._data_lock:
+                handler._store_data(resp, request)
+
+        results[request] = timeit(store)
+    return results
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[2])))
+    results = [(label, run(module, zones)) for label, module in revisions]
+    print(f"{zones} zone(s), time per response")
+    print(f"{'request':>18} " + " ".join(f"{label:>15}" for label, _ in results))
+    for request in results[0][1]:
+        print(f"{request:>18} " + " ".join(f"{result[request] * 1000:>12.3f} ms" for _, result in results))
+
+
+if __name__ == "__main__":
+    main()
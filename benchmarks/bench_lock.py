@@ -0,0 +1,82 @@
+"""
+Time from set_http_data until the set request reaches the server while a slow read is being received.
+
+The handler is started against the fake transport and runs its own periodic requests. Once all sensors have
+values, replies of main reads are delayed by the fake server, set_http_data is called while such a read is
+pending and the time until the fake server receives the DHW temperature request is measured.
+The time must not depend on the delay. Coalescing window of set_http_data is disabled, it is measured
+by bench_debounce.
+
+Usage: python benchmarks/bench_lock.py [delay seconds] [path to other ariston.py revision]
+"""
+import sys
+import threading
+import time
+
+from common import fake_transport, load_ariston, main_payload
+
+PERIOD = 1.0
+
+
+def run(module, delay):
+    handler = module.AristonHandler(
+        "user", "password", sensors=list(module.AristonHandler._SENSOR_LIST), logging_level="ERROR")
+    transport = fake_transport(zones=1, module=module)
+    handler._session = transport
+    handler._get_period_time = PERIOD
+    if hasattr(handler, "_request_periods"):
+        handler._request_periods = {request: PERIOD for request in handler._request_periods}
+    handler._SET_COALESCE_WINDOW = 0
+    slow = threading.Event()
+    read_started = threading.Event()
+    posted = []
+
+    def slow_main(method, url, json_data):
+        if slow.is_set():
+            read_started.set()
+            time.sleep(delay)
+        return main_payload(1, json_data["items"])
+
+    def record_set(method, url, json_data):
+        if "/dhwTemp" in url:
+            posted.append(time.perf_counter())
+        return {}
+
+    transport.script("data_items", slow_main)
+    transport.script("set", record_set)
+    handler.start()
+    deadline = time.monotonic() + 10
+    while (handler.sensor_values["dhw_set_temperature"]["value"] is None or not handler.available) \
+            and time.monotonic() < deadline:
+        time.sleep(0.01)
+    slow.set()
+    if not read_started.wait(PERIOD * 10):
+        raise Exception("No main read was sent by the running handler")
+    # Let the read be in flight for a while before setting
+    time.sleep(min(delay / 4, 0.2))
+    start = time.perf_counter()
+    handler.set_http_data(dhw_set_temperature=55)
+    deadline = time.monotonic() + delay * 3 + 5
+    while not posted and time.monotonic() < deadline:
+        time.sleep(0.001)
+    slow.clear()
+    handler.stop()
+    return posted[0] - start if posted else None
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    print(f"main reply delayed by {delay} s")
+    revisions = [("current", None)]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", sys.argv[2]))
+    for label, path in revisions:
+        latency = run(load_ariston(path), delay)
+        if latency is None:
+            print(f"{label:>16}: set request was not sent")
+        else:
+            print(f"{label:>16}: set request sent {latency * 1000:10.3f} ms after set_http_data")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Size of main dataItems request and reply depending on configured sensors.
+
+Usage: python benchmarks/bench_main_items.py [zones] [path to other ariston.py revision]
+"""
+import json
+import sys
+
+from common import fake_response, load_ariston, main_payload, make_handler, timeit
+
+CONFIGURATIONS = {
+    "climate+water heater": [],
+    "typical": ["outside_temperature", "ch_pilot", "heat_pump", "errors_count", "signal_strength"],
+    "all sensors": None,
+}
+
+
+def run(module, zones, sensors):
+    handler = make_handler(module, zones=zones, sensors=sensors, populate=False)
+    transport = handler._session
+    handler._started = True
+    handler._control_availability_state("main")
+    # Main request is the last data request sent to the fake transport
+    request = [
+        json_data for _, url, json_data in transport.requests if transport.endpoint(url) == "data_items"][-1]
+    resp = fake_response(main_payload(zones, request["items"]))
+
+    def store_main():
+        with handler._data_lock:
+            handler._store_data(resp, "main")
+
+    return len(request["items"]), len(json.dumps(request)), len(resp.content), timeit(store_main)
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[2])))
+    print(f"{zones} zone(s)")
+    print(f"{'configuration':>22} {'':>15} {'items':>6} {'request':>9} {'reply':>9} {'store':>10}")
+    for name, sensors in CONFIGURATIONS.items():
+        for label, module in revisions:
+            items, request_size, reply_size, elapsed = run(module, zones, sensors)
+            print(f"{name:>22} {label:>15} {items:>6} {request_size:>7} B {reply_size:>7} B {elapsed * 1000:>7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Memory and allocations of the sensor table per handler.
+
+Compares dictionary per sensor with deep copied options lists (previous layout)
+with SensorRecord objects and interned options.
+
+Usage: python benchmarks/bench_memory.py
+"""
+import copy
+import tracemalloc
+
+from common import load_ariston, make_handler
+
+
+def legacy_table(handler):
+    """Sensor table in the previous layout: 8 key dictionary per sensor with own options lists"""
+    table = dict()
+    for sensor, record in handler._ariston_sensors.items():
+        table[sensor] = {
+            "value": record.value,
+            "units": record.units,
+            "min": record.min,
+            "max": record.max,
+            "step": record.step,
+            "options": copy.deepcopy(list(record.options)) if record.options is not None else None,
+            "options_text": copy.deepcopy(list(record.options_text)) if record.options_text is not None else None,
+            "attributes": dict(record.attributes),
+        }
+    return table
+
+
+def record_table(module, handler):
+    """Sensor table in the current layout"""
+    table = dict()
+    for sensor, record in handler._ariston_sensors.items():
+        new_record = module.SensorRecord()
+        new_record.value = record.value
+        new_record.units = record.units
+        new_record.min = record.min
+        new_record.max = record.max
+        new_record.step = record.step
+        new_record.options = handler._intern_options(record.options)
+        new_record.options_text = handler._intern_options(record.options_text)
+        new_record.attributes = record.attributes
+        table[sensor] = new_record
+    return table
+
+
+def legacy_reset(handler):
+    table = dict()
+    for sensor in handler._ariston_sensors:
+        table[sensor] = dict()
+        for key in ("value", "units", "min", "max", "step", "options", "options_text"):
+            table[sensor][key] = None
+        table[sensor]["attributes"] = {}
+    return table
+
+
+def record_reset(handler):
+    for sensor in handler._ariston_sensors:
+        handler._reset_sensor(sensor)
+
+
+def measure(func, *args):
+    """Return (retained bytes, number of allocated blocks) of a call"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func(*args)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del result
+    return size, blocks
+
+
+def main():
+    module = load_ariston()
+    print(f"{'zones':>5} {'sensors':>8} {'layout':>14} {'table bytes':>12} {'blocks':>8} {'reset blocks':>13}")
+    for zones in (1, 6):
+        handler = make_handler(module, zones=zones)
+        sensors = len(handler._ariston_sensors)
+        for name, build, reset in (
+            ("dict", legacy_table, legacy_reset),
+            ("SensorRecord", lambda h: record_table(module, h), record_reset),
+        ):
+            size, blocks = measure(build, handler)
+            _, reset_blocks = measure(reset, handler)
+            print(f"{zones:>5} {sensors:>8} {name:>14} {size:>12} {blocks:>8} {reset_blocks:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Delivery of sensor change notifications during a burst of updates.
+
+Reports peak number of threads, number of callback calls and deliveries received
+out of order for a number of subscribers.
+
+Usage: python benchmarks/bench_notify.py [updates] [subscribers] [path to other ariston.py revision]
+"""
+import sys
+import threading
+import time
+
+from common import load_ariston, make_handler, set_sensor_value
+
+SENSOR = "outside_temperature"
+
+
+def run(module, updates, subscribers):
+    handler = make_handler(module, zones=1)
+    lock = threading.Lock()
+    stats = {"calls": 0, "out_of_order": 0, "peak_threads": threading.active_count()}
+    last_seen = [None] * subscribers
+
+    def callback(changed_data, index):
+        with lock:
+            stats["calls"] += 1
+            stats["peak_threads"] = max(stats["peak_threads"], threading.active_count())
+            if SENSOR in changed_data:
+                value = changed_data[SENSOR]["value"]
+                if last_seen[index] is not None and value < last_seen[index]:
+                    stats["out_of_order"] += 1
+                last_seen[index] = value
+
+    for index in range(subscribers):
+        handler.subscribe_sensors(callback, index)
+
+    start = time.perf_counter()
+    for value in range(updates):
+        set_sensor_value(handler, SENSOR, value)
+        handler._publish_sensors()
+        handler._subscribers_sensors_inform()
+        with lock:
+            stats["peak_threads"] = max(stats["peak_threads"], threading.active_count())
+    while any(seen != updates - 1 for seen in last_seen):
+        time.sleep(0.01)
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    subscribers = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"{updates} updates, {subscribers} subscribers")
+    print(f"{'':>16} {'peak threads':>13} {'calls':>7} {'out of order':>13} {'until delivered':>16}")
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 3:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[3])))
+    for label, module in revisions:
+        stats = run(module, updates, subscribers)
+        print(f"{label:>16} {stats['peak_threads']:>13} {stats['calls']:>7} {stats['out_of_order']:>13} "
+              f"{stats['elapsed'] * 1000:>13.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Cost of storing each reply type, including JSON decoding and validation.
+
+Usage: python benchmarks/bench_parse.py [zones] [path to other ariston.py revision]
+"""
+import json
+import sys
+
+from common import (
+    additional_payload,
+    energy_payload,
+    errors_payload,
+    fake_response,
+    last_month_payload,
+    load_ariston,
+    main_payload,
+    make_handler,
+    schedule_payload,
+    timeit,
+)
+
+
+def replies(zones):
+    return {
+        "main": fake_response(main_payload(zones)),
+        "additional_params": fake_response(additional_payload()),
+        "errors": fake_response(errors_payload(5)),
+        "ch_schedule": fake_response(schedule_payload("ChZn1")),
+        "dhw_schedule": fake_response(schedule_payload("Dhw")),
+        "last_month": fake_response(last_month_payload()),
+        "energy": fake_response(energy_payload()),
+    }
+
+
+def run(module, zones, label):
+    handler = make_handler(module, zones=zones)
+    results = {}
+    for request_type, reply in replies(zones).items():
+        results[request_type] = timeit(lambda: handler._store_data(reply, request_type))
+    print(f"{label:>18} " + " ".join(f"{value * 1000:>10.3f}" for value in results.values()))
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print(f"{zones} zone(s), ms per reply")
+    print(f"{'':>18} " + " ".join(f"{name[:10]:>10}" for name in replies(zones)))
+    if len(sys.argv) > 2:
+        run(load_ariston(sys.argv[2]), zones, "other revision")
+    module = load_ariston()
+    if hasattr(module, "set_json_decoder"):
+        module.set_json_decoder(json.loads)
+        run(module, zones, "json")
+        module.set_json_decoder()
+        if module.orjson is not None:
+            run(module, zones, "orjson")
+    else:
+        run(module, zones, "current")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Refresh intervals of each request type over one simulated day.
+
+Polling slots are simulated with a fake clock, no requests are sent.
+Reports how many times each request type was chosen and the longest interval between them
+after the first hour.
+
+Usage: python benchmarks/bench_polling.py [path to other ariston.py revision]
+"""
+import sys
+
+from common import ALL_REQUESTS, load_ariston, make_handler
+
+SLOT = 30
+DAY = 24 * 3600
+# Start up is excluded from the longest intervals
+WARM_UP = 3600
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class RecordingScheduler:
+    """Scheduler replacement recording requests instead of running them"""
+
+    def __init__(self, module, handler):
+        self.module = module
+        self.handler = handler
+        self.requests = []
+
+    def schedule(self, delay, func, args=()):
+        if func == self.handler._control_availability_state:
+            self.requests.append(args[0])
+        return self.module.AristonJob(func, args)
+
+
+def run(module):
+    handler = make_handler(module, zones=1)
+    clock = FakeClock()
+    module.time = clock
+    scheduler = RecordingScheduler(module, handler)
+    handler._scheduler = scheduler
+    handler._started = True
+    last_sent = dict()
+    longest = {request: 0 for request in ALL_REQUESTS}
+    counts = {request: 0 for request in ALL_REQUESTS}
+    start = clock.now
+    for slot in range(DAY // SLOT):
+        clock.now = start + slot * SLOT
+        sent_before = len(scheduler.requests)
+        handler._queue_get_data()
+        for request in scheduler.requests[sent_before:]:
+            counts[request] += 1
+            if request in last_sent and slot * SLOT > WARM_UP:
+                longest[request] = max(longest[request], clock.now - last_sent[request])
+            last_sent[request] = clock.now
+    handler._started = False
+    return counts, longest
+
+
+def main():
+    revisions = [("current", None)]
+    if len(sys.argv) > 1:
+        revisions.insert(0, ("other revision", sys.argv[1]))
+    print(f"one day of {SLOT} s slots, all sensors enabled; requests per day / longest interval in seconds")
+    print(f"{'':>16} " + " ".join(f"{request[:12]:>17}" for request in ALL_REQUESTS))
+    for label, path in revisions:
+        counts, longest = run(load_ariston(path))
+        print(f"{label:>16} " + " ".join(f"{counts[request]:>8}/{longest[request]:>8.0f}" for request in ALL_REQUESTS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Decoding of replies from capture file, to reproduce slow or failing decoding of real replies offline.
+
+Capture file is written by AristonHandler with 'capture_file' argument (see AristonCapture).
+Every captured reply of a request type is stored by _store_data of a handler with all sensors,
+time of each reply is measured, exceptions and warnings of decoding are reported with line of the capture file.
+
+Usage: python benchmarks/bench_replay.py <capture file> [number of slowest replies to list]
+"""
+import json
+import logging
+import sys
+import time
+import traceback
+
+from bench_suite import URL_REQUESTS
+from common import load_ariston
+
+
+class WarningCollector(logging.Handler):
+    """Collects messages of warnings logged by the handler"""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def request_type(url):
+    for part, request in URL_REQUESTS:
+        if part in url:
+            return request
+    return None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    path = sys.argv[1]
+    slowest = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    module = load_ariston()
+    handler = module.AristonHandler(
+        "user", "password", sensors=list(module.AristonHandler._SENSOR_LIST), logging_level="CRITICAL")
+    replay = module.AristonReplayTransport(path)
+    # Console handler of the handler keeps CRITICAL level, warnings go only to the collector
+    collector = WarningCollector()
+    handler._LOGGER.addHandler(collector)
+    handler._LOGGER.setLevel(logging.WARNING)
+
+    times = []
+    failures = []
+    with open(path, encoding="utf-8") as file:
+        lines = [(number, json.loads(line)) for number, line in enumerate(file, 1) if line.strip()]
+    for number, record in lines:
+        request = request_type(record["url"])
+        if request is None or record["status"] != 200:
+            continue
+        if record["method"] == "POST":
+            resp = replay.post(record["url"])
+        else:
+            resp = replay.get(record["url"])
+        if request == "features":
+            # Plant ID is part of url of features request
+            plant_id = record["url"].split("/plants/")[1].split("/")[0]
+            handler._store_login(plant_id, handler._parse_json(resp))
+            continue
+        if not handler.plant_id:
+            continue
+        collector.messages.clear()
+        start = time.perf_counter()
+        try:
+            with handler._data_lock:
+                handler._store_data(resp, request)
+        except Exception:
+            failures.append((number, request, traceback.format_exc(limit=-3)))
+        else:
+            if collector.messages:
+                failures.append((number, request, "\n".join(collector.messages)))
+        times.append((time.perf_counter() - start, number, request, len(resp.content)))
+
+    if not handler.plant_id:
+        print("No features reply in capture file, replies cannot be decoded without it")
+        sys.exit(1)
+    print(f"{len(times)} replies of plant {handler.plant_id} decoded")
+    print(f"{'request':>18} {'replies':>8} {'mean':>10} {'max':>10} {'failed':>7}")
+    for _, request in URL_REQUESTS:
+        elapsed = [item[0] for item in times if item[2] == request]
+        if elapsed:
+            failed = sum(1 for failure in failures if failure[1] == request)
+            print(f"{request:>18} {len(elapsed):>8} {sum(elapsed) / len(elapsed) * 1e6:>7.0f} us "
+                  f"{max(elapsed) * 1e6:>7.0f} us {failed:>7}")
+    print("Slowest replies:")
+    for elapsed, number, request, size in sorted(times, reverse=True)[:slowest]:
+        print(f"    line {number:>6} {request:>18} {size:>8} B {elapsed * 1e6:>8.0f} us")
+    for number, request, trace in failures:
+        print(f"Decoding of {request} reply at line {number} failed:\n{trace}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
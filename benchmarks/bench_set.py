@@ -0,0 +1,81 @@
+"""
+End-to-end latency of setting several parameters at once.
+
+Fake server answers each POST after a delay. Set cycles are run back to back until
+every changed parameter was sent, a parameter is treated as confirmed by the server
+once it was sent. End-to-end latency includes the waiting period between set cycles
+of the running handler.
+
+Usage: python benchmarks/bench_set.py [zones] [post delay seconds] [path to other ariston.py revision]
+"""
+import sys
+import time
+
+from common import fake_transport, load_ariston, make_handler, sent_posts
+
+
+def parameters(zones):
+    values = {
+        "mode": "Summer",
+        "dhw_set_temperature": 52,
+        "dhw_mode": "Time program",
+        "internet_time": "OFF",
+    }
+    for zone in range(1, zones + 1):
+        values[f"ch_set_temperature_zone{zone}"] = 22
+        values[f"ch_economy_temperature_zone{zone}"] = 16
+    return values
+
+
+def endpoint(parameter):
+    """Part of the URL used to set the parameter"""
+    if parameter.startswith("ch_"):
+        return f"/zones/GW1/{parameter[-1]}/temperatures"
+    return {
+        "mode": "/plantData/GW1/mode",
+        "dhw_set_temperature": "/plantData/GW1/dhwTemp",
+        "dhw_mode": "/plantData/GW1/dhwMode",
+        "internet_time": "/PlantMenu/Submit/GW1",
+    }[parameter]
+
+
+def run(module, zones, delay):
+    handler = make_handler(module, zones=zones)
+    handler._session = fake_transport(zones=zones, latency=delay, module=module)
+    # Coalescing window of set_http_data bursts is measured by bench_debounce
+    handler._SET_COALESCE_WINDOW = 0
+    handler.set_http_data(**parameters(zones))
+    handler._timer_set_delay.cancel()
+    posts = 0
+    cycles = 0
+    start = time.perf_counter()
+    while handler._set_param and cycles < 20:
+        handler._preparing_setting_http_data()
+        cycles += 1
+        # Server confirms parameters sent within the cycle before the next one
+        sent = [url for url, _ in sent_posts(handler._session)]
+        for parameter in list(handler._set_param):
+            if any(endpoint(parameter) in url for url in sent):
+                del handler._set_param[parameter]
+        handler._session.requests.clear()
+        posts += len(sent)
+    elapsed = time.perf_counter() - start
+    period = handler._set_period_time
+    return cycles, elapsed, elapsed + (cycles - 1) * period, posts
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    print(f"{zones} zone(s), {len(parameters(zones))} parameters, {delay} s per POST")
+    print(f"{'':>16} {'cycles':>7} {'posts':>6} {'sending':>10} {'end-to-end':>11}")
+    revisions = [("current", None)]
+    if len(sys.argv) > 3:
+        revisions.insert(0, ("other revision", sys.argv[3]))
+    for label, path in revisions:
+        cycles, elapsed, total, posts = run(load_ariston(path), zones, delay)
+        print(f"{label:>16} {cycles:>7} {posts:>6} {elapsed:>8.2f} s {total:>9.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Time from start() until all sensors have values, against the fake server.
+
+Usage: python benchmarks/bench_startup.py [get period seconds] [reply delay seconds] [path to other ariston.py revision]
+"""
+import sys
+import time
+
+from common import fake_transport, load_ariston, make_handler
+
+
+def run(module, period, delay, expected):
+    handler = module.AristonHandler("user", "password", sensors=list(module.AristonHandler._SENSOR_LIST), logging_level="ERROR")
+    handler._session = fake_transport(zones=1, latency=delay, module=module)
+    handler._get_period_time = period
+    start = time.perf_counter()
+    handler.start()
+    missing = set(expected)
+    while missing and time.perf_counter() - start < period * 20:
+        time.sleep(0.01)
+        missing = {sensor for sensor in missing if handler.get_value(sensor) is None}
+    elapsed = time.perf_counter() - start
+    handler._started = False
+    handler._timer_periodic_read.cancel()
+    handler._timer_queue_delay.cancel()
+    return elapsed, len(missing)
+
+
+def main():
+    period = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    populated = make_handler(load_ariston(), zones=1)
+    expected = [sensor for sensor in populated.sensor_values if populated.get_value(sensor) is not None]
+    print(f"{len(expected)} sensors with values, {period} s get period, {delay} s per reply")
+    revisions = [("current", None)]
+    if len(sys.argv) > 3:
+        revisions.insert(0, ("other revision", sys.argv[3]))
+    for label, path in revisions:
+        elapsed, missing = run(load_ariston(path), period, delay, expected)
+        print(f"{label:>16}: all sensors populated in {elapsed:8.2f} s ({missing} still missing)")
+
+
+if __name__ == "__main__":
+    main()
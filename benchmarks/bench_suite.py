@@ -0,0 +1,330 @@
+"""
+Benchmark suite of AristonHandler hot paths with recorded replies, results are compared to stored baseline.
+
+Cases, each run at 1, 3 and 6 zones:
+    store.<request>        _store_data of recorded reply of the request type
+    energy.k<key>          _get_energy_data of the energy key
+    schedule_attributes    _schedule_attributes of CH time program
+    sensor_values          value of each sensor read from published snapshot
+    inform                 publishing and _subscribers_sensors_inform of 10 changed sensors to per-sensor subscribers
+    set_http_data          validation of 4 values being set
+    update.<platform>      update and state calculation of all entities of the platform, as done when
+                           Home Assistant writes their state; run only if Home Assistant is installed
+    reads.<platform>       without Home Assistant: hand-written list of (sensor, key) reads approximating
+                           an update of the entities, it is not kept in sync with entity code automatically
+
+Replies are recorded from the local simulator into fixtures/replies_<zones>z.json by --record, or from
+capture file of a real plant (see AristonCapture) with --record --capture <file> --zones <zones of the plant>.
+Cases slower than baseline.json by more than --threshold are reported as regressions and make exit code 1.
+Times are compared relative to a fixed reference workload measured at start of each run, so that changes
+of machine speed between runs are compensated. Baseline still depends on the machine, it is stored by --save.
+Each case is measured 3 times and the median is stored and compared. On shared single CPU machines medians
+of identical code still differ up to about 1.4x between runs, hence the default threshold of 2.
+
+Usage: python benchmarks/bench_suite.py [--record [--capture file]] [--save] [--threshold 2] [--zones 1 3 6] [--filter text]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from common import (
+    ALL_REQUESTS,
+    SyncDispatcher,
+    load_ariston,
+    platform_entities,
+    platform_reads,
+    set_sensor_value,
+    timeit,
+    update_entity,
+)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+ZONES = [1, 3, 6]
+ENERGY_KEYS = [7, 10, 1, 2, 20, 21]
+# Measurements of each case, their median is stored and compared
+MEASUREMENTS = 3
+# Date used by energy cases so that results do not depend on the day of running
+ENERGY_DATE = dict(this_year=2024, this_month=3, this_day=15, this_day_week=4, this_2hour=16)
+SET_VALUES = [
+    {"mode": "Summer", "dhw_set_temperature": 52, "ch_set_temperature_zone1": 22, "internet_time": "OFF"},
+    {"mode": "Winter", "dhw_set_temperature": 53, "ch_set_temperature_zone1": 21.5, "internet_time": "ON"},
+]
+# Parts of url identifying request types of recorded replies
+URL_REQUESTS = (
+    ("/dataItems/", "main"),
+    ("/PlantMenu/Refresh", "additional_params"),
+    ("/busErrors", "errors"),
+    ("/ChZn1", "ch_schedule"),
+    ("/Dhw?", "dhw_schedule"),
+    ("/energyAccount", "last_month"),
+    ("/consSequencesApi8", "energy"),
+    ("/features", "features"),
+)
+
+
+def fixture_path(zones):
+    return os.path.join(FIXTURES_DIR, f"replies_{zones}z.json")
+
+
+class RecordingTransport:
+    """Transport keeping the last successful reply of each request type"""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.replies = {}
+
+    def _record(self, url, resp):
+        for part, request in URL_REQUESTS:
+            if part in url and resp.ok:
+                self.replies[request] = json.loads(resp.content)
+                break
+        return resp
+
+    def post(self, url, timeout=None, json=None, verify=True):
+        return self._record(url, self.transport.post(url, timeout=timeout, json=json, verify=verify))
+
+    def get(self, url, timeout=None, verify=True):
+        return self._record(url, self.transport.get(url, timeout=timeout, verify=verify))
+
+    def close(self):
+        self.transport.close()
+
+
+def record(module, zones, capture=None):
+    """Record replies of all request types from the simulator or from replay of capture file"""
+    from simulator import AristonSimulator
+
+    if capture:
+        simulator = None
+        transport = RecordingTransport(module.AristonReplayTransport(capture, loop=True))
+        url = module.AristonHandler._ARISTON_URL
+    else:
+        simulator = AristonSimulator(zones=zones, bus_errors=2).start()
+        transport = RecordingTransport(module.AristonRequestsTransport())
+        url = simulator.url
+    handler = module.AristonHandler(
+        "bench@example.com", "password", sensors=list(module.AristonHandler._SENSOR_LIST),
+        logging_level="ERROR", url=url)
+    handler._session = transport
+    handler._started = True
+    for request in ALL_REQUESTS:
+        handler._control_availability_state(request)
+    handler._started = False
+    handler.stop()
+    if simulator is not None:
+        simulator.stop()
+    missing = [request for request in ALL_REQUESTS if request not in transport.replies]
+    if missing:
+        raise Exception(f"Replies of {missing} were not recorded")
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(fixture_path(zones), "w") as file:
+        json.dump({"plant_id": handler.plant_id or "SIM000001", **transport.replies}, file, indent=1)
+
+
+def response(module, data):
+    return module.AristonResponse(200, json.dumps(data).encode())
+
+
+def fixture_handler(module, zones):
+    """Handler with all sensors populated from recorded replies"""
+    with open(fixture_path(zones)) as file:
+        replies = json.load(file)
+    handler = module.AristonHandler(
+        "user", "password", sensors=list(module.AristonHandler._SENSOR_LIST), logging_level="ERROR")
+    handler._store_login(replies["plant_id"], replies["features"])
+    for request in ALL_REQUESTS:
+        with handler._data_lock:
+            handler._store_data(response(module, replies[request]), request)
+    handler._publish_sensors()
+    return handler, replies
+
+
+def measure(func, target=0.05):
+    """
+    Best time in seconds of a single call, calls are batched to last at least target seconds.
+    Garbage collection is disabled while timing to reduce noise.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= target or number >= 100000:
+            break
+        number *= 4
+    gc.collect()
+    gc.disable()
+    try:
+        return timeit(func, repeat=7, number=number)
+    finally:
+        gc.enable()
+
+
+def reference():
+    """Fixed pure Python work measured to compensate changes of machine speed"""
+    total = 0
+    table = {f"sensor_{index}": {"value": index, "units": "°C"} for index in range(200)}
+    for name, record in table.items():
+        if name.endswith("7"):
+            total += record["value"]
+    return total
+
+
+def cases(module, zones):
+    """Dictionary of case name to function to be timed"""
+    handler, replies = fixture_handler(module, zones)
+    result = {}
+
+    for request in ALL_REQUESTS:
+        resp = response(module, replies[request])
+
+        def store(request=request, resp=resp):
+            with handler._data_lock:
+                handler._store_data(resp, request)
+        result[f"store.{request}"] = store
+
+    for key in ENERGY_KEYS:
+        result[f"energy.k{key}"] = lambda key=key: handler._get_energy_data(key, **ENERGY_DATE)
+
+    plans = replies["ch_schedule"]["ChZn1"]["plans"]
+    result["schedule_attributes"] = lambda: handler._schedule_attributes(plans)
+
+    def sensor_values():
+        snapshot = handler.sensor_values
+        for sensor in snapshot:
+            snapshot[sensor]["value"]
+    result["sensor_values"] = sensor_values
+
+    sensors = [sensor for sensor in handler.sensor_values if handler.get_value(sensor) is not None]
+    inform_handler, _ = fixture_handler(module, zones)
+    inform_handler._dispatcher = SyncDispatcher()
+    for sensor in sensors:
+        inform_handler.subscribe_sensors(lambda changed_data: None, sensors=[sensor])
+    changed = [sensor for sensor in sensors if isinstance(handler.get_value(sensor), (int, float))][:10]
+    counter = [0]
+
+    def inform():
+        counter[0] += 1
+        for sensor in changed:
+            set_sensor_value(inform_handler, sensor, counter[0])
+        inform_handler._publish_sensors()
+        inform_handler._subscribers_sensors_inform()
+    result["inform"] = inform
+
+    set_handler, _ = fixture_handler(module, zones)
+    step = [0]
+
+    def set_http_data():
+        step[0] += 1
+        set_handler.set_http_data(**SET_VALUES[step[0] % 2])
+        set_handler._set_param.clear()
+    result["set_http_data"] = set_http_data
+
+    entities = platform_entities(handler, zones)
+    if entities is not None:
+        for name, entity_list in entities.items():
+            def update(entity_list=entity_list):
+                for entity in entity_list:
+                    update_entity(entity)
+            result[f"update.{name}"] = update
+        return result
+
+    settable = [sensor for sensor in handler.supported_sensors_set if handler.get_value(sensor) is not None]
+    switches = [sensor for sensor in settable if list(handler.get_sensor(sensor)["options_text"] or ()) == ["OFF", "ON"]]
+    selects = [
+        sensor for sensor in settable
+        if sensor not in switches and handler.get_sensor(sensor)["options_text"] is not None]
+    binary_sensors = [
+        sensor for sensor in sensors if sensor not in settable and handler.get_value(sensor) in ("ON", "OFF")]
+    reads = platform_reads(zones, sensors, switches, selects, binary_sensors)
+    for name in ("climate", "water_heater", "sensor", "binary_sensor", "switch", "select"):
+        def read_sensors(platform_reads=reads[name]):
+            for sensor, key in platform_reads:
+                if key == "value":
+                    handler.get_value(sensor)
+                else:
+                    handler.get_sensor(sensor)[key]
+        result[f"reads.{name}"] = read_sensors
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite of AristonHandler hot paths")
+    parser.add_argument("--record", action="store_true", help="record fixtures from the simulator")
+    parser.add_argument("--capture", help="capture file to record fixtures from instead of the simulator")
+    parser.add_argument("--save", action="store_true", help="store results as baseline")
+    parser.add_argument("--threshold", type=float, default=2.0, help="ratio to baseline reported as regression")
+    parser.add_argument("--zones", type=int, nargs="+", default=ZONES)
+    parser.add_argument("--filter", default="", help="run only cases containing the text")
+    args = parser.parse_args()
+    if args.capture and len(args.zones) != 1:
+        parser.error("--capture records fixtures of a single plant, --zones of the plant is expected")
+    module = load_ariston()
+
+    if args.record:
+        for zones in args.zones:
+            record(module, zones, args.capture)
+            print(f"Recorded {fixture_path(zones)}")
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)
+    base_results = baseline.get("results", {})
+
+    results = {}
+    regressions = []
+    zone_cases = {zones: cases(module, zones) for zones in args.zones}
+    if not any(name.startswith("update.") for name in zone_cases[args.zones[0]]):
+        print("Home Assistant is not installed, updates of entities are approximated by reads.<platform> cases")
+    print(f"{'case':<24}" + "".join(f"{f'{zones} zone(s)':>24}" for zones in args.zones))
+    unit = min(measure(reference) for _ in range(5))
+    for name in zone_cases[args.zones[0]]:
+        if args.filter not in name:
+            continue
+        line = f"{name:<24}"
+        for zones in args.zones:
+            # Median of measurements, both baseline and compared results are not set by a single unusual batch
+            relative = statistics.median(measure(zone_cases[zones][name]) / unit for _ in range(MEASUREMENTS))
+            elapsed = relative * unit
+            results.setdefault(str(zones), {})[name] = relative
+            base = base_results.get(str(zones), {}).get(name)
+            if base:
+                ratio = relative / base
+                mark = "!" if ratio > args.threshold else " "
+                if ratio > args.threshold:
+                    regressions.append((name, zones, ratio))
+                line += f"{elapsed * 1e6:>12.1f} us {ratio:>6.2f}x{mark}"
+            else:
+                line += f"{elapsed * 1e6:>12.1f} us {'':>8}"
+        print(line)
+
+    if args.save:
+        for zones, zone_results in results.items():
+            base_results.setdefault(zones, {}).update(zone_results)
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "units": "time of a call divided by time of the reference workload",
+            "results": base_results,
+        }
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(baseline, file, indent=1, sort_keys=True)
+        print(f"Baseline stored to {BASELINE_PATH}")
+    elif regressions:
+        print(f"Regressions slower than {args.threshold}x baseline:")
+        for name, zones, ratio in regressions:
+            print(f"    {name} at {zones} zone(s): {ratio:.2f}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Threads started by a running handler.
+
+The handler is started against the fake transport with a shortened request period,
+so many polling cycles and several set requests happen within a few seconds.
+
+Usage: python benchmarks/bench_threads.py [seconds] [path to other ariston.py revision]
+"""
+import sys
+import threading
+import time
+
+from common import fake_transport, load_ariston
+
+PERIOD = 0.05
+
+started_threads = 0
+original_start = threading.Thread.start
+
+
+def counting_start(thread):
+    global started_threads
+    started_threads += 1
+    original_start(thread)
+
+
+def run(module, seconds):
+    global started_threads
+    handler = module.AristonHandler("user", "password", sensors=list(module.AristonHandler._SENSOR_LIST), logging_level="ERROR")
+    handler._session = fake_transport(zones=1, module=module)
+    handler._get_period_time = PERIOD
+    handler._set_period_time = PERIOD
+    started_threads = 0
+    peak = threading.active_count()
+    handler.start()
+    end = time.monotonic() + seconds
+    temperature = 40
+    while time.monotonic() < end:
+        time.sleep(PERIOD / 2)
+        peak = max(peak, threading.active_count())
+        if handler.available:
+            temperature = 41 if temperature == 40 else 40
+            try:
+                handler.set_http_data(dhw_set_temperature=temperature)
+            except Exception:
+                pass
+    handler._started = False
+    handler._timer_periodic_read.cancel()
+    handler._timer_queue_delay.cancel()
+    handler._timer_set_delay.cancel()
+    return started_threads, peak
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    threading.Thread.start = counting_start
+    print(f"{seconds} s with {PERIOD} s request period")
+    print(f"{'':>16} {'threads started':>16} {'peak threads':>13}")
+    revisions = [("current", None)]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", sys.argv[2]))
+    for label, path in revisions:
+        started, peak = run(load_ariston(path), seconds)
+        print(f"{label:>16} {started:>16} {peak:>13}")
+        time.sleep(PERIOD * 4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Time from set_http_data until the server value confirms the set parameter.
+
+Fake server applies DHW temperature when it is set. Periods of the handler are scaled down
+by SCALE to run quickly, reported times are scaled back to real seconds.
+
+Usage: python benchmarks/bench_verify.py [trials] [path to other ariston.py revision]
+"""
+import random
+import sys
+import time
+
+from common import ZONE_0_ITEMS, load_ariston, make_handler
+
+SCALE = 20
+
+
+def apply_set(method, url, json_data):
+    """Fake server applies DHW temperature being set"""
+    if "/dhwTemp" in url:
+        ZONE_0_ITEMS["DhwTemp"]["value"] = json_data["new"]
+    return {}
+
+
+def scaled_handler(module):
+    handler = make_handler(module, zones=1)
+    handler._session.script("set", apply_set)
+    handler._TIME_SPLIT /= SCALE
+    handler._get_period_time /= SCALE
+    handler._set_period_time /= SCALE
+    handler._request_periods = {request: period / SCALE for request, period in handler._request_periods.items()}
+    if hasattr(handler, "_SET_COALESCE_WINDOW"):
+        handler._SET_COALESCE_WINDOW /= SCALE
+    if hasattr(handler, "_VERIFY_DELAYS"):
+        handler._VERIFY_DELAYS = tuple(delay / SCALE for delay in handler._VERIFY_DELAYS)
+    return handler
+
+
+def run(module, trials, seed=1):
+    rnd = random.Random(seed)
+    ZONE_0_ITEMS["DhwTemp"]["value"] = 50.0
+    handler = scaled_handler(module)
+    handler.start()
+    time.sleep(0.5)
+    results = []
+    for trial in range(trials):
+        # Set at random phase of periodic requests
+        time.sleep(rnd.uniform(0, 60 / SCALE))
+        value = 51 + trial % 10
+        start = time.perf_counter()
+        handler.set_http_data(dhw_set_temperature=value)
+        while handler._set_param:
+            time.sleep(0.005)
+        results.append((time.perf_counter() - start) * SCALE)
+    handler.stop()
+    return results
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[2])))
+    print(f"{trials} sets of DHW temperature, time until confirmed in real seconds")
+    print(f"{'':>16} {'mean':>7} {'min':>7} {'max':>7}")
+    for label, module in revisions:
+        results = run(module, trials)
+        print(f"{label:>16} {sum(results) / len(results):>6.1f}s {min(results):>6.1f}s {max(results):>6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Size of sensor tables and per-response cost depending on zones of the plant.
+
+Reports number of sensors in the table, memory retained by a populated handler
+and time to store main response and to list values of parameters to be set.
+
+Usage: python benchmarks/bench_zones.py [zones] [path to other ariston.py revision]
+"""
+import sys
+import tracemalloc
+
+from common import fake_response, load_ariston, main_payload, make_handler, timeit
+
+
+def run(module, zones):
+    tracemalloc.start()
+    # Tables are sized at login done by the first request
+    handler = make_handler(module, zones=zones)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    resp = fake_response(main_payload(zones))
+
+    def store_main():
+        with handler._data_lock:
+            handler._store_data(resp, "main")
+
+    def set_values():
+        return handler.supported_sensors_set_values
+
+    return {
+        "sensors": len(handler._ariston_sensors),
+        "set list": len(handler.supported_sensors_set),
+        "memory": size,
+        "store main": timeit(store_main),
+        "set values": timeit(set_values),
+    }
+
+
+def main():
+    zones = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    revisions = [("current", load_ariston())]
+    if len(sys.argv) > 2:
+        revisions.insert(0, ("other revision", load_ariston(sys.argv[2])))
+    print(f"{zones} zone(s)")
+    print(f"{'':>16} {'sensors':>8} {'set list':>9} {'memory':>10} {'store main':>12} {'set values':>12}")
+    for label, module in revisions:
+        result = run(module, zones)
+        print(f"{label:>16} {result['sensors']:>8} {result['set list']:>9} {result['memory'] / 1024:>7.0f} kB "
+              f"{result['store main'] * 1000:>9.3f} ms {result['set values'] * 1000:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Shared helpers for AristonHandler benchmarks.
+
+Benchmarks load ariston.py directly so that Home Assistant is not needed to run them.
+Only entities of the platforms need Home Assistant, see platform_entities.
+Responses are generated locally, no requests are sent to the Ariston cloud.
+"""
+import importlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+import types
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_DIR = os.path.join(REPO_DIR, "custom_components", "ariston")
+
+
+def load_ariston(path=None):
+    """
+    Load ariston.py module without importing Home Assistant integration package.
+    Another revision of the module can be given by path to compare results.
+    """
+    if path is None:
+        path = os.path.join(COMPONENT_DIR, "ariston.py")
+    spec = importlib.util.spec_from_file_location("ariston_api", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Values reported by the server within zone 0
+ZONE_0_ITEMS = {
+    "ChFlowSetpointTemp": dict(value=45.0, unit="°C"),
+    "HeatingCircuitPressure": dict(value=1.4, unit="bar"),
+    "OutsideTemp": dict(value=7.0, unit="°C"),
+    "Weather": dict(value=1),
+    "PlantMode": dict(value=1, options=[0, 1, 2, 3, 5], optTexts=["Summer", "Winter", "Heating only", "Cooling", "OFF"]),
+    "Holiday": dict(value=0, options=[0, 1]),
+    "IsFlameOn": dict(value=1, options=[0, 1]),
+    "DhwTemp": dict(value=50.0, unit="°C", min=40.0, max=65.0, step=1.0),
+    "DhwMode": dict(value=0, options=[0, 1], optTexts=["Manual", "Time program"]),
+    "DhwTimeProgComfortTemp": dict(value=55.0, unit="°C", min=40.0, max=65.0, step=1.0),
+    "DhwTimeProgEconomyTemp": dict(value=45.0, unit="°C", min=40.0, max=65.0, step=1.0),
+    "DhwStorageTemperature": dict(value=48.0, unit="°C"),
+    "IsHeatingPumpOn": dict(value=0, options=[0, 1]),
+}
+
+# Values reported by the server for each zone
+ZONE_ITEMS = {
+    "ZoneHeatRequest": dict(value=1, options=[0, 1]),
+    "ZoneMode": dict(value=2, options=[0, 1, 2, 3], optTexts=["OFF", "Manual", "Time program", "Manual2"]),
+    "ZoneDesiredTemp": dict(value=21.0, unit="°C"),
+    "ZoneMeasuredTemp": dict(value=20.5, unit="°C"),
+    "ZoneDeroga": dict(value=0.0, unit="°C"),
+    "ZoneComfortTemp": dict(value=21.0, unit="°C", min=10.0, max=30.0, step=0.5),
+    "IsZonePilotOn": dict(value=0, options=[0, 1]),
+    "ZoneEconomyTemp": dict(value=17.0, unit="°C", min=10.0, max=30.0, step=0.5),
+    "HeatingFlowTemp": dict(value=50.0, unit="°C", min=20.0, max=80.0, step=1.0),
+    "HeatingFlowOffset": dict(value=0.0, unit="°C", min=-14.0, max=14.0, step=1.0),
+    "CoolingFlowTemp": dict(value=18.0, unit="°C", min=7.0, max=23.0, step=1.0),
+    "CoolingFlowOffset": dict(value=0.0, unit="°C", min=-14.0, max=14.0, step=1.0),
+}
+
+ON_OFF_OPTIONS = [{"value": 0, "text": "OFF"}, {"value": 1, "text": "ON"}]
+
+# Values reported by the server in the web menu
+MENU_ITEMS = [
+    {"id": "U6_16_6", "value": 1, "dropDownOptions": ON_OFF_OPTIONS},
+    {"id": "U6_16_7", "value": 0, "dropDownOptions": ON_OFF_OPTIONS},
+    {"id": "U6_9_5_0", "value": 1, "dropDownOptions": ON_OFF_OPTIONS},
+    {"id": "U6_3_3", "value": 0, "dropDownOptions": ON_OFF_OPTIONS},
+    {"id": "U6_9_2", "value": 1, "dropDownOptions": [
+        {"value": 0, "text": "Disabled"}, {"value": 1, "text": "Time based"}, {"value": 2, "text": "Always active"}]},
+    {"id": "U6_16_5", "value": 80, "unitLabel": "%"},
+    {"id": "U6_9_5_1", "value": 30, "min": 1, "max": 30, "increment": 1, "unitLabel": "days"},
+    {"id": "U6_3_0_0", "value": 60, "min": 20, "max": 80, "increment": 1, "unitLabel": "°C"},
+    {"id": "U6_3_0_1", "value": 40, "min": 20, "max": 80, "increment": 1, "unitLabel": "°C"},
+]
+
+
+def features_payload(zones):
+    return {"zones": [{"num": zone} for zone in range(1, zones + 1)], "hasTwoCoolingTemp": False}
+
+
+def main_payload(zones, requested=None):
+    """Reply of dataItems request, if requested items are given only those are returned"""
+    items = [{"id": key, "zone": 0, **value} for key, value in ZONE_0_ITEMS.items()]
+    for zone in range(1, zones + 1):
+        items.extend({"id": key, "zone": zone, **value} for key, value in ZONE_ITEMS.items())
+    if requested is not None:
+        wanted = {(item["id"], item["zn"]) for item in requested}
+        items = [item for item in items if (item["id"], item["zone"]) in wanted]
+    return {"items": items, "features": features_payload(zones)}
+
+
+def additional_payload(param_ids=None):
+    if param_ids is None:
+        return {"data": [dict(item) for item in MENU_ITEMS]}
+    return {"data": [dict(item) for item in MENU_ITEMS if item["id"] in param_ids]}
+
+
+def errors_payload(count=1):
+    return [
+        {"gw": "F0AD4E0590BD", "timestamp": "2022-07-14T10:55:04", "fault": 45, "mult": 0, "code": "501",
+         "pri": 1053500, "errDex": "No flame detected", "res": False, "blk": True}
+        for _ in range(count)
+    ]
+
+
+def schedule_payload(key):
+    return {key: {"plans": [
+        {"days": [1, 2, 3, 4, 5], "slices": [{"from": 0, "temp": 0}, {"from": 390, "temp": 1}, {"from": 1320, "temp": 0}]},
+        {"days": [0, 6], "slices": [{"from": 0, "temp": 0}, {"from": 480, "temp": 1}]},
+    ]}}
+
+
+def last_month_payload():
+    return {"LastMonth": [{"use": 1, "gas": 120, "elect": 3}, {"use": 2, "gas": 40, "elect": 1}]}
+
+
+def energy_payload(seed=1):
+    rnd = random.Random(seed)
+    data = []
+    for key in (7, 10, 1, 2, 20, 21):
+        data.append({"k": key, "p": 1, "v": [rnd.randint(0, 5) for _ in range(12)]})
+        data.append({"k": key, "p": 2, "v": [rnd.randint(0, 40) for _ in range(7)]})
+        data.append({"k": key, "p": 3, "v": [rnd.randint(0, 40) for _ in range(31)]})
+        data.append({"k": key, "p": 4, "v": [rnd.randint(0, 900) for _ in range(12)]})
+    return data
+
+
+# Current revision of the module, loaded on first use by fake_module
+_fake_module = None
+
+
+def fake_module(module=None):
+    """
+    Module providing AristonFakeTransport and AristonResponse.
+    Older revisions given by path may lack them, the current revision is used for those.
+    """
+    global _fake_module
+    if module is not None and hasattr(module, "AristonFakeTransport"):
+        return module
+    if _fake_module is None:
+        _fake_module = load_ariston()
+    return _fake_module
+
+
+def fake_response(data, status_code=200, module=None):
+    """Reply with JSON data as returned by the transport"""
+    return fake_module(module).AristonResponse(status_code, json.dumps(data).encode())
+
+
+def fake_transport(zones=1, latency=0.0, module=None):
+    """AristonFakeTransport answering AristonHandler requests with generated payloads"""
+
+    def schedule(method, url, json_data):
+        return schedule_payload("ChZn1") if "/ChZn1" in url else schedule_payload("Dhw")
+
+    def report(method, url, json_data):
+        return last_month_payload() if "/energyAccount" in url else energy_payload()
+
+    return fake_module(module).AristonFakeTransport({
+        "login": {},
+        "logout": {},
+        "plants": [{"gwId": "GW1"}],
+        "features": features_payload(zones),
+        "data_items": lambda method, url, json_data: main_payload(zones, json_data["items"]),
+        "menu_refresh": additional_payload(),
+        "menu_submit": {},
+        "bus_errors": errors_payload(),
+        "time_progs": schedule,
+        "reports": report,
+        "set": {},
+    }, latency=latency)
+
+
+def sent_posts(transport):
+    """(url, json data) of POST requests sent to the transport except data requests"""
+    return [
+        (url, json_data) for method, url, json_data in transport.requests
+        if method == "POST" and transport.endpoint(url) != "data_items"]
+
+
+ALL_REQUESTS = ["main", "additional_params", "errors", "ch_schedule", "dhw_schedule", "last_month", "energy"]
+
+
+def make_handler(module, zones=1, sensors=None, populate=True):
+    """Create handler with fake transport and optionally fetch all data once"""
+    handler_class = module.AristonHandler
+    if sensors is None:
+        sensors = list(handler_class._SENSOR_LIST)
+    handler = handler_class("user", "password", sensors=sensors, logging_level="ERROR")
+    handler._session = fake_transport(zones=zones, module=module)
+    handler._started = True
+    if populate:
+        for request in ALL_REQUESTS:
+            handler._control_availability_state(request)
+    handler._started = False
+    return handler
+
+
+class SyncDispatcher:
+    """Delivers notification immediately in the calling thread"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def notify(self, subscription, changed_data):
+        self.calls += 1
+        subscription.deliver(changed_data)
+
+
+def set_sensor_value(handler, sensor, value):
+    """Change value of a sensor the way decoders do so it is published and reported"""
+    handler._ariston_sensors[sensor].value = value
+    if hasattr(handler, "_dirty_sensors"):
+        handler._dirty_sensors.add(sensor)
+
+
+def entity_reads(zones, sensors):
+    """
+    (sensor, key) reads done by entities of all platforms during one update of a plant.
+    Approximates properties Home Assistant reads when writing state of each entity.
+    """
+    return platform_reads(zones, sensors)["all"]
+
+
+def platform_reads(zones, sensors, switches=(), selects=(), binary_sensors=()):
+    """
+    (sensor, key) reads done during one update of a plant by entities of each platform,
+    key "all" has reads of climate, water heater and sensor entities together.
+    Approximates properties Home Assistant reads when writing state of each entity.
+    """
+    reads = []
+    platforms = {"climate": []}
+    for zone in range(1, zones + 1):
+        # climate entity
+        reads += [
+            ("mode", "value"),
+            (f"ch_set_temperature_zone{zone}", "min"),
+            (f"ch_set_temperature_zone{zone}", "max"),
+            (f"ch_set_temperature_zone{zone}", "units"),
+            (f"ch_detected_temperature_zone{zone}", "value"),
+            (f"ch_set_temperature_zone{zone}", "value"),
+            ("mode", "value"),
+            (f"ch_mode_zone{zone}", "value"),
+            (f"ch_mode_zone{zone}", "options_text"),
+            ("mode", "value"),
+            (f"ch_flame_zone{zone}", "value"),
+            ("mode", "value"),
+            ("holiday_mode", "value"),
+            ("mode", "options_text"),
+            (f"ch_set_temperature_zone{zone}", "step"),
+        ]
+    platforms["climate"] = list(reads)
+    # water heater entity
+    reads += [
+        ("mode", "value"),
+        ("dhw_mode", "options_text"),
+        ("dhw_storage_temperature", "value"),
+        ("dhw_set_temperature", "units"),
+        ("dhw_set_temperature", "min"),
+        ("dhw_set_temperature", "max"),
+        ("dhw_set_temperature", "value"),
+        ("dhw_set_temperature", "step"),
+        ("dhw_set_temperature", "step"),
+        ("dhw_flame", "value"),
+        ("dhw_mode", "options_text"),
+        ("dhw_mode", "value"),
+    ]
+    platforms["water_heater"] = reads[len(platforms["climate"]):]
+    # sensor entities
+    for sensor in sensors:
+        reads += [
+            (sensor, "value"),
+            (sensor, "value"),
+            (sensor, "attributes"),
+            (sensor, "options_text"),
+            (sensor, "min"),
+            (sensor, "units"),
+            (sensor, "units"),
+        ]
+    platforms["sensor"] = reads[len(platforms["climate"]) + len(platforms["water_heater"]):]
+    platforms["all"] = reads
+    platforms["switch"] = [(switch, "value") for switch in switches for _ in range(3)]
+    platforms["select"] = [
+        (select, key) for select in selects
+        for key in ("value", "value", "value", "options_text", "min", "max", "step")]
+    platforms["binary_sensor"] = [
+        (sensor, key) for sensor in binary_sensors for key in ("value", "value", "attributes")]
+    return platforms
+
+
+def platform_entities(handler, zones):
+    """
+    Entities of the integration for each platform, created for every sensor of the platform the handler has.
+    Entities are not added to Home Assistant, a stand-in of hass provides only the unit system.
+    None is returned if Home Assistant is not installed.
+    """
+    try:
+        from homeassistant.util.unit_system import METRIC_SYSTEM
+    except ImportError:
+        return None
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    package = importlib.import_module("custom_components.ariston")
+    platforms = {
+        name: importlib.import_module(f"custom_components.ariston.{name}")
+        for name in ("climate", "water_heater", "sensor", "binary_sensor", "switch", "select")}
+    # Updates are not pushed to the entities, coordinator is not used
+    device = package.AristonDevice(types.SimpleNamespace(ariston_api=handler), {}, types.SimpleNamespace())
+    name = "Ariston"
+    entities = {
+        "climate": [platforms["climate"].AristonThermostat(name, device, f"{name} Zone{zone}") for zone in range(1, zones + 1)],
+        "water_heater": [platforms["water_heater"].AristonWaterHeater(name, device)],
+        "sensor": [
+            platforms["sensor"].AristonSensor(name, device, sensor)
+            for sensor in platforms["sensor"].SENSORS if sensor in handler.sensor_values],
+        "binary_sensor": [
+            platforms["binary_sensor"].AristonBinarySensor(name, device, sensor)
+            for sensor in platforms["binary_sensor"].BINARY_SENSORS if sensor in handler.sensor_values],
+        "switch": [
+            platforms["switch"].AristonSwitch(name, device, sensor)
+            for sensor in platforms["switch"].SWITCHES if sensor in handler.sensor_values],
+        "select": [
+            platforms["select"].AristonSelect(name, device, sensor)
+            for sensor in platforms["select"].SELECTS if sensor in handler.sensor_values],
+    }
+    hass = types.SimpleNamespace(config=types.SimpleNamespace(units=METRIC_SYSTEM))
+    for platform_entities in entities.values():
+        for entity in platform_entities:
+            entity.hass = hass
+    return entities
+
+
+def update_entity(entity):
+    """Update entity and calculate its state and attributes the way Home Assistant does when writing state"""
+    entity.update()
+    return entity._async_calculate_state()
+
+
+def timeit(func, repeat=5, number=20):
+    """Best time in seconds of a single call"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
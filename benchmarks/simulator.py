@@ -0,0 +1,486 @@
+"""
+Local simulator of Ariston NET cloud for benchmarks and soak tests.
+
+Serves endpoints used by AristonHandler: login, logout, plants/lite, features, dataItems, PlantMenu Refresh/Submit,
+busErrors, timeProgs, energyAccount, consSequencesApi8 and mode/temperature set endpoints.
+Every login email gets its own plant with mutable state: zone temperatures drift towards set ones,
+flame cycles while there is heat demand and set values are applied after a delay.
+
+Faults are injected by knobs, they can also be changed while running by POST /_sim/config with JSON body
+and request statistics are returned by GET /_sim/stats.
+
+Usage: python benchmarks/simulator.py [--port 8080] [--zones 1] [--set-delay 5] [--error-rate 0]
+                                      [--slow-rate 0] [--slow-delay 5] [--session-ttl 0] [--speed 1]
+Point handler to it by AristonHandler(..., url="http://127.0.0.1:8080").
+"""
+import argparse
+import copy
+import http.server
+import json
+import math
+import random
+import re
+import secrets
+import threading
+import time
+import urllib.parse
+
+from common import (
+    MENU_ITEMS,
+    ZONE_0_ITEMS,
+    ZONE_ITEMS,
+    energy_payload,
+    errors_payload,
+    features_payload,
+    last_month_payload,
+    schedule_payload,
+)
+
+# Values of plant and zone modes
+MODE_WINTER = 1
+MODE_HEATING_ONLY = 2
+ZONE_MODE_OFF = 0
+ZONE_MODE_TIME_PROGRAM = 2
+
+# Daily comfort period of time program in minutes, matching schedule_payload
+COMFORT_FROM = 390
+COMFORT_TO = 1320
+
+
+class SimulatorConfig:
+    """Knobs of the simulator, they may be changed while it is running"""
+
+    FIELDS = {
+        "zones": int,
+        "set_delay": float,
+        "error_rate": float,
+        "slow_rate": float,
+        "slow_delay": float,
+        "session_ttl": float,
+        "speed": float,
+        "flame_cycle": float,
+        "bus_errors": int,
+    }
+
+    def __init__(self, zones=1, set_delay=5.0, error_rate=0.0, slow_rate=0.0, slow_delay=5.0,
+                 session_ttl=0.0, speed=1.0, flame_cycle=300.0, bus_errors=0):
+        # Zones of plants created after the change
+        self.zones = zones
+        # Seconds until set value is visible in replies
+        self.set_delay = set_delay
+        # Probability of reply with status 500
+        self.error_rate = error_rate
+        # Probability of reply delayed by slow_delay seconds
+        self.slow_rate = slow_rate
+        self.slow_delay = slow_delay
+        # Seconds until login expires and requests are rejected with status 401, 0 to never expire
+        self.session_ttl = session_ttl
+        # Speed of plant simulation compared to real time
+        self.speed = speed
+        # Seconds of flame on and off cycle while there is heat demand
+        self.flame_cycle = flame_cycle
+        # Number of active errors reported by busErrors
+        self.bus_errors = bus_errors
+
+    def update(self, values):
+        for key, value in values.items():
+            if key not in self.FIELDS:
+                raise ValueError(f"Unknown knob {key}")
+            setattr(self, key, self.FIELDS[key](value))
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+
+class SimulatedPlant:
+    """State of one plant, it is advanced on each request"""
+
+    def __init__(self, plant_id, zones, seed):
+        self.plant_id = plant_id
+        self.zones = zones
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.zone_0 = copy.deepcopy(ZONE_0_ITEMS)
+        self.zone_items = {zone: copy.deepcopy(ZONE_ITEMS) for zone in range(1, zones + 1)}
+        self.menu = copy.deepcopy(MENU_ITEMS)
+        for zone, items in self.zone_items.items():
+            items["ZoneMeasuredTemp"]["value"] = round(self.random.uniform(17.0, 22.0), 1)
+        self.pending = []
+        self.flame_phase = self.random.uniform(0, 1)
+        self.updated = time.monotonic()
+        self.simulated = 0.0
+
+    def _item(self, item_id, zone):
+        items = self.zone_0 if zone == 0 else self.zone_items.get(zone, {})
+        return items.get(item_id)
+
+    def _set(self, item_id, zone, value):
+        item = self._item(item_id, zone)
+        if item is not None:
+            item["value"] = value
+
+    def _desired_temperature(self, items):
+        mode = items["ZoneMode"]["value"]
+        if mode == ZONE_MODE_OFF:
+            return None
+        if mode == ZONE_MODE_TIME_PROGRAM:
+            minute = time.localtime().tm_hour * 60 + time.localtime().tm_min
+            if not COMFORT_FROM <= minute < COMFORT_TO:
+                return items["ZoneEconomyTemp"]["value"]
+        return items["ZoneComfortTemp"]["value"]
+
+    def advance(self, config):
+        """Apply due set values and move temperatures and flame by elapsed time"""
+        now = time.monotonic()
+        due = [change for change in self.pending if change[0] <= now]
+        if due:
+            self.pending = [change for change in self.pending if change[0] > now]
+            for _, apply in due:
+                apply()
+        elapsed = (now - self.updated) * config.speed
+        self.updated = now
+        self.simulated += elapsed
+
+        heating = self.zone_0["PlantMode"]["value"] in (MODE_WINTER, MODE_HEATING_ONLY)
+        outside = 7.0 + 5.0 * math.sin(self.simulated / 43200 * math.pi)
+        self.zone_0["OutsideTemp"]["value"] = round(outside, 1)
+        cycle = config.flame_cycle or 1
+        flame_on = (self.simulated / cycle + self.flame_phase) % 1 < 0.5
+        demand = False
+        for items in self.zone_items.values():
+            desired = self._desired_temperature(items)
+            measured = items["ZoneMeasuredTemp"]["value"]
+            zone_demand = heating and desired is not None and measured < desired
+            demand = demand or zone_demand
+            items["ZoneHeatRequest"]["value"] = int(zone_demand)
+            if desired is not None:
+                items["ZoneDesiredTemp"]["value"] = desired
+            if zone_demand and flame_on:
+                measured += 0.002 * elapsed
+            else:
+                measured -= 0.0005 * elapsed * max(measured - outside, 0) / 10
+            items["ZoneMeasuredTemp"]["value"] = round(measured + self.random.uniform(-0.05, 0.05), 1)
+        self.zone_0["IsFlameOn"]["value"] = int(demand and flame_on)
+        storage = self.zone_0["DhwStorageTemperature"]["value"]
+        target = self.zone_0["DhwTemp"]["value"]
+        storage += 0.01 * elapsed if storage < target else -0.001 * elapsed
+        self.zone_0["DhwStorageTemperature"]["value"] = round(min(storage, target + 1), 1)
+
+    def schedule_set(self, config, apply):
+        self.pending.append((time.monotonic() + config.set_delay, apply))
+
+    def main_payload(self, requested):
+        items = []
+        for request in requested:
+            item = self._item(request["id"], request["zn"])
+            if item is not None:
+                items.append({"id": request["id"], "zone": request["zn"], **item})
+        return {"items": items, "features": features_payload(self.zones)}
+
+    def menu_payload(self, param_ids):
+        return {"data": [dict(item) for item in self.menu if item["id"] in param_ids]}
+
+    def set_plant(self, config, endpoint, data):
+        new = data["new"]
+        if endpoint == "mode":
+            self.schedule_set(config, lambda: self._set("PlantMode", 0, new))
+        elif endpoint == "dhwMode":
+            self.schedule_set(config, lambda: self._set("DhwMode", 0, new))
+        elif endpoint == "dhwTemp":
+            self.schedule_set(config, lambda: self._set("DhwTemp", 0, new))
+        elif endpoint == "dhwTimeProgTemperatures":
+            def apply():
+                self._set("DhwTimeProgComfortTemp", 0, new["comf"])
+                self._set("DhwTimeProgEconomyTemp", 0, new["econ"])
+            self.schedule_set(config, apply)
+        else:
+            return False
+        return True
+
+    def set_zone(self, config, zone, endpoint, data):
+        if zone not in self.zone_items:
+            return False
+        new = data["new"]
+        if endpoint == "mode":
+            self.schedule_set(config, lambda: self._set("ZoneMode", zone, new))
+        elif endpoint == "temperatures":
+            def apply():
+                self._set("ZoneComfortTemp", zone, new["comf"])
+                self._set("ZoneEconomyTemp", zone, new["econ"])
+                desired = self._desired_temperature(self.zone_items[zone])
+                if desired is not None:
+                    self._set("ZoneDesiredTemp", zone, desired)
+            self.schedule_set(config, apply)
+        else:
+            return False
+        return True
+
+    def submit_menu(self, config, data):
+        values = {item["id"]: item["value"] for item in data}
+
+        def apply():
+            for item in self.menu:
+                if item["id"] in values:
+                    item["value"] = values[item["id"]]
+        self.schedule_set(config, apply)
+
+
+class AristonSimulator:
+    """
+    Simulated Ariston NET cloud serving requests from a background thread.
+    Started by 'start', its base url is available in 'url'.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, seed=1, **knobs):
+        self.config = SimulatorConfig(**knobs)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._plants_by_user = dict()
+        self._plants = dict()
+        self._sessions = dict()
+        self.stats = {"requests": 0, "errors_injected": 0, "slow_injected": 0, "expired": 0, "logins": 0, "sets": 0}
+        self._server = http.server.ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ariston_simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def plant(self, plant_id):
+        return self._plants.get(plant_id)
+
+    def expire_sessions(self):
+        """Expire all logins at once like server restart does"""
+        with self._lock:
+            self._sessions.clear()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _login(self, email):
+        with self._lock:
+            plant = self._plants_by_user.get(email)
+            if plant is None:
+                plant_id = f"SIM{len(self._plants) + 1:06d}"
+                plant = SimulatedPlant(plant_id, self.config.zones, self._random.random())
+                self._plants_by_user[email] = plant
+                self._plants[plant_id] = plant
+            token = secrets.token_hex(16)
+            self._sessions[token] = (plant, time.monotonic())
+            self.stats["logins"] += 1
+        return token
+
+    def _session_plant(self, token):
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            plant, created = session
+            if self.config.session_ttl and time.monotonic() - created > self.config.session_ttl:
+                del self._sessions[token]
+                self.stats["expired"] += 1
+                return None
+            return plant
+
+    def _logout(self, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(SimulatorRequestHandler):
+            pass
+
+        Handler.simulator = simulator
+        return Handler
+
+
+class SimulatorRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Routes requests of AristonHandler to simulated plants"""
+
+    protocol_version = "HTTP/1.1"
+    simulator = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET", None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            self._reply(400, {"error": "invalid JSON"})
+            return
+        self._dispatch("POST", data)
+
+    def _reply(self, status, data=None, headers=None):
+        content = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _token(self):
+        cookies = self.headers.get("Cookie", "")
+        match = re.search(r"(?:^|;\s*)sim_session=(\w+)", cookies)
+        return match.group(1) if match else None
+
+    def _dispatch(self, method, data):
+        simulator = self.simulator
+        config = simulator.config
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path
+        query = urllib.parse.parse_qs(url.query)
+
+        if path == "/_sim/config":
+            if method == "POST":
+                try:
+                    config.update(data or {})
+                except (ValueError, TypeError) as ex:
+                    self._reply(400, {"error": str(ex)})
+                    return
+            self._reply(200, config.as_dict())
+            return
+        if path == "/_sim/stats":
+            with simulator._lock:
+                stats = dict(simulator.stats, plants=len(simulator._plants), sessions=len(simulator._sessions))
+            self._reply(200, stats)
+            return
+
+        simulator._count("requests")
+        if config.slow_rate and simulator._random.random() < config.slow_rate:
+            simulator._count("slow_injected")
+            time.sleep(config.slow_delay)
+        if config.error_rate and simulator._random.random() < config.error_rate:
+            simulator._count("errors_injected")
+            self._reply(500, {"error": "injected failure"})
+            return
+
+        if path == "/R2/Account/Login" and method == "POST":
+            token = simulator._login((data or {}).get("email", ""))
+            self._reply(200, {"ok": True}, {"Set-Cookie": f"sim_session={token}; Path=/; HttpOnly"})
+            return
+        token = self._token()
+        if path == "/R2/Account/Logout":
+            simulator._logout(token)
+            self._reply(200, {"ok": True})
+            return
+        plant = simulator._session_plant(token)
+        if plant is None:
+            self._reply(401, {"error": "not logged in"})
+            return
+
+        if method == "POST" and data is None:
+            self._reply(400, {"error": "JSON body is expected"})
+            return
+        with plant.lock:
+            plant.advance(config)
+            try:
+                status, reply = self._plant_reply(plant, method, path, query, data)
+            except (KeyError, TypeError, ValueError, AttributeError) as ex:
+                # Malformed body of a known endpoint
+                status, reply = 400, {"error": f"invalid request body: {ex!r}"}
+        self._reply(status, reply)
+
+    def _plant_reply(self, plant, method, path, query, data):
+        simulator = self.simulator
+        config = simulator.config
+        plant_id = plant.plant_id
+        parts = path.strip("/").split("/")
+
+        if path == "/api/v2/remote/plants/lite":
+            return 200, [{"gwId": plant_id}]
+        if path == f"/api/v2/remote/plants/{plant_id}/features":
+            return 200, features_payload(plant.zones)
+        if path == f"/api/v2/remote/dataItems/{plant_id}/get" and method == "POST":
+            return 200, plant.main_payload(data.get("items", []))
+        if path == "/R2/PlantMenu/Refresh" and query.get("id") == [plant_id]:
+            param_ids = query.get("paramIds", [""])[0].split(",")
+            return 200, plant.menu_payload(param_ids)
+        if path == f"/R2/PlantMenu/Submit/{plant_id}" and method == "POST":
+            plant.submit_menu(config, data)
+            simulator._count("sets")
+            return 200, {"ok": True}
+        if path == "/api/v2/busErrors" and query.get("gatewayId") == [plant_id]:
+            return 200, errors_payload(config.bus_errors)
+        if path == f"/api/v2/remote/timeProgs/{plant_id}/ChZn1":
+            return 200, schedule_payload("ChZn1")
+        if path == f"/api/v2/remote/timeProgs/{plant_id}/Dhw":
+            return 200, schedule_payload("Dhw")
+        if path == f"/api/v2/remote/reports/{plant_id}/energyAccount":
+            return 200, last_month_payload()
+        if path == f"/api/v2/remote/reports/{plant_id}/consSequencesApi8":
+            return 200, energy_payload(int(plant_id[3:]))
+        if method == "POST" and parts[:3] == ["api", "v2", "remote"]:
+            if len(parts) == 6 and parts[3] == "plantData" and parts[4] == plant_id:
+                if plant.set_plant(config, parts[5], data):
+                    simulator._count("sets")
+                    return 200, {"ok": True}
+            if len(parts) == 7 and parts[3] == "zones" and parts[4] == plant_id and parts[5].isdigit():
+                if plant.set_zone(config, int(parts[5]), parts[6], data):
+                    simulator._count("sets")
+                    return 200, {"ok": True}
+        return 404, {"error": "unknown endpoint"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local simulator of Ariston NET cloud")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=1, help="zones of each plant")
+    parser.add_argument("--set-delay", type=float, default=5.0, help="seconds until set values are applied")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of status 500")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="probability of slow reply")
+    parser.add_argument("--slow-delay", type=float, default=5.0, help="seconds of slow reply")
+    parser.add_argument("--session-ttl", type=float, default=0.0, help="seconds until login expires, 0 to never expire")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed of plant simulation compared to real time")
+    parser.add_argument("--flame-cycle", type=float, default=300.0, help="seconds of flame on and off cycle")
+    parser.add_argument("--bus-errors", type=int, default=0, help="number of active errors of each plant")
+    args = parser.parse_args()
+    simulator = AristonSimulator(
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+        zones=args.zones,
+        set_delay=args.set_delay,
+        error_rate=args.error_rate,
+        slow_rate=args.slow_rate,
+        slow_delay=args.slow_delay,
+        session_ttl=args.session_ttl,
+        speed=args.speed,
+        flame_cycle=args.flame_cycle,
+        bus_errors=args.bus_errors,
+    )
+    print(f"Simulator listening on {simulator.url}")
+    try:
+        simulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
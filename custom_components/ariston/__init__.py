@@ -1,4 +1,5 @@
 """Suppoort for Ariston."""
+import asyncio
 import logging
 import re
 
@@ -19,10 +20,13 @@ from homeassistant.const import (
     CONF_SWITCHES,
     CONF_SELECTOR,
     CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.helpers import discovery
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from .ariston import AristonHandler
+from .ariston import AsyncAristonHandler
+from .coordinator import AristonCoordinator
 from .const import param_zoned
 
 from .binary_sensor import binary_sensors_default
@@ -39,6 +43,9 @@ from .const import (
     CONF_PERIOD_GET,
     CONF_MAX_SET_RETRIES,
     CONF_CH_ZONES,
+    CONF_REQUEST_PERIODS,
+    CONF_CAPTURE_FILE,
+    REQUESTS,
     ZONED_PARAMS,
     PARAM_CH_MODE,
     PARAM_CH_SET_TEMPERATURE,
@@ -95,6 +102,10 @@ ARISTON_SCHEMA = vol.Schema(
         vol.Optional(CONF_CH_ZONES, default=1): vol.All(
             int, vol.Range(min=1, max=6)
         ),
+        vol.Optional(CONF_REQUEST_PERIODS, default={}): {
+            vol.In(REQUESTS): vol.All(int, vol.Range(min=30, max=86400))
+        },
+        vol.Optional(CONF_CAPTURE_FILE): cv.string,
 
     }
 )
@@ -130,7 +141,9 @@ class AristonChecker:
         gw,
         period_set,
         period_get,
-        retries
+        retries,
+        request_periods,
+        capture_file
     ):
         """Initialize."""
 
@@ -156,7 +169,8 @@ class AristonChecker:
         if PARAM_VERSION in list_of_sensors:
             list_of_sensors.remove(PARAM_VERSION)
 
-        self.ariston_api = AristonHandler(
+        # Own client session keeps login cookies of the plant separate from other plants
+        self.ariston_api = AsyncAristonHandler(
             username=username,
             password=password,
             sensors=list_of_sensors,
@@ -164,11 +178,14 @@ class AristonChecker:
             gw=gw,
             set_max_retries=retries,
             period_get_request=period_get,
-            period_set_request=period_set
+            period_set_request=period_set,
+            request_periods=request_periods,
+            capture_file=capture_file,
+            session=async_create_clientsession(hass)
         )
 
 
-def setup(hass, config):
+async def async_setup(hass, config):
     """Set up the Ariston component."""
     if DOMAIN not in config:
         return True
@@ -209,10 +226,14 @@ def setup(hass, config):
             logging=device.get(CONF_LOG),
             period_set=device.get(CONF_PERIOD_SET),
             period_get=device.get(CONF_PERIOD_GET),
-            retries=device.get(CONF_MAX_SET_RETRIES)
+            retries=device.get(CONF_MAX_SET_RETRIES),
+            request_periods=device.get(CONF_REQUEST_PERIODS),
+            capture_file=device.get(CONF_CAPTURE_FILE)
         )
 
         api_list.append(api)
+        # subscribe before start to receive the first data
+        coordinator = AristonCoordinator(hass, api.ariston_api, name)
         # start api execution
         api.ariston_api.start()
 
@@ -243,48 +264,54 @@ def setup(hass, config):
             update_list(selectors)
 
         # load all devices
-        hass.data[DATA_ARISTON][DEVICES][name] = AristonDevice(api, device)
-        discovery.load_platform(hass, CLIMATE, DOMAIN, {CONF_NAME: name, CLIMATES: climates}, config)
-        discovery.load_platform(hass, WATER_HEATER, DOMAIN, {CONF_NAME: name}, config)
+        hass.data[DATA_ARISTON][DEVICES][name] = AristonDevice(api, device, coordinator)
+        hass.async_create_task(discovery.async_load_platform(hass, CLIMATE, DOMAIN, {CONF_NAME: name, CLIMATES: climates}, config))
+        hass.async_create_task(discovery.async_load_platform(hass, WATER_HEATER, DOMAIN, {CONF_NAME: name}, config))
 
         if switches:
-            discovery.load_platform(
-                hass,
-                SWITCH,
-                DOMAIN,
-                {CONF_NAME: name, CONF_SWITCHES: switches},
-                config,
+            hass.async_create_task(
+                discovery.async_load_platform(
+                    hass,
+                    SWITCH,
+                    DOMAIN,
+                    {CONF_NAME: name, CONF_SWITCHES: switches},
+                    config,
+                )
             )
 
         if selectors:
-            discovery.load_platform(
-                hass,
-                SELECT,
-                DOMAIN,
-                {CONF_NAME: name, CONF_SELECTOR: selectors},
-                config,
+            hass.async_create_task(
+                discovery.async_load_platform(
+                    hass,
+                    SELECT,
+                    DOMAIN,
+                    {CONF_NAME: name, CONF_SELECTOR: selectors},
+                    config,
+                )
             )
 
         if binary_sensors:
-            discovery.load_platform(
-                hass,
-                BINARY_SENSOR,
-                DOMAIN,
-                {CONF_NAME: name, CONF_BINARY_SENSORS: binary_sensors},
-                config,
+            hass.async_create_task(
+                discovery.async_load_platform(
+                    hass,
+                    BINARY_SENSOR,
+                    DOMAIN,
+                    {CONF_NAME: name, CONF_BINARY_SENSORS: binary_sensors},
+                    config,
+                )
             )
 
         if sensors:
-            discovery.load_platform(
+            hass.async_create_task(discovery.async_load_platform(
                 hass, SENSOR, DOMAIN, {CONF_NAME: name, CONF_SENSORS: sensors}, config
-            )
+            ))
             
     gateways_txt = ", ".join(dev_gateways)
     names_txt = ", ".join(dev_names)
     _LOGGER.info(f"All gateways: {gateways_txt}")
     _LOGGER.info(f"All names: {names_txt}")
 
-    def set_ariston_data(call):
+    async def async_set_ariston_data(call):
         """Handle the service call to set the data."""
         # Start with mandatory parameter
         entity_id = call.data.get(ATTR_ENTITY_ID, "")
@@ -343,7 +370,13 @@ def setup(hass, config):
             raise Exception("Corresponding entity_id for Ariston not found")
         return
 
-    hass.services.register(DOMAIN, SERVICE_SET_DATA, set_ariston_data)
+    hass.services.async_register(DOMAIN, SERVICE_SET_DATA, async_set_ariston_data)
+
+    async def async_stop_ariston(event):
+        """Log out and stop timers of all plants when Home Assistant stops."""
+        await asyncio.gather(*(api.ariston_api.async_stop() for api in api_list))
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_ariston)
 
     if not hass.data[DATA_ARISTON][DEVICES]:
         return False
@@ -354,7 +387,8 @@ def setup(hass, config):
 class AristonDevice:
     """Representation of a base Ariston discovery device."""
 
-    def __init__(self, api, device):
+    def __init__(self, api, device, coordinator):
         """Initialize the entity."""
         self.api = api
         self.device = device
+        self.coordinator = coordinator
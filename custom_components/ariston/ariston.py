@@ -1,13 +1,819 @@
 """Suppoort for Ariston."""
+import abc
+import asyncio
+import base64
 import calendar
+import collections
+import concurrent.futures
 import copy
 import datetime
+import functools
+import heapq
+import itertools
+import json
 import logging
+import random
 import re
 import threading
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _default_json_loads(content):
+    """Decode JSON body of a reply, orjson is used when installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+_json_loads = _default_json_loads
+
+
+def set_json_decoder(loads=None):
+    """
+    Replace decoder of JSON replies by function accepting bytes and returning decoded data.
+    Default decoder is restored when None is passed.
+    """
+    global _json_loads
+    _json_loads = loads if loads is not None else _default_json_loads
+
+
+class SensorRecord(Mapping):
+    """
+    Compact record of a single sensor.
+
+    Fields are accessible as attributes or read-only as mapping keys:
+    'value', 'units', 'min', 'max', 'step', 'options', 'options_text' and 'attributes'.
+    """
+
+    __slots__ = ("value", "units", "min", "max", "step", "options", "options_text", "attributes")
+
+    _NO_ATTRIBUTES = MappingProxyType({})
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Reset all fields to default values"""
+        self.value = None
+        self.units = None
+        self.min = None
+        self.max = None
+        self.step = None
+        self.options = None
+        self.options_text = None
+        self.attributes = self._NO_ATTRIBUTES
+
+    def frozen_copy(self) -> "SensorRecord":
+        """Copy of the record with read-only attributes"""
+        record = SensorRecord.__new__(SensorRecord)
+        record.value = self.value
+        record.units = self.units
+        record.min = self.min
+        record.max = self.max
+        record.step = self.step
+        record.options = self.options
+        record.options_text = self.options_text
+        if isinstance(self.attributes, MappingProxyType):
+            record.attributes = self.attributes
+        else:
+            record.attributes = MappingProxyType(self.attributes)
+        return record
+
+    def same_as(self, other: "SensorRecord") -> bool:
+        """Return True if value, meta data and attributes of both records are equal"""
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"SensorRecord({dict(self)})"
+
+
+class AristonSensorSnapshot(Mapping):
+    """
+    Read-only view of all sensors published by AristonHandler.
+
+    A new snapshot with a higher version is published after each processed response,
+    so readers may keep a reference to it without copying.
+    """
+
+    __slots__ = ("_sensors", "_version")
+
+    def __init__(self, sensors: dict, version: int) -> None:
+        self._sensors = sensors
+        self._version = version
+
+    @property
+    def version(self) -> int:
+        """Return monotonically increasing version of the snapshot."""
+        return self._version
+
+    def __getitem__(self, sensor):
+        return self._sensors[sensor]
+
+    def __iter__(self):
+        return iter(self._sensors)
+
+    def __len__(self) -> int:
+        return len(self._sensors)
+
+    def updated(self, records: dict, removed=()) -> "AristonSensorSnapshot":
+        """New snapshot with given records replaced, removed sensors dropped and higher version"""
+        sensors = dict(self._sensors)
+        sensors.update(records)
+        for sensor in removed:
+            sensors.pop(sensor, None)
+        return AristonSensorSnapshot(sensors, self._version + 1)
+
+
+class AristonSubscription:
+    """Subscriber callback with its extra arguments and optional event loop to deliver it in."""
+
+    __slots__ = ("func", "args", "kwargs", "event_loop")
+
+    def __init__(self, func, args: tuple, kwargs: dict, event_loop=None) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.event_loop = event_loop
+
+    def deliver(self, changed_data: dict) -> None:
+        """Call subscriber directly or schedule the call in its event loop"""
+        if self.event_loop is None:
+            self.func(changed_data, *self.args, **self.kwargs)
+        else:
+            self.event_loop.call_soon_threadsafe(
+                functools.partial(self.func, changed_data, *self.args, **self.kwargs))
+
+
+class AristonDispatcher:
+    """
+    Delivers subscriber notifications from a single thread in the order they were queued.
+
+    Change sets queued for a subscriber that has not been called yet are merged into one call
+    with the latest values. The thread is started on demand and exits after being idle.
+    """
+
+    _IDLE_TIMEOUT = 30
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self._logger = logger
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        self._pending = dict()
+        self._thread = None
+
+    def notify(self, subscription: AristonSubscription, changed_data: dict) -> None:
+        """Queue changed data for subscriber"""
+        with self._condition:
+            pending = self._pending.get(subscription)
+            if pending is not None:
+                pending.update(changed_data)
+                return
+            self._pending[subscription] = dict(changed_data)
+            self._queue.append(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ariston_dispatcher", daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait(self._IDLE_TIMEOUT)
+                    if not self._queue:
+                        self._thread = None
+                        return
+                subscription = self._queue.popleft()
+                changed_data = self._pending.pop(subscription)
+            try:
+                subscription.deliver(changed_data)
+            except Exception as ex:
+                self._logger.warning(f'Subscriber {subscription.func} failed: {ex}')
+
+
+class AristonLoopDispatcher:
+    """
+    Delivers subscriber notifications within asyncio event loop in the order they were queued.
+
+    Same interface as AristonDispatcher, it is used from the event loop only.
+    Change sets queued for a subscriber that has not been called yet are merged into one call.
+    """
+
+    def __init__(self, logger: logging.Logger, loop=None) -> None:
+        self._logger = logger
+        self._loop = loop
+        self._pending = dict()
+
+    def notify(self, subscription: AristonSubscription, changed_data: dict) -> None:
+        """Queue changed data for subscriber"""
+        pending = self._pending.get(subscription)
+        if pending is not None:
+            pending.update(changed_data)
+            return
+        self._pending[subscription] = dict(changed_data)
+        loop = self._loop or asyncio.get_running_loop()
+        loop.call_soon(self._deliver, subscription)
+
+    def _deliver(self, subscription: AristonSubscription) -> None:
+        changed_data = self._pending.pop(subscription)
+        try:
+            subscription.deliver(changed_data)
+        except Exception as ex:
+            self._logger.warning(f'Subscriber {subscription.func} failed: {ex}')
+
+
+class AristonJob:
+    """Function scheduled by AristonScheduler, it is not called if cancelled before it is due."""
+
+    __slots__ = ("func", "args", "cancelled")
+
+    def __init__(self, func, args=()) -> None:
+        self.func = func
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the job if it has not been started yet"""
+        self.cancelled = True
+
+
+class AristonScheduler:
+    """
+    Runs scheduled jobs one after another from a single thread.
+
+    Jobs are ordered by due time, jobs due at the same time keep the order they were scheduled in.
+    The thread is started on demand and exits after being idle. Jobs which must not wait for each other
+    are given to separate schedulers.
+    """
+
+    _IDLE_TIMEOUT = 30
+
+    def __init__(self, logger: logging.Logger, name: str = "ariston_scheduler") -> None:
+        self._logger = logger
+        self._name = name
+        self._condition = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._thread = None
+
+    def schedule(self, delay: float, func, args=()) -> AristonJob:
+        """Schedule function to be called with arguments after delay in seconds"""
+        job = AristonJob(func, args)
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+        return job
+
+    def _next_job(self):
+        """Wait for the next due job, None is returned when idle for too long"""
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._condition.wait(self._IDLE_TIMEOUT)
+                    if not self._heap:
+                        self._thread = None
+                        return None
+                    continue
+                due, _, job = self._heap[0]
+                wait_for = due - time.monotonic()
+                if wait_for <= 0:
+                    heapq.heappop(self._heap)
+                    return job
+                self._condition.wait(wait_for)
+
+    def _run(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if job.cancelled:
+                continue
+            try:
+                job.func(*job.args)
+            except Exception as ex:
+                self._logger.warning(f'Scheduled {job.func} failed: {ex}')
+
+
+class AristonLoopScheduler:
+    """
+    Runs scheduled jobs within asyncio event loop.
+
+    Same interface as AristonScheduler, it is used from the event loop only.
+    Jobs returning a coroutine are run as tasks, tasks still running are cancelled by 'cancel_tasks'.
+    """
+
+    def __init__(self, logger: logging.Logger, loop=None) -> None:
+        self._logger = logger
+        self._loop = loop
+        self._tasks = set()
+
+    def schedule(self, delay: float, func, args=()) -> AristonJob:
+        """Schedule function to be called with arguments after delay in seconds"""
+        job = AristonJob(func, args)
+        loop = self._loop or asyncio.get_running_loop()
+        loop.call_later(delay, self._run, job)
+        return job
+
+    def cancel_tasks(self) -> None:
+        """Cancel tasks of started jobs except the calling one"""
+        current = asyncio.current_task()
+        for task in list(self._tasks):
+            if task is not current:
+                task.cancel()
+
+    def _run(self, job: AristonJob) -> None:
+        if job.cancelled:
+            return
+        try:
+            result = job.func(*job.args)
+        except Exception as ex:
+            self._logger.warning(f'Scheduled {job.func} failed: {ex}')
+            return
+        if asyncio.iscoroutine(result):
+            task = asyncio.get_running_loop().create_task(self._run_task(job, result))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_task(self, job: AristonJob, coroutine) -> None:
+        try:
+            await coroutine
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._logger.warning(f'Scheduled {job.func} failed: {ex}')
+
+
+class AristonResponse:
+    """Reply of asynchronous request with attributes of requests.Response used by AristonHandler."""
+
+    __slots__ = ("status_code", "content")
+
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(errors="replace")
+
+    def json(self):
+        return _json_loads(self.content)
+
+
+class AristonTransportError(Exception):
+    """Request could not be sent or no reply was received."""
+
+
+class AristonTransport(abc.ABC):
+    """
+    Sends HTTP requests of AristonHandler and keeps cookies of the login.
+
+    Keyword arguments follow requests.Session, replies have attributes 'ok', 'status_code', 'text' and 'content'.
+    Failures to get a reply are raised as AristonTransportError.
+    """
+
+    @abc.abstractmethod
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        """Send POST request with JSON data and return the reply"""
+
+    @abc.abstractmethod
+    def get(self, url: str, timeout=None, verify=True):
+        """Send GET request and return the reply"""
+
+    def close(self) -> None:
+        """Release connections of the transport"""
+
+
+class AristonRequestsTransport(AristonTransport):
+    """Transport using requests.Session, it is the default transport."""
+
+    def __init__(self) -> None:
+        self._session = requests.Session()
+
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        try:
+            return self._session.post(url, timeout=timeout, json=json, verify=verify)
+        except requests.exceptions.RequestException as ex:
+            raise AristonTransportError(ex) from ex
+
+    def get(self, url: str, timeout=None, verify=True):
+        try:
+            return self._session.get(url, timeout=timeout, verify=verify)
+        except requests.exceptions.RequestException as ex:
+            raise AristonTransportError(ex) from ex
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class AristonHttpxPool:
+    """
+    Connection pool of httpx shared by transports of several handlers.
+
+    Transports keep their own cookies, so each handler has its own login while connections to the server are reused.
+    The pool is closed by its owner after all transports using it are closed.
+    """
+
+    def __init__(self, max_connections: int = 100, verify: bool = True) -> None:
+        if httpx is None:
+            raise Exception("httpx is required by AristonHttpxPool")
+        self.transport = httpx.HTTPTransport(
+            verify=verify,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections))
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AristonHttpxTransport(AristonTransport):
+    """Transport using httpx, connections are shared with other transports using the same 'pool'."""
+
+    def __init__(self, pool: AristonHttpxPool = None) -> None:
+        if httpx is None:
+            raise Exception("httpx is required by AristonHttpxTransport")
+        self._own_pool = pool is None
+        self._pool = pool if pool is not None else AristonHttpxPool()
+        self._client = httpx.Client(transport=self._pool.transport, follow_redirects=True)
+
+    def _send(self, method: str, url: str, timeout, json_data=None):
+        try:
+            resp = self._client.request(method, url, json=json_data, timeout=timeout)
+        except httpx.HTTPError as ex:
+            raise AristonTransportError(ex) from ex
+        return AristonResponse(resp.status_code, resp.content)
+
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        return self._send("POST", url, timeout, json)
+
+    def get(self, url: str, timeout=None, verify=True):
+        return self._send("GET", url, timeout)
+
+    def close(self) -> None:
+        # Closing of the client would close connections shared with other transports
+        self._client.cookies.clear()
+        if self._own_pool:
+            self._client.close()
+
+
+class AristonFakeTransport(AristonTransport):
+    """
+    In-memory transport answering requests by scripted endpoints, nothing is sent to the network.
+
+    Endpoints are named by ENDPOINTS. Reply of endpoint is either data to be returned as JSON
+    or function called with (method, url, json data) returning such data or AristonResponse.
+    Endpoints without a reply answer with status 404.
+
+    'latency' - delay of replies in seconds, or tuple (minimum, maximum) for random delays;
+    'failure_rate' - probability from 0 to 1 that request fails;
+    'failure_status' - status code of failed requests, AristonTransportError is raised if None;
+    'seed' - seed of random latencies and failures.
+
+    Latency and failures are set for all endpoints and can be changed per endpoint by 'script'.
+    Number of requests per endpoint is counted in 'calls', (method, url, json data) of each request
+    is appended to 'requests'.
+    """
+
+    # Endpoint names with parts of url identifying them, the first matching one is used
+    ENDPOINTS = (
+        ("login", "/R2/Account/Login"),
+        ("logout", "/R2/Account/Logout"),
+        ("plants", "/api/v2/remote/plants/lite"),
+        ("features", "/features"),
+        ("data_items", "/api/v2/remote/dataItems/"),
+        ("menu_refresh", "/R2/PlantMenu/Refresh"),
+        ("menu_submit", "/R2/PlantMenu/Submit"),
+        ("bus_errors", "/api/v2/busErrors"),
+        ("time_progs", "/api/v2/remote/timeProgs/"),
+        ("reports", "/api/v2/remote/reports/"),
+        ("set", "/api/v2/remote/plantData/"),
+        ("set", "/api/v2/remote/zones/"),
+    )
+
+    def __init__(self, replies: dict = None, latency=0.0, failure_rate: float = 0.0, failure_status: int = None, seed=None) -> None:
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._defaults = {"latency": latency, "failure_rate": failure_rate, "failure_status": failure_status}
+        self._scripts = {name: {} for name, _ in self.ENDPOINTS}
+        self.calls = {name: 0 for name, _ in self.ENDPOINTS}
+        self.requests = []
+        for name, reply in (replies or {}).items():
+            self.script(name, reply)
+
+    def script(self, endpoint: str, reply=None, **options) -> None:
+        """
+        Set reply of endpoint, reply is kept if None.
+        Options 'latency', 'failure_rate' and 'failure_status' override transport defaults for the endpoint.
+        """
+        if endpoint not in self._scripts:
+            raise Exception(f"Unsupported endpoint {endpoint}")
+        for option in options:
+            if option not in self._defaults:
+                raise Exception(f"Unsupported option {option}")
+        with self._lock:
+            if reply is not None:
+                self._scripts[endpoint]["reply"] = reply
+            self._scripts[endpoint].update(options)
+
+    def endpoint(self, url: str) -> str:
+        """Name of endpoint of the url, None if url is unknown"""
+        for name, part in self.ENDPOINTS:
+            if part in url:
+                return name
+        return None
+
+    def _send(self, method: str, url: str, json_data=None):
+        endpoint = self.endpoint(url)
+        with self._lock:
+            script = self._scripts.get(endpoint, {})
+            options = {option: script.get(option, value) for option, value in self._defaults.items()}
+            reply = script.get("reply")
+            if endpoint is not None:
+                self.calls[endpoint] += 1
+            self.requests.append((method, url, json_data))
+            latency = options["latency"]
+            if isinstance(latency, tuple):
+                latency = self._random.uniform(*latency)
+            failed = self._random.random() < options["failure_rate"]
+        if latency:
+            time.sleep(latency)
+        if failed:
+            if options["failure_status"] is None:
+                raise AristonTransportError(f"Simulated failure of {method} {url}")
+            return AristonResponse(options["failure_status"], b"")
+        if reply is None:
+            return AristonResponse(404, b"")
+        if callable(reply):
+            reply = reply(method, url, json_data)
+        if isinstance(reply, AristonResponse):
+            return reply
+        return AristonResponse(200, json.dumps(reply).encode())
+
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        return self._send("POST", url, json)
+
+    def get(self, url: str, timeout=None, verify=True):
+        return self._send("GET", url)
+
+
+class AristonCapture:
+    """
+    Append-only capture file of requests and replies, one JSON object per line.
+
+    Keys of each line:
+        'time' - time of sending the request in seconds since epoch;
+        'method', 'url' - request;
+        'body' - JSON data of the request;
+        'status' - status code of the reply, None if no reply was received;
+        'elapsed' - seconds until the reply or failure;
+        'payload' - text of the reply, 'payload_b64' is used instead if the reply is not UTF-8 text.
+    Values of credentials, tokens and cookies are replaced by REDACTED at any depth of body and JSON payload
+    and in query of url. Headers are not captured, so cookies of the login never get into the file.
+
+    Lines are written by a thread started on demand, so requests sent from an event loop do not wait for the disk.
+    File is opened for each batch of lines, so it can be moved or removed while handler is running.
+    """
+
+    REDACTED = "***"
+    # Parts of key names, in lower case, whose values are redacted
+    _REDACTED_KEYS = ("password", "passwd", "token", "cookie", "secret", "authorization", "apikey", "api_key")
+    _IDLE_TIMEOUT = 5
+
+    def __init__(self, path: str, logger: logging.Logger = None) -> None:
+        self._path = path
+        self._logger = logger or logging.getLogger(__name__)
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        self._writing = False
+        self._thread = None
+
+    @classmethod
+    def _is_secret(cls, key) -> bool:
+        key = str(key).lower()
+        return any(part in key for part in cls._REDACTED_KEYS)
+
+    @classmethod
+    def _redact(cls, data):
+        """Copy of JSON data with values of secret keys replaced at any depth"""
+        if isinstance(data, dict):
+            return {key: cls.REDACTED if cls._is_secret(key) else cls._redact(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [cls._redact(item) for item in data]
+        return data
+
+    @classmethod
+    def _redact_url(cls, url: str) -> str:
+        parts = urlsplit(url)
+        if not parts.query:
+            return url
+        query = [(key, cls.REDACTED if cls._is_secret(key) else value)
+                 for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+        if all(value != cls.REDACTED for _, value in query):
+            return url
+        return urlunsplit(parts._replace(query=urlencode(query, safe="*")))
+
+    @classmethod
+    def _redact_payload(cls, text: str) -> str:
+        """Reply text with secrets redacted, text is kept unchanged if it has no secrets"""
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return text
+        redacted = cls._redact(data)
+        if redacted == data:
+            return text
+        return json.dumps(redacted, separators=(",", ":"), ensure_ascii=False)
+
+    def _line(self, method: str, url: str, body, started: float, elapsed: float, status, content) -> str:
+        line = {
+            "time": round(started, 3),
+            "method": method.upper(),
+            "url": self._redact_url(url),
+            "body": self._redact(body),
+            "status": status,
+            "elapsed": round(elapsed, 4),
+        }
+        if content is not None:
+            try:
+                line["payload"] = self._redact_payload(content.decode())
+            except UnicodeDecodeError:
+                line["payload_b64"] = base64.b64encode(content).decode()
+        return json.dumps(line, separators=(",", ":"), ensure_ascii=False)
+
+    def record(self, method: str, url: str, body, started: float, elapsed: float, resp=None) -> None:
+        """Queue request and its reply to be appended, resp is None if no reply was received"""
+        item = (method, url, body, started, elapsed,
+                resp.status_code if resp is not None else None, resp.content if resp is not None else None)
+        with self._condition:
+            self._queue.append(item)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ariston_capture", daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until queued lines are written, False is returned on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._writing, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait(self._IDLE_TIMEOUT)
+                    if not self._queue:
+                        self._thread = None
+                        return
+                items = list(self._queue)
+                self._queue.clear()
+                self._writing = True
+            try:
+                lines = [self._line(*item) for item in items]
+                with open(self._path, "a", encoding="utf-8") as file:
+                    file.write("\n".join(lines) + "\n")
+            except Exception as ex:
+                self._logger.warning(f'Capture to {self._path} failed: {ex}')
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+class AristonCaptureTransport(AristonTransport):
+    """Transport writing requests sent by another transport and their replies to AristonCapture."""
+
+    def __init__(self, transport: AristonTransport, capture: AristonCapture) -> None:
+        self._transport = transport
+        self._capture = capture
+
+    def _send(self, method: str, send, url: str, json_data=None, **kwargs):
+        started = time.time()
+        start = time.monotonic()
+        try:
+            resp = send(url, **kwargs)
+        except AristonTransportError:
+            self._capture.record(method, url, json_data, started, time.monotonic() - start)
+            raise
+        self._capture.record(method, url, json_data, started, time.monotonic() - start, resp)
+        return resp
+
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        return self._send("POST", self._transport.post, url, json, timeout=timeout, json=json, verify=verify)
+
+    def get(self, url: str, timeout=None, verify=True):
+        return self._send("GET", self._transport.get, url, timeout=timeout, verify=verify)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AristonReplayTransport(AristonTransport):
+    """
+    Transport answering requests with replies read from capture file written by AristonCapture.
+
+    Requests are matched by method, path and query of the url, so captures can be replayed with any server url.
+    Captured replies of the same request are returned in the captured order.
+    Requests which failed without a reply when captured raise AristonTransportError.
+
+    'speed' - 0 to reply immediately, 1 to wait the captured time of each reply, 2 to wait half of it and so on;
+    'loop' - if True captured replies of a request are repeated from the first one when all were used,
+             otherwise AristonTransportError is raised for requests without remaining replies.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0, loop: bool = False) -> None:
+        if not isinstance(speed, (int, float)) or speed < 0:
+            raise Exception("Invalid speed, zero or positive number is expected")
+        self._speed = speed
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._replies = {}
+        self._used = {}
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    self._replies.setdefault(self._key(record["method"], record["url"]), []).append(record)
+
+    @staticmethod
+    def _key(method: str, url: str):
+        parts = urlsplit(url)
+        return method.upper(), f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    @property
+    def remaining(self) -> int:
+        """Number of captured replies not yet returned"""
+        with self._lock:
+            return sum(len(replies) - self._used.get(key, 0) for key, replies in self._replies.items())
+
+    def _send(self, method: str, url: str):
+        key = self._key(method, url)
+        with self._lock:
+            replies = self._replies.get(key)
+            used = self._used.get(key, 0)
+            if replies and used >= len(replies) and self._loop:
+                used = 0
+            if not replies or used >= len(replies):
+                raise AristonTransportError(f"No captured reply of {method} {url}")
+            self._used[key] = used + 1
+            record = replies[used]
+        if self._speed:
+            time.sleep(record.get("elapsed", 0) / self._speed)
+        if record["status"] is None:
+            raise AristonTransportError(f"Captured failure of {method} {url}")
+        if "payload_b64" in record:
+            content = base64.b64decode(record["payload_b64"])
+        else:
+            content = record.get("payload", "").encode()
+        return AristonResponse(record["status"], content)
+
+    def post(self, url: str, timeout=None, json=None, verify=True):
+        return self._send("POST", url)
+
+    def get(self, url: str, timeout=None, verify=True):
+        return self._send("GET", url)
+
 
 class AristonHandler:
     """
@@ -25,13 +831,27 @@ class AristonHandler:
 
     'polling' - defines multiplication factor for waiting periods to get or set the data;
 
+    'request_periods' - dictionary of periods in seconds to repeat each request type (minimum is 30 seconds),
+                        periods of not specified request types are taken from _REQUEST_PERIODS
+
     'logging_level' - defines level of logging - allowed values [CRITICAL, ERROR, WARNING, INFO, DEBUG, NOTSET=(default)]
+
+    'transport' - AristonTransport to send requests with, AristonRequestsTransport is used if not specified
+
+    'url' - base url of the server, Ariston NET is used if not specified
+
+    'capture_file' - path of file to append all requests and replies to, see AristonCapture. Intended to get
+                     replies for offline analysis, they can be sent back to handler by AristonReplayTransport
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     """
 
     _VERSION = "2.0.16"
 
     _ARISTON_URL = "https://www.ariston-net.remotethermo.com"
+    _URL_LOGIN = "/R2/Account/Login?returnUrl=%2FR2%2FHome"
+    _URL_LOGOUT = "/R2/Account/Logout"
+    _URL_GATEWAYS = "/api/v2/remote/plants/lite"
+    _URL_FEATURES = "/api/v2/remote/plants/{}/features?eagerMode=True"
 
     # API configuration
     _MAX_RETRIES = 5
@@ -43,6 +863,16 @@ class AristonHandler:
     _TIMEOUT_AV = 15
     _TIMEOUT_MAX = 25
     _TIME_SPLIT = 0.1
+    # Threads of each pool shared by all handlers to send independent requests concurrently
+    _MAX_WORKERS = 8
+    _EXECUTOR_READ = "read"
+    _EXECUTOR_SET = "set"
+    _shared_executors = {}
+    _shared_executor_lock = threading.Lock()
+    # Delays in seconds between reads verifying that parameters were set
+    _VERIFY_DELAYS = (2, 5, 10)
+    # Seconds without new value of a parameter before it is sent, only the last value of a burst is sent
+    _SET_COALESCE_WINDOW = 1.0
 
     # Log levels
     _LEVEL_CRITICAL = "CRITICAL"
@@ -285,6 +1115,32 @@ class AristonHandler:
     _LIST_ARISTON_WEB_PARAMS = [
         *_MAP_ARISTON_WEB_MENU_PARAMS.keys(),
     ]
+    # Main request items always fetched as they are used by climate and water heater,
+    # setting of parameters, availability and DHW flame inference
+    _LIST_MAIN_REQUIRED = [
+        _PARAM_MODE,
+        _PARAM_HOLIDAY_MODE,
+        _PARAM_FLAME,
+        _PARAM_DHW_SET_TEMPERATURE,
+        _PARAM_DHW_MODE,
+        _PARAM_DHW_COMFORT_TEMPERATURE,
+        _PARAM_DHW_ECONOMY_TEMPERATURE,
+        _PARAM_DHW_STORAGE_TEMPERATURE,
+        _PARAM_CH_FLAME,
+        _PARAM_CH_MODE,
+        _PARAM_CH_SET_TEMPERATURE,
+        _PARAM_CH_DETECTED_TEMPERATURE,
+        _PARAM_CH_COMFORT_TEMPERATURE,
+        _PARAM_CH_ECONOMY_TEMPERATURE,
+    ]
+    # Main request items with flow settings which rarely change, they are fetched less often.
+    # Comfort and economy temperatures stay in every main request, they are sent back as old values when setting.
+    _MAIN_COLD_ITEMS = {
+        _ARISTON_PAR_HEATING_FLOW_TEMP,
+        _ARISTON_PAR_HEATING_FLOW_OFFSET,
+        _ARISTON_PAR_COOLING_FLOW_TEMP,
+        _ARISTON_PAR_COOLING_FLOW_OFFSET,
+    }
     # Sensors in error request
     _LIST_ERROR_PARAMS = [
         _PARAM_ERRORS_COUNT
@@ -425,25 +1281,44 @@ class AristonHandler:
         _REQUEST_LAST_MONTH: _LIST_LAST_MONTH,
     }
 
+    # Mapping of sensors to Android api items as (id, zone) and reverse mapping
+    _MAP_SENSOR_TO_API_ITEM = {}
+    for sensor, param in _MAP_ARISTON_ZONE_0_PARAMS.items():
+        _MAP_SENSOR_TO_API_ITEM[sensor] = (param, 0)
+    for sensor, param in _MAP_ARISTON_MULTIZONE_PARAMS.items():
+        for zone in range(1, 7):
+            _MAP_SENSOR_TO_API_ITEM[f'{sensor}_zone{zone}'] = (param, zone)
+    _MAP_API_ITEM_TO_SENSOR = {value: key for key, value in _MAP_SENSOR_TO_API_ITEM.items()}
+
+    # All possible names of zoned sensors, sensors are created only for zones of the plant
+    _ZONED_SENSORS = set()
+    for sensor in _SENSOR_LIST:
+        if sensor in _MAP_ARISTON_MULTIZONE_PARAMS:
+            for zone in range(1, 7):
+                _ZONED_SENSORS.add(f'{sensor}_zone{zone}')
+
     _MAP_SENSOR_TO_REQUEST = {}
     for request, sensor_list in _MAP_REQUEST.items():
         for sensor in sensor_list:
             _MAP_SENSOR_TO_REQUEST[sensor] = request
 
-    # Priority lists of requests (first list is High prio and second is Low prio)
-    _REQUESTS_SEQUENCE = [
-        [
-            _REQUEST_MAIN,
-            _REQUEST_ADDITIONAL,
-            _REQUEST_ERRORS
-        ],
-        [
-            _REQUEST_CH_SCHEDULE,
-            _REQUEST_DHW_SCHEDULE,
-            _REQUEST_LAST_MONTH,
-            _REQUEST_ENERGY
-        ]
-    ]
+    # Default periods in seconds to repeat each request type, main request defaults to the get period.
+    # Only one request is sent per get period, so main request is skipped in periods taken by other overdue requests.
+    # Order defines priority of requests being overdue by the same time.
+    _REQUEST_PERIODS = {
+        _REQUEST_MAIN: _GET_SENSORS_PERIOD_SECONDS,
+        _REQUEST_ADDITIONAL: 120,
+        _REQUEST_ERRORS: 240,
+        _REQUEST_CH_SCHEDULE: 1800,
+        _REQUEST_DHW_SCHEDULE: 1800,
+        _REQUEST_LAST_MONTH: 3600,
+        _REQUEST_ENERGY: 900,
+    }
+    # Period in seconds to include cold items into main request, they are also included while parameters are being set
+    _MAIN_COLD_PERIOD = 600
+
+    # Record of sensor not yet reported to subscribers and of zoned sensors of zones missing in the plant
+    _EMPTY_RECORD = SensorRecord()
 
     # Keys used in structures
     _VALUE = 'value'
@@ -456,6 +1331,14 @@ class AristonHandler:
     _OPTIONS_TXT = 'options_text'
     _ATTRIBUTES = "attributes"
     _ATTEMPT = "attempt"
+    _REQUESTED = "requested"
+    _META_KEYS = (_UNITS, _MIN, _MAX, _STEP, _OPTIONS, _OPTIONS_TXT, _ATTRIBUTES)
+
+    # Options lists shared by all sensors and handlers
+    _INTERNED_OPTIONS = {}
+
+    # Option value to text mappings for interned options
+    _OPTION_TEXT_MAPS = {}
 
     # Values data for data mapping from received data to readable format
     _WEEKDAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
@@ -486,15 +1369,64 @@ class AristonHandler:
         return sensor, 0
 
     def _reset_sensor(self, sensor):
-        self._ariston_sensors[sensor] = dict()
-        self._ariston_sensors[sensor][self._VALUE] = None
-        self._ariston_sensors[sensor][self._UNITS] = None
-        self._ariston_sensors[sensor][self._MIN] = None
-        self._ariston_sensors[sensor][self._MAX] = None
-        self._ariston_sensors[sensor][self._STEP] = None
-        self._ariston_sensors[sensor][self._OPTIONS] = None
-        self._ariston_sensors[sensor][self._OPTIONS_TXT] = None
-        self._ariston_sensors[sensor][self._ATTRIBUTES] = {}
+        self._dirty_sensors.add(sensor)
+        if sensor in self._ariston_sensors:
+            self._ariston_sensors[sensor].clear()
+        else:
+            self._ariston_sensors[sensor] = SensorRecord()
+
+    @classmethod
+    def _intern_options(cls, options):
+        """Shared read-only copy of options list"""
+        if options is None:
+            return None
+        options = tuple(options)
+        return cls._INTERNED_OPTIONS.setdefault(options, options)
+
+    def _size_sensors_to_zones(self, zones):
+        """
+        Keep zoned sensors and parameters to be set only for the zones of the plant.
+        Zone 1 is always present as it indicates availability of CH.
+        """
+        zones = sorted(set(zones) | {1})
+        if zones == self._sensor_zones:
+            return
+        removed = []
+        for sensor in self._SENSOR_LIST:
+            if sensor in self._MAP_ARISTON_MULTIZONE_PARAMS:
+                for zone in self._sensor_zones:
+                    if zone not in zones:
+                        ch_sensor = self._zone_sensor_name(sensor, zone=zone)
+                        del self._ariston_sensors[ch_sensor]
+                        del self._subscribed_sensors_old_record[ch_sensor]
+                        self._dirty_sensors.discard(ch_sensor)
+                        self._unreported_sensors.discard(ch_sensor)
+                        removed.append(ch_sensor)
+                for zone in zones:
+                    if zone not in self._sensor_zones:
+                        ch_sensor = self._zone_sensor_name(sensor, zone=zone)
+                        self._reset_sensor(ch_sensor)
+                        self._subscribed_sensors_old_record[ch_sensor] = self._EMPTY_RECORD
+        self._sensor_set_list = []
+        for sensor in self._SENSOR_SET_LIST_TEMP:
+            if sensor in self._MAP_ARISTON_MULTIZONE_PARAMS:
+                for zone in zones:
+                    self._sensor_set_list.append(self._zone_sensor_name(sensor, zone=zone))
+            else:
+                self._sensor_set_list.append(sensor)
+        self._sensor_zones = zones
+        if removed:
+            self._sensors_snapshot = self._sensors_snapshot.updated({}, removed)
+        self._publish_sensors()
+        self._LOGGER.debug(f'Sensors sized to zones {zones}')
+
+    def _publish_sensors(self):
+        """Publish new snapshot of sensors for readers, only sensors touched since last publishing are copied"""
+        records = {sensor: self._ariston_sensors[sensor].frozen_copy() for sensor in self._dirty_sensors}
+        self._sensors_snapshot = self._sensors_snapshot.updated(records)
+        # Touched sensors are checked for changes when subscribers are informed
+        self._unreported_sensors.update(self._dirty_sensors)
+        self._dirty_sensors.clear()
 
 
     def __init__(self,
@@ -506,6 +1438,10 @@ class AristonHandler:
                  period_set_request: int = _SET_SENSORS_PERIOD_SECONDS,
                  set_max_retries: int = _MAX_RETRIES,
                  gw: str = "",
+                 request_periods: dict = None,
+                 transport: AristonTransport = None,
+                 url: str = _ARISTON_URL,
+                 capture_file: str = None,
                  ) -> None:
         """
         Initialize API.
@@ -528,6 +1464,27 @@ class AristonHandler:
         if not isinstance(set_max_retries, int) or set_max_retries < 1:
             raise Exception(f"At least 1 retry to set data is expected")
 
+        if request_periods is None:
+            request_periods = dict()
+
+        if not isinstance(request_periods, dict):
+            raise Exception("Invalid request_periods type")
+
+        if transport is not None and not isinstance(transport, AristonTransport):
+            raise Exception("Invalid transport type")
+
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            raise Exception("Invalid url, http or https url is expected")
+
+        if capture_file is not None and not isinstance(capture_file, str):
+            raise Exception("Invalid capture_file type")
+
+        for request, period in request_periods.items():
+            if request not in self._REQUEST_PERIODS:
+                raise Exception(f"Unsupported request {request} in request_periods")
+            if not isinstance(period, (int, float)) or period < self._GET_SENSORS_PERIOD_SECONDS:
+                raise Exception(f"Period of {request} request must be a number higher than {self._GET_SENSORS_PERIOD_SECONDS}")
+
         """
         Logging settings
         """
@@ -546,6 +1503,8 @@ class AristonHandler:
                     sensors.remove(sensor)
 
         self._default_gw = gw
+        # Server to send requests to, it is changed to a local server for tests
+        self._ARISTON_URL = url.rstrip("/")
         self._user = username
         self._password = password
         self._get_period_time = period_get_request
@@ -554,22 +1513,28 @@ class AristonHandler:
 
         # clear read sensor values
         self._ariston_sensors = dict()
-        self._subscribed_sensors_old_value = dict()
+        # Records last reported to subscribers
+        self._subscribed_sensors_old_record = dict()
+        # Sensors touched by decoders since last publishing and since last informing of subscribers
+        self._dirty_sensors = set()
+        self._unreported_sensors = set()
+        self._sensors_snapshot = AristonSensorSnapshot({}, 0)
         for sensor in self._SENSOR_LIST:
-            if sensor in self._MAP_ARISTON_MULTIZONE_PARAMS:
-                for zone in range(1, 7):
-                    ch_sensor = self._zone_sensor_name(sensor, zone=zone)
-                    self._reset_sensor(ch_sensor)
-                    self._subscribed_sensors_old_value[ch_sensor] = None
-            else:
+            if sensor not in self._MAP_ARISTON_MULTIZONE_PARAMS:
                 self._reset_sensor(sensor)
-                self._subscribed_sensors_old_value[sensor] = None
-        
+                self._subscribed_sensors_old_record[sensor] = self._EMPTY_RECORD
+        # Zoned sensors and parameters to be set are sized to zones reported by the plant after login
+        self._sensor_zones = []
+        self._sensor_set_list = []
+        self._size_sensors_to_zones([])
+
         # clear configuration data
         self._set_param = {}
         self._features = {}
         self._main_data = {}
+        self._main_index = {}
         self._additional_data = {}
+        self._additional_index = {}
         self._error_data = {}
         self._ch_schedule_data = {}
         self._dhw_schedule_data = {}
@@ -579,13 +1544,16 @@ class AristonHandler:
 
         self._last_dhw_storage_temp = None
         self._reset_set_requests()
+        self._set_metrics = {"requested": 0, "coalesced": 0, "sent": 0}
 
         # initiate all other data
         self._errors = 0
         self._data_lock = threading.Lock()
         self._lock = threading.Lock()
         self._plant_id_lock = threading.Lock()
-        self._session = requests.Session()
+        self._capture = AristonCapture(capture_file, self._LOGGER) if capture_file else None
+        # Transport sending requests, it keeps cookies of the login
+        self._session = self._create_transport(transport)
         self._login = False
         self._plant_id = ""
         self._started = False
@@ -593,65 +1561,93 @@ class AristonHandler:
         self._ch_available = False
         self._dhw_available = False
         self._changing_data = False
-        self._timer_periodic_read = threading.Timer(0, self._queue_get_data)
-        self._timer_queue_delay = threading.Timer(0, self._control_availability_state, [self._REQUEST_MAIN])
-        self._timer_set_delay = threading.Timer(0, self._preparing_setting_http_data)
+        # Reads may wait for slow replies up to _TIMEOUT_MAX, set and verify jobs have their own thread
+        # so that a pending set request is never delayed by a read in progress
+        self._scheduler = AristonScheduler(self._LOGGER)
+        self._set_scheduler = AristonScheduler(self._LOGGER, "ariston_set")
+        self._timer_periodic_read = AristonJob(self._queue_get_data)
+        self._timer_queue_delay = AristonJob(self._control_availability_state, [self._REQUEST_MAIN])
+        self._timer_set_delay = AristonJob(self._preparing_setting_http_data)
+        self._timer_verify = AristonJob(self._verify_set_data)
+
+        # Items of main request, zoned items are requested for each zone of the plant
+        wanted_sensors = {self._zone_sensor_split(sensor)[0] for sensor in sensors}
+        wanted_sensors.update(self._LIST_MAIN_REQUIRED)
+        self._main_zone_0_items = [
+            param for sensor, param in self._MAP_ARISTON_ZONE_0_PARAMS.items() if sensor in wanted_sensors]
+        self._main_zone_items = [
+            param for sensor, param in self._MAP_ARISTON_MULTIZONE_PARAMS.items() if sensor in wanted_sensors]
+        # Bodies of main request with and without cold items, they are built again when features of the plant change
+        self._main_requests = {}
+        # Monotonic time when cold items are due in main request
+        self._main_cold_deadline = 0
 
         self._other_parameters = []
         for sensor in self._LIST_ARISTON_WEB_PARAMS:
             if sensor in sensors:
                 self._other_parameters.append(self._MAP_ARISTON_WEB_MENU_PARAMS[sensor])
         
-        # List of requests. First list is high priority requests and second list is low priority requests.
-        # It affects frequency of the requests
-        self._requests_lists = copy.deepcopy(self._REQUESTS_SEQUENCE)
-
+        # Periods of requests to be sent. Each period slot the most overdue request is sent.
         # If no sensors specified then no need to send the requests thus increasing frequency of fetching data for wanted sensors
-        for request, sensor_list in self._MAP_REQUEST.items():
+        self._request_periods = dict()
+        for request, period in self._REQUEST_PERIODS.items():
             if request != self._REQUEST_MAIN:
                 # Main requests cannot be removed
-                if not any(item in sensors for item in sensor_list):
-                    if request in self._requests_lists[0]:
-                        self._requests_lists[0].remove(request)
-                    if request in self._requests_lists[1]:
-                        self._requests_lists[1].remove(request)
+                if not any(item in sensors for item in self._MAP_REQUEST[request]):
+                    continue
+            if request == self._REQUEST_MAIN:
+                period = period_get_request
+            self._request_periods[request] = request_periods.get(request, period)
+        # Monotonic time when request is due, all requests are due at start
+        self._request_deadlines = {request: 0 for request in self._request_periods}
 
         # At least 1 main request is present
-        self._last_request = self._requests_lists[0][-1]
-        if self._requests_lists[1]:
-            # there are requests in low prio
-            self._last_request_low_prio = self._requests_lists[1][-1]
-        else:
-            # no requests in low prio
-            self._last_request_low_prio = None
+        self._last_request = self._REQUEST_MAIN
 
         self._subscribed = list()
-        self._subscribed_args = list()
-        self._subscribed_kwargs = list()
-        self._subscribed_thread = None
-
+        # Subscribers of specific sensors indexed by sensor name
+        self._subscribed_by_sensor = dict()
         self._subscribed2 = list()
-        self._subscribed2_args = list()
-        self._subscribed2_kwargs = list()
-        self._subscribed2_thread = None
+        self._dispatcher = AristonDispatcher(self._LOGGER)
 
         self._LOGGER.info("API initiated")
 
 
-    def subscribe_sensors(self, func, *args, **kwargs):
+    def subscribe_sensors(self, func, *args, sensors=None, event_loop=None, **kwargs):
         """
         Subscribe to change of sensors value in:
             - sensor_values
 
         Function will be called when sensors' values are being changed.
         Actual changed values are being returned as a dictionary in a first argument.
+        If 'sensors' is specified (zoned sensors by their zoned names, like 'ch_set_temperature_zone2')
+        function is called only for changes of those sensors and receives only their values.
+        Changes not yet delivered are merged into one call.
+        If 'event_loop' is specified function is called within the loop via call_soon_threadsafe.
         """
-        self._subscribed.append(func)
-        self._subscribed_args.append(args)
-        self._subscribed_kwargs.append(kwargs)
+        subscription = AristonSubscription(func, args, kwargs, event_loop)
+        if sensors is None:
+            self._subscribed.append(subscription)
+            return
+        for sensor in set(sensors):
+            if sensor not in self._ariston_sensors and sensor not in self._ZONED_SENSORS:
+                raise Exception(f"Unknown sensor {sensor}")
+        for sensor in set(sensors):
+            self._subscribed_by_sensor.setdefault(sensor, []).append(subscription)
 
 
-    def subscribe_statuses(self, func, *args, **kwargs):
+    def unsubscribe_sensors(self, func):
+        """
+        Remove all subscriptions of the function made by subscribe_sensors.
+        Lists are replaced instead of changed, so informing from another thread is not disturbed.
+        """
+        self._subscribed = [subscription for subscription in self._subscribed if subscription.func != func]
+        for sensor, subscriptions in list(self._subscribed_by_sensor.items()):
+            self._subscribed_by_sensor[sensor] = [
+                subscription for subscription in subscriptions if subscription.func != func]
+
+
+    def subscribe_statuses(self, func, *args, event_loop=None, **kwargs):
         """
         Subscribe to change of API statuses such as:
             - available
@@ -661,10 +1657,10 @@ class AristonHandler:
 
         Function will be called when statuses are being changed.
         Changed property names shall be returned as a dictionary in a first argument.
+        Changes not yet delivered are merged into one call.
+        If 'event_loop' is specified function is called within the loop via call_soon_threadsafe.
         """
-        self._subscribed2.append(func)
-        self._subscribed2_args.append(args)
-        self._subscribed2_kwargs.append(kwargs)
+        self._subscribed2.append(AristonSubscription(func, args, kwargs, event_loop))
 
 
     def _subscribers_sensors_inform(self):
@@ -674,17 +1670,23 @@ class AristonHandler:
         """
 
         changed_data = dict()
-
-        for sensor in self._ariston_sensors:
-            if self._ariston_sensors[sensor][self._VALUE] != self._subscribed_sensors_old_value[sensor]:
-                self._subscribed_sensors_old_value[sensor] = self._ariston_sensors[sensor][self._VALUE]
-                changed_data[sensor] = copy.deepcopy(self._ariston_sensors[sensor])
+        changed_by_subscription = dict()
+
+        # Whole records are compared, schedules and errors change attributes while value stays the same
+        for sensor in self._unreported_sensors:
+            record = self._sensors_snapshot[sensor]
+            if not record.same_as(self._subscribed_sensors_old_record[sensor]):
+                self._subscribed_sensors_old_record[sensor] = record
+                changed_data[sensor] = record
+                for subscription in self._subscribed_by_sensor.get(sensor, ()):
+                    changed_by_subscription.setdefault(subscription, {})[sensor] = changed_data[sensor]
+        self._unreported_sensors.clear()
 
         if changed_data:
-            for iteration in range(len(self._subscribed)):
-                self._subscribed_thread = threading.Timer(
-                    self._TIME_SPLIT, self._subscribed[iteration], args=(changed_data, *self._subscribed_args[iteration]), kwargs=self._subscribed_kwargs[iteration])
-                self._subscribed_thread.start()
+            for subscription in self._subscribed:
+                self._dispatcher.notify(subscription, changed_data)
+            for subscription, subscription_data in changed_by_subscription.items():
+                self._dispatcher.notify(subscription, subscription_data)
 
 
     def _subscribers_statuses_inform(self):
@@ -699,13 +1701,13 @@ class AristonHandler:
         self._available = self._errors <= self._MAX_ERRORS and self._login and self._plant_id != "" and self._main_data != {}
 
         if self._available and self._main_data != {} and \
-            self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, 1)][self._VALUE] != None:
+            self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, 1)].value != None:
             self._ch_available = True
         else:
             self._ch_available = False
 
         if self._available and self._main_data != {} and \
-            self._ariston_sensors[self._PARAM_DHW_SET_TEMPERATURE][self._VALUE] != None:
+            self._ariston_sensors[self._PARAM_DHW_SET_TEMPERATURE].value != None:
             self._dhw_available = True
         else:
             self._dhw_available = False
@@ -728,14 +1730,17 @@ class AristonHandler:
             changed_data['setting_data'] = self._changing_data
 
         if changed_data:
-            for iteration in range(len(self._subscribed2)):
-                self._subscribed2_thread = threading.Timer(
-                    self._TIME_SPLIT, self._subscribed2[iteration], args=(changed_data, *self._subscribed2_args[iteration]), kwargs=self._subscribed2_kwargs[iteration])
-                self._subscribed2_thread.start()
+            for subscription in self._subscribed2:
+                self._dispatcher.notify(subscription, changed_data)
 
 
-    def _json_validator(self, data, request_type):
-        json_data = data.json()
+    @staticmethod
+    def _parse_json(resp):
+        """Decode body of the reply"""
+        return _json_loads(resp.content)
+
+
+    def _json_validator(self, json_data, request_type):
         try:
             if isinstance(json_data, dict):
                 if json_data == {}:
@@ -801,17 +1806,54 @@ class AristonHandler:
 
 
     @property
-    def sensor_values(self) -> dict:
+    def sensor_values(self) -> AristonSensorSnapshot:
         """
-        Return dictionary of sensors and their values.
+        Return read-only snapshot of sensors and their values.
 
         'value' key is used to fetch value of the specific sensor/parameter.
         Some sensors/parameters might return dictionaries.
 
-        'units' key is used to fetch units of measurement for specific sensor/parameter.
+        'units' key is used to fetch units of measurement for specific sensor/parameter.
+
+        Snapshot is replaced (not modified) when new data is received,
+        its 'version' attribute increases with each published snapshot.
+        """
+        return self._sensors_snapshot
+
+
+    def get_sensor(self, sensor: str) -> Mapping:
+        """
+        Return read-only record of a single sensor from the latest snapshot.
+        Zoned sensors of zones missing in the plant have no values.
+
+        Raises KeyError for unknown sensor.
+        """
+        try:
+            return self._sensors_snapshot[sensor]
+        except KeyError:
+            if sensor in self._ZONED_SENSORS:
+                return self._EMPTY_RECORD
+            raise
+
+
+    def get_value(self, sensor: str):
+        """
+        Return value of a single sensor from the latest snapshot.
+
+        Raises KeyError for unknown sensor.
+        """
+        return self.get_sensor(sensor)[self._VALUE]
+
+
+    def get_meta(self, sensor: str) -> Mapping:
+        """
+        Return read-only metadata of a single sensor from the latest snapshot:
+        'units', 'min', 'max', 'step', 'options', 'options_text' and 'attributes'.
 
+        Raises KeyError for unknown sensor.
         """
-        return copy.deepcopy(self._ariston_sensors)
+        record = self.get_sensor(sensor)
+        return MappingProxyType({key: record[key] for key in self._META_KEYS})
 
 
     @property
@@ -820,6 +1862,18 @@ class AristonHandler:
         return self._changing_data
 
 
+    @property
+    def set_metrics(self) -> dict:
+        """
+        Return counters of parameter values:
+            - 'requested' by set_http_data;
+            - 'coalesced' replaced by a newer value before being sent;
+            - 'sent' to the server including retries.
+        """
+        with self._data_lock:
+            return dict(self._set_metrics)
+
+
     @property
     def supported_sensors_get(self) -> set:
         """
@@ -835,8 +1889,9 @@ class AristonHandler:
         Return set of all parameters that potentially can be set by API.
         Note that it is parameters supported by API, not the server, so some might be impossible to be set.
         use property 'supported_sensors_set_values' to find allowed values to be set.
+        Zoned parameters are listed for zones of the plant.
         """
-        return copy.deepcopy(self._SENSOR_SET_LIST)
+        return list(self._sensor_set_list)
 
 
     @property
@@ -853,14 +1908,18 @@ class AristonHandler:
 
         data from this property is used for 'set_http_data' method.
         """
-        sensors_dictionary = copy.deepcopy(self._ariston_sensors)
-        for parameter in self._ariston_sensors:
-            if parameter in self._SENSOR_SET_LIST:
-                del sensors_dictionary[parameter][self._VALUE]
-                del sensors_dictionary[parameter][self._UNITS]
-                del sensors_dictionary[parameter][self._ATTRIBUTES]
-            else:
-                del sensors_dictionary[parameter]
+        sensors_dictionary = dict()
+        snapshot = self._sensors_snapshot
+        for parameter in snapshot:
+            if parameter in self._sensor_set_list:
+                record = snapshot[parameter]
+                sensors_dictionary[parameter] = {
+                    self._MIN: record.min,
+                    self._MAX: record.max,
+                    self._STEP: record.step,
+                    self._OPTIONS: list(record.options) if record.options is not None else None,
+                    self._OPTIONS_TXT: list(record.options_text) if record.options_text is not None else None,
+                }
         return sensors_dictionary
 
 
@@ -872,14 +1931,18 @@ class AristonHandler:
                 timeout=timeout,
                 json=json_data,
                 verify=True)
-        except requests.exceptions.RequestException as ex:
+        except AristonTransportError as ex:
             self._LOGGER.warning(f'{error_msg} exception: {ex}')
             raise Exception(f'{error_msg} exception: {ex}')
+        self._check_post_reply(resp, error_msg)
+        return resp
+
+
+    def _check_post_reply(self, resp, error_msg=''):
         if not resp.ok:
             self._LOGGER.warning(f'{error_msg} reply code: {resp.status_code}')
             self._LOGGER.warning(f'{resp.text}')
             raise Exception(f'{error_msg} reply code: {resp.status_code}')
-        return resp
 
 
     def _request_get(self, url, timeout=_TIMEOUT_MIN, error_msg='', ignore_errors=False):
@@ -888,10 +1951,16 @@ class AristonHandler:
                 url,
                 timeout=timeout,
                 verify=True)
-        except requests.exceptions.RequestException as ex:
+        except AristonTransportError as ex:
             self._LOGGER.warning(f'{error_msg} exception: {ex}')
             if not ignore_errors:
                 raise Exception(f'{error_msg} exception: {ex}')
+            return None
+        self._check_get_reply(resp, error_msg, ignore_errors)
+        return resp
+
+
+    def _check_get_reply(self, resp, error_msg='', ignore_errors=False):
         if not resp.ok:
             log_text = True
             if resp.status_code == 500:
@@ -904,69 +1973,85 @@ class AristonHandler:
                             self._LOGGER.error(f'Unsupported sensor {sensor} detected with menu item {menu_item}')
                             self._other_parameters.remove(menu_item)
                             if not self._other_parameters:
-                                self._requests_lists[0].remove(self._REQUEST_ADDITIONAL)
+                                self._request_periods.pop(self._REQUEST_ADDITIONAL, None)
                             log_text = False
             self._LOGGER.warning(f'{error_msg} reply code: {resp.status_code}')
             if log_text:
                 self._LOGGER.warning(f'{resp.text}')
             if not ignore_errors:
                 raise Exception(f'{error_msg} reply code: {resp.status_code}')
-        return resp
 
 
     def _login_session(self):
         """Login to fetch Ariston Plant ID and confirm login"""
         if not self._login and self._started:
             # First login
-            login_data = {
-                "email": self._user,
-                "password": self._password,
-                "rememberMe": False,
-                "language": "English_Us"
-                }
             self._request_post(
-                url=f'{self._ARISTON_URL}/R2/Account/Login?returnUrl=%2FR2%2FHome',
-                json_data=login_data,
+                url=f'{self._ARISTON_URL}{self._URL_LOGIN}',
+                json_data=self._login_data(),
                 error_msg='Login'
             )
 
             # Fetch plant IDs
             resp = self._request_get(
-                url=f'{self._ARISTON_URL}/api/v2/remote/plants/lite',
+                url=f'{self._ARISTON_URL}{self._URL_GATEWAYS}',
                 error_msg='Gateways'
             )
-            gateways = [item['gwId'] for item in resp.json()]
-            if self._default_gw:
-                if self._default_gw not in gateways:
-                    self._LOGGER.error(f'Specified gateway {self._default_gw} not found in {gateways}')
-                    raise Exception(f'Specified gateway {self._default_gw} not found in {gateways}')
-                else:
-                    plant_id = self._default_gw
-            else:
-                if len(gateways) == 0:
-                    self._LOGGER.error(f'At least one gateway is expected to be found')
-                    raise Exception(f'At least one gateway is expected to be found')
-                # Use first plant plant id
-                plant_id = gateways[0]
+            plant_id = self._select_plant(resp)
             resp = self._request_get(
-                url=f'{self._ARISTON_URL}/api/v2/remote/plants/{plant_id}/features?eagerMode=True',
+                url=f'{self._ARISTON_URL}{self._URL_FEATURES.format(plant_id)}',
                 error_msg='Features'
             )
-            features = resp.json()
-            if plant_id:
-                with self._plant_id_lock:
-                    self._features = copy.deepcopy(features)
-                    if self._features["zones"]:
-                        self._zones = [item["num"] for item in self._features["zones"]]
-                    self._plant_id = plant_id
-                    self._gw_name = plant_id + '_'
-                    self._login = True
-                    self._LOGGER.info(f'Plant ID is {self._plant_id}')
+            self._store_login(plant_id, self._parse_json(resp))
         return
 
 
-    def _get_visible_sensor_value(self, sensor):
-        value = self._get_sensor_value(sensor)
+    def _login_data(self):
+        return {
+            "email": self._user,
+            "password": self._password,
+            "rememberMe": False,
+            "language": "English_Us"
+            }
+
+
+    def _select_plant(self, resp):
+        """Plant ID to be used from the reply with gateways"""
+        gateways = [item['gwId'] for item in self._parse_json(resp)]
+        if self._default_gw:
+            if self._default_gw not in gateways:
+                self._LOGGER.error(f'Specified gateway {self._default_gw} not found in {gateways}')
+                raise Exception(f'Specified gateway {self._default_gw} not found in {gateways}')
+            else:
+                plant_id = self._default_gw
+        else:
+            if len(gateways) == 0:
+                self._LOGGER.error(f'At least one gateway is expected to be found')
+                raise Exception(f'At least one gateway is expected to be found')
+            # Use first plant plant id
+            plant_id = gateways[0]
+        return plant_id
+
+
+    def _store_login(self, plant_id, features):
+        """Store features of the plant and confirm login"""
+        if plant_id:
+            with self._plant_id_lock:
+                self._features = features
+                self._main_requests = {}
+                self._main_cold_deadline = 0
+                if self._features["zones"]:
+                    self._zones = [item["num"] for item in self._features["zones"]]
+                self._plant_id = plant_id
+                self._gw_name = plant_id + '_'
+                self._login = True
+                self._LOGGER.info(f'Plant ID is {self._plant_id}')
+            with self._data_lock:
+                self._size_sensors_to_zones(self._zones)
+
+
+    def _get_visible_sensor_value(self, sensor, value):
+        """Value to be shown taking into account values being set"""
         if sensor in self._set_param:
             if value == self._set_param[sensor][self._VALUE]:
                 # Value is assumed to be set
@@ -980,36 +2065,55 @@ class AristonHandler:
         return value
 
 
+    @classmethod
+    def _option_text(cls, options, options_text, value):
+        """Text of the option value using cached value to text mapping"""
+        key = (options, options_text)
+        mapping = cls._OPTION_TEXT_MAPS.get(key)
+        if mapping is None:
+            mapping = dict(zip(options, options_text))
+            cls._OPTION_TEXT_MAPS[key] = mapping
+        return mapping[value]
+
+    def _decode_main_item(self, item):
+        """Value of Android api item"""
+        value = item["value"]
+        if "options" in item:
+            options = self._intern_options(item["options"])
+            if "optTexts" in item:
+                value = self._option_text(options, self._intern_options(item["optTexts"]), int(value))
+            elif item["options"] == self._OFF_ON_NUMERAL:
+                value = self._option_text(options, self._intern_options(self._OFF_ON_TEXT), int(value))
+            elif int(value) not in options:
+                raise ValueError(f'{value} is not in options')
+        return value
+
+    def _decode_additional_item(self, item):
+        """Value of Web menu item"""
+        value = item["value"]
+        if "dropDownOptions" in item and item["dropDownOptions"]:
+            for option in item["dropDownOptions"]:
+                if option["value"] == item["value"]:
+                    value = option["text"]
+                    break
+        return value
+
     def _get_sensor_value(self, sensor):
         value = None
         request_type = self._get_request_for_parameter(sensor)
         if request_type == self._REQUEST_MAIN:
-            original_sensor, zone = self._zone_sensor_split(sensor)
-            for item in self._main_data["items"]:
-                if original_sensor == self._MAP_ARISTON_API_TO_PARAM[item["id"]] and zone == item["zone"]:
-                    value = item["value"]
-                    if "options" in item:
-                        use_index = item["options"].index(int(item["value"]))
-                        if "optTexts" in item:
-                            value = item["optTexts"][use_index]
-                        elif item["options"] == self._OFF_ON_NUMERAL:
-                            value = self._OFF_ON_TEXT[use_index]
-                    break
+            item = self._main_index.get(self._MAP_SENSOR_TO_API_ITEM.get(sensor))
+            if item is not None:
+                value = self._decode_main_item(item)
         elif request_type == self._REQUEST_ADDITIONAL:
-            for item in self._additional_data["data"]:
-                if sensor == self._MAP_ARISTON_WEB_TO_PARAM[item["id"]]:
-                    value = item["value"]
-                    if "dropDownOptions" in item and item["dropDownOptions"]:
-                        for option in item["dropDownOptions"]:
-                            if option["value"] == item["value"]:
-                                value = option["text"]
-                                break
-                    break
+            item = self._additional_index.get(self._MAP_ARISTON_WEB_MENU_PARAMS[sensor])
+            if item is not None:
+                value = self._decode_additional_item(item)
         if sensor == self._PARAM_DHW_FLAME:
             value = None
             try:
                 increase_dhw_temp = None
-                new_value = self._ariston_sensors[self._PARAM_DHW_STORAGE_TEMPERATURE][self._VALUE]
+                new_value = self._ariston_sensors[self._PARAM_DHW_STORAGE_TEMPERATURE].value
                 if new_value:
                     increase_dhw_temp = False
                     if self._last_dhw_storage_temp is not None and \
@@ -1024,12 +2128,12 @@ class AristonHandler:
                 increase_dhw_temp = None
             ch_flame = None
             for zone in self._zones:
-                ch_flame_zone = self._ariston_sensors[self._zone_sensor_name(self._PARAM_FLAME, zone)][self._VALUE]
+                ch_flame_zone = self._ariston_sensors[self._zone_sensor_name(self._PARAM_FLAME, zone)].value
                 if ch_flame_zone in self._OFF_ON_TEXT:
                     if ch_flame is None or ch_flame == self._OFF:
                         ch_flame = ch_flame_zone
-            if self._ariston_sensors[self._PARAM_FLAME][self._VALUE] in self._OFF_ON_TEXT and ch_flame in self._OFF_ON_TEXT:
-                if self._ariston_sensors[self._PARAM_FLAME][self._VALUE] == self._OFF:
+            if self._ariston_sensors[self._PARAM_FLAME].value in self._OFF_ON_TEXT and ch_flame in self._OFF_ON_TEXT:
+                if self._ariston_sensors[self._PARAM_FLAME].value == self._OFF:
                     value = self._OFF
                 elif ch_flame == self._OFF:
                     value = self._ON
@@ -1054,37 +2158,46 @@ class AristonHandler:
         return attributes
 
 
-    def _store_data(self, resp, request_type=""):
-        """Store received dictionary"""
-        if not self._json_validator(resp, request_type):
+    def _store_data(self, resp, request_type="", partial=False):
+        """
+        Store received dictionary.
+        Partial main or additional reply updates only received items, other items are kept from previous replies.
+        """
+        data = self._parse_json(resp)
+        if not self._json_validator(data, request_type):
             self._LOGGER.warning(f"JSON did not pass validation for the request {request_type}")
             raise Exception(f"JSON did not pass validation for the request {request_type}")
 
         if request_type == self._REQUEST_MAIN:
 
-            self._main_data = copy.deepcopy(resp.json())
-            for item in self._main_data["items"]:
+            self._main_data = data
+            main_index = {(item["id"], item["zone"]): item for item in self._main_data["items"]}
+            if partial:
+                self._main_index = {**self._main_index, **main_index}
+            else:
+                self._main_index = main_index
+            # Only received items are decoded, sensors of cold items missing in partial reply keep their records
+            for key, item in main_index.items():
                 try:
-                    original_sensor = self._MAP_ARISTON_API_TO_PARAM[item["id"]]
-                    zone = item["zone"]
-                    sensor = self._zone_sensor_name(original_sensor, zone=zone)
+                    sensor = self._MAP_API_ITEM_TO_SENSOR[key]
                     self._ariston_sensors[sensor]
+                    self._dirty_sensors.add(sensor)
                     try:
-                        self._ariston_sensors[sensor][self._VALUE] = self._get_visible_sensor_value(sensor)
+                        self._ariston_sensors[sensor].value = self._get_visible_sensor_value(sensor, self._decode_main_item(item))
                         if "min" in item:
-                            self._ariston_sensors[sensor][self._MIN] = item["min"]
+                            self._ariston_sensors[sensor].min = item["min"]
                         if "max" in item:
-                            self._ariston_sensors[sensor][self._MAX] = item["max"]
+                            self._ariston_sensors[sensor].max = item["max"]
                         if "step" in item:
-                            self._ariston_sensors[sensor][self._STEP] = item["step"]
+                            self._ariston_sensors[sensor].step = item["step"]
                         if "unit" in item and item["unit"]:
-                            self._ariston_sensors[sensor][self._UNITS] = item["unit"]
+                            self._ariston_sensors[sensor].units = item["unit"]
                         if "options" in item:
-                            self._ariston_sensors[sensor][self._OPTIONS] = copy.deepcopy(item["options"])
+                            self._ariston_sensors[sensor].options = self._intern_options(item["options"])
                             if "optTexts" in item:
-                                self._ariston_sensors[sensor][self._OPTIONS_TXT] = copy.deepcopy(item["optTexts"])
+                                self._ariston_sensors[sensor].options_text = self._intern_options(item["optTexts"])
                             elif item["options"] == self._OFF_ON_NUMERAL:
-                                self._ariston_sensors[sensor][self._OPTIONS_TXT] = self._OFF_ON_TEXT
+                                self._ariston_sensors[sensor].options_text = self._intern_options(self._OFF_ON_TEXT)
                     except Exception as ex:
                         self._LOGGER.warn(f"Issue reading {request_type} {sensor} {ex}")
                         self._reset_sensor(sensor)
@@ -1095,82 +2208,93 @@ class AristonHandler:
 
             # Extrapolate DHW Flame
             sensor = self._PARAM_DHW_FLAME
-            dhw_flame = self._get_visible_sensor_value(sensor)
-            self._ariston_sensors[sensor][self._VALUE] = dhw_flame
+            self._dirty_sensors.add(sensor)
+            dhw_flame = self._get_visible_sensor_value(sensor, self._get_sensor_value(sensor))
+            self._ariston_sensors[sensor].value = dhw_flame
             if dhw_flame:
-                self._ariston_sensors[sensor][self._OPTIONS] = self._OFF_ON_NUMERAL
-                self._ariston_sensors[sensor][self._OPTIONS_TXT] = self._OFF_ON_TEXT
+                self._ariston_sensors[sensor].options = self._intern_options(self._OFF_ON_NUMERAL)
+                self._ariston_sensors[sensor].options_text = self._intern_options(self._OFF_ON_TEXT)
             else:
-                self._ariston_sensors[sensor][self._OPTIONS] = None
-                self._ariston_sensors[sensor][self._OPTIONS_TXT] = None
+                self._ariston_sensors[sensor].options = None
+                self._ariston_sensors[sensor].options_text = None
 
             # Fix min and Max for CH set temperature
             for zone in self._zones:
-                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)][self._MIN] = \
-                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._MIN]
-                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)][self._MAX] = \
-                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._MAX]
-                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)][self._STEP] = \
-                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._STEP]
+                self._dirty_sensors.add(self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone))
+                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)].min = \
+                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)].min
+                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)].max = \
+                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)].max
+                self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)].step = \
+                    self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)].step
 
         elif request_type == self._REQUEST_ERRORS:
 
-            self._error_data = copy.deepcopy(resp.json())
+            self._error_data = data
             sensor = self._PARAM_ERRORS_COUNT
+            self._dirty_sensors.add(sensor)
             try:
                 # TEST DATA BELOW FOR PARSING PURPOSES
                 # self._error_data = [{"gw":"F0AD4E0590BD","timestamp":"2022-07-14T10:55:04","fault":45,"mult":0,"code":"501","pri":1053500,"errDex":"No flame detected","res":False,"blk":True}]
-                self._ariston_sensors[sensor][self._VALUE] = len(self._error_data)
+                self._ariston_sensors[sensor].value = len(self._error_data)
                 attributes = {}
                 for index, item in enumerate(self._error_data):
                     attributes[f'Error_{index+1}'] = f'{item["timestamp"]}, {item["errDex"]}'
-                self._ariston_sensors[sensor][self._ATTRIBUTES] = attributes
+                self._ariston_sensors[sensor].attributes = attributes
             except Exception as ex:
                 self._LOGGER.warn(f'Issue reading {request_type} {sensor}, {ex}')
                 self._reset_sensor(sensor)
 
         elif request_type == self._REQUEST_CH_SCHEDULE:
 
-            self._ch_schedule_data = copy.deepcopy(resp.json())
+            self._ch_schedule_data = data
             sensor = self._PARAM_CH_PROGRAM
+            self._dirty_sensors.add(sensor)
             try:
-                self._ariston_sensors[sensor][self._VALUE] = "Available"
-                self._ariston_sensors[sensor][self._ATTRIBUTES] = self._schedule_attributes(self._ch_schedule_data["ChZn1"]["plans"])
+                self._ariston_sensors[sensor].value = "Available"
+                self._ariston_sensors[sensor].attributes = self._schedule_attributes(self._ch_schedule_data["ChZn1"]["plans"])
             except Exception as ex:
                 self._LOGGER.warn(f'Issue reading {request_type} {sensor}, {ex}')
                 self._reset_sensor(sensor)
 
         elif request_type == self._REQUEST_DHW_SCHEDULE:
 
-            self._dhw_schedule_data = copy.deepcopy(resp.json())
+            self._dhw_schedule_data = data
             sensor = self._PARAM_DHW_PROGRAM
+            self._dirty_sensors.add(sensor)
             try:
-                self._ariston_sensors[sensor][self._VALUE] = "Available"
-                self._ariston_sensors[sensor][self._ATTRIBUTES] = self._schedule_attributes(self._dhw_schedule_data["Dhw"]["plans"])
+                self._ariston_sensors[sensor].value = "Available"
+                self._ariston_sensors[sensor].attributes = self._schedule_attributes(self._dhw_schedule_data["Dhw"]["plans"])
             except Exception as ex:
                 self._LOGGER.warn(f'Issue reading {request_type} {sensor}, {ex}')
                 self._reset_sensor(sensor)
 
         elif request_type == self._REQUEST_ADDITIONAL:
             
-            self._additional_data = copy.deepcopy(resp.json())
-            for item in self._additional_data["data"]:
+            self._additional_data = data
+            additional_index = {item["id"]: item for item in self._additional_data["data"]}
+            if partial:
+                self._additional_index = {**self._additional_index, **additional_index}
+            else:
+                self._additional_index = additional_index
+            for item_id, item in self._additional_index.items():
                 try:
-                    sensor = self._MAP_ARISTON_WEB_TO_PARAM[item["id"]]
+                    sensor = self._MAP_ARISTON_WEB_TO_PARAM[item_id]
                     self._ariston_sensors[sensor]
+                    self._dirty_sensors.add(sensor)
                     try:
-                        self._ariston_sensors[sensor][self._VALUE] = self._get_visible_sensor_value(sensor)
+                        self._ariston_sensors[sensor].value = self._get_visible_sensor_value(sensor, self._decode_additional_item(item))
                         if "min" in item:
-                            self._ariston_sensors[sensor][self._MIN] = item["min"]
+                            self._ariston_sensors[sensor].min = item["min"]
                         if "max" in item:
-                            self._ariston_sensors[sensor][self._MAX] = item["max"]
+                            self._ariston_sensors[sensor].max = item["max"]
                         if "increment" in item:
-                            self._ariston_sensors[sensor][self._STEP] = item["increment"]
+                            self._ariston_sensors[sensor].step = item["increment"]
                         if "unitLabel" in item and item["unitLabel"]:
-                            self._ariston_sensors[sensor][self._UNITS] = item["unitLabel"]
+                            self._ariston_sensors[sensor].units = item["unitLabel"]
                         if "dropDownOptions" in item and item["dropDownOptions"]:
-                            self._ariston_sensors[sensor][self._OPTIONS] = [option["value"] for option in item["dropDownOptions"]]
-                            self._ariston_sensors[sensor][self._OPTIONS_TXT] = [option["text"] for option in item["dropDownOptions"]]
+                            self._ariston_sensors[sensor].options = self._intern_options([option["value"] for option in item["dropDownOptions"]])
+                            self._ariston_sensors[sensor].options_text = self._intern_options([option["text"] for option in item["dropDownOptions"]])
                     except Exception as ex:
                         self._LOGGER.warn(f"Issue reading {request_type} {sensor} {ex}")
                         self._reset_sensor(sensor)
@@ -1181,7 +2305,7 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_LAST_MONTH:
 
-            self._last_month_data = copy.deepcopy(resp.json())
+            self._last_month_data = data
             self._reset_sensor(self._PARAM_CH_LAST_MONTH_GAS)
             self._reset_sensor(self._PARAM_CH_LAST_MONTH_ELECTRICITY)
             self._reset_sensor(self._PARAM_DHW_LAST_MONTH_GAS)
@@ -1191,21 +2315,21 @@ class AristonHandler:
                     if item["use"] == 1:
                         if "gas" in item:
                             sensor = self._PARAM_CH_LAST_MONTH_GAS
-                            self._ariston_sensors[sensor][self._VALUE] = item["gas"]
-                            self._ariston_sensors[sensor][self._UNITS] = self._UNIT_KWH
+                            self._ariston_sensors[sensor].value = item["gas"]
+                            self._ariston_sensors[sensor].units = self._UNIT_KWH
                         if "elect" in item:
                             sensor = self._PARAM_CH_LAST_MONTH_ELECTRICITY
-                            self._ariston_sensors[sensor][self._VALUE] = item["elect"]
-                            self._ariston_sensors[sensor][self._UNITS] = self._UNIT_KWH
+                            self._ariston_sensors[sensor].value = item["elect"]
+                            self._ariston_sensors[sensor].units = self._UNIT_KWH
                     if item["use"] == 2:
                         if "gas" in item:
                             sensor = self._PARAM_DHW_LAST_MONTH_GAS
-                            self._ariston_sensors[sensor][self._VALUE] = item["gas"]
-                            self._ariston_sensors[sensor][self._UNITS] = self._UNIT_KWH
+                            self._ariston_sensors[sensor].value = item["gas"]
+                            self._ariston_sensors[sensor].units = self._UNIT_KWH
                         if "elect" in item:
                             sensor = self._PARAM_DHW_LAST_MONTH_ELECTRICITY
-                            self._ariston_sensors[sensor][self._VALUE] = item["elect"]
-                            self._ariston_sensors[sensor][self._UNITS] = self._UNIT_KWH
+                            self._ariston_sensors[sensor].value = item["elect"]
+                            self._ariston_sensors[sensor].units = self._UNIT_KWH
                 except Exception as ex:
                     self._LOGGER.warn(f'Issue reading {request_type} {item["use"]} for last month, {ex}')
                     continue
@@ -1218,13 +2342,14 @@ class AristonHandler:
                 sum_energy_new = 0
                 for item in self._energy_use_data:
                     sum_energy_old += sum(item['v'])
-                for item in resp.json():
+                for item in data:
                     sum_energy_new += sum(item['v'])
                 if sum_energy_old > 0 and sum_energy_new == 0:
                     # if non-zero values are present and new value is zero - ignore it 
                     return
 
-            self._energy_use_data = copy.deepcopy(resp.json())
+            self._energy_use_data = data
+            self._dirty_sensors.update(self._LIST_ENERGY)
             this_month = datetime.date.today().month
             this_year = datetime.date.today().year
             this_day = datetime.date.today().day
@@ -1245,20 +2370,20 @@ class AristonHandler:
                 this_2hour = this_hour + 2
             try:
                 (
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     CH_ENERGY,
@@ -1268,13 +2393,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for CH, {ex}')
                 self._reset_sensor(self._PARAM_CH_ENERGY_TODAY)
@@ -1286,20 +2411,20 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_CH_ENERGY_LAST_YEAR)
             try:
                 (
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     DHW_ENERGY,
@@ -1309,13 +2434,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for DHW, {ex}')
                 self._reset_sensor(self._PARAM_DHW_ENERGY_TODAY)
@@ -1327,20 +2452,20 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_DHW_ENERGY_LAST_YEAR)
             try:
                 (
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     CH_ENERGY2,
@@ -1350,13 +2475,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY2_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for CH 2, {ex}')
                 self._reset_sensor(self._PARAM_CH_ENERGY2_TODAY)
@@ -1368,20 +2493,20 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_CH_ENERGY2_LAST_YEAR)
             try:
                 (
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     DHW_ENERGY2,
@@ -1391,13 +2516,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY2_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for DHW 2, {ex}')
                 self._reset_sensor(self._PARAM_DHW_ENERGY2_TODAY)
@@ -1409,20 +2534,20 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_DHW_ENERGY2_LAST_YEAR)
             try:
                 (
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     CH_ENERGY_DELTA,
@@ -1432,13 +2557,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_CH_ENERGY_DELTA_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for CH 2, {ex}')
                 self._reset_sensor(self._PARAM_CH_ENERGY_DELTA_TODAY)
@@ -1450,20 +2575,20 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_CH_ENERGY_DELTA_LAST_YEAR)
             try:
                 (
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR][self._VALUE],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR][self._ATTRIBUTES],
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR][self._ATTRIBUTES],
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR].value,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR].attributes,
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR].attributes,
                     found_key,
                 ) = self._get_energy_data(
                     DHW_ENERGY_DELTA,
@@ -1473,13 +2598,13 @@ class AristonHandler:
                     this_day_week=this_day_week,
                     this_2hour=this_2hour)
                 if found_key:
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR][self._UNITS] = self._UNIT_KWH
-                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR][self._UNITS] = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_TODAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_YESTERDAY].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_7_DAYS].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_MONTH].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR].units = self._UNIT_KWH
+                    self._ariston_sensors[self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR].units = self._UNIT_KWH
             except Exception as ex:
                 self._LOGGER.warn(f'Issue handling energy used for DHW 2, {ex}')
                 self._reset_sensor(self._PARAM_DHW_ENERGY_DELTA_TODAY)
@@ -1490,6 +2615,7 @@ class AristonHandler:
                 self._reset_sensor(self._PARAM_DHW_ENERGY_DELTA_THIS_YEAR)
                 self._reset_sensor(self._PARAM_DHW_ENERGY_DELTA_LAST_YEAR)
 
+        self._publish_sensors()
         self._subscribers_sensors_inform()
 
 
@@ -1633,96 +2759,86 @@ class AristonHandler:
     def _get_http_data(self, request_type=""):
         """Common fetching of http data"""
         self._login_session()
-        if self._login and self._plant_id != "":
-
-            if request_type == self._REQUEST_MAIN:
-
-                request_data = {
-                    "useCache": False,
-                    "items": [],
-                    "features": self._features
-                    }
-                for param in self._MAP_ARISTON_ZONE_0_PARAMS.values():
-                    request_data['items'].append({"id": param, "zn":0})
-                if self._zones:
-                    for zone in self._zones:
-                        for param in self._MAP_ARISTON_MULTIZONE_PARAMS.values():
-                            request_data['items'].append({"id": param, "zn":zone})
-                with self._data_lock:
-                    resp = self._request_post(
-                        url=f'{self._ARISTON_URL}/api/v2/remote/dataItems/{self._plant_id}/get?umsys=si',
-                        json_data=request_data,
-                        timeout=self._TIMEOUT_MAX,
-                        error_msg="Main read"
-                    )
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_ERRORS:
-
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/api/v2/busErrors?gatewayId={self._plant_id}&blockingOnly=False&culture=en-US',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="Errors read"
-                    )
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_CH_SCHEDULE:
-
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/api/v2/remote/timeProgs/{self._plant_id}/ChZn1?umsys=si',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="CH Schedule read"
-                    )
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_DHW_SCHEDULE:
-
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/api/v2/remote/timeProgs/{self._plant_id}/Dhw?umsys=si',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="DHW Schedule read"
-                    )
-                    self._store_data(resp, request_type)
+        read = self._read_request(request_type)
+        if read:
+            method, url, json_data, timeout, error_msg, cold = read
+            if method == "post":
+                resp = self._request_post(url=url, json_data=json_data, timeout=timeout, error_msg=error_msg)
+            else:
+                resp = self._request_get(url=url, timeout=timeout, error_msg=error_msg)
+            self._store_read(resp, request_type, cold)
+        self._LOGGER.info(f'Data read for {request_type}')
+        return True
 
-            elif request_type == self._REQUEST_ADDITIONAL:
 
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/R2/PlantMenu/Refresh?id={self._plant_id}&paramIds={",".join(self._other_parameters)}',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="Additional data read"
-                    )
-                    self._store_data(resp, request_type)
+    def _read_request(self, request_type):
+        """
+        Read request as tuple (method, url, json data, timeout, error message, cold) for the request type.
+        Cold is False only for main request without cold items. None is returned for unknown request type.
+        """
+        if not self._login or self._plant_id == "":
+            self._LOGGER.warning(f"Not properly logged in to read {request_type}")
+            raise Exception(f"Not properly logged in to read {request_type}")
 
-            elif request_type == self._REQUEST_LAST_MONTH:
+        if request_type == self._REQUEST_MAIN:
+            # Cold items are fetched periodically and while parameters are being set
+            cold = self._set_requests[self._REQUEST_MAIN] or time.monotonic() >= self._main_cold_deadline
+            return (
+                "post",
+                f'{self._ARISTON_URL}/api/v2/remote/dataItems/{self._plant_id}/get?umsys=si',
+                self._main_request(cold),
+                self._TIMEOUT_MAX,
+                "Main read",
+                cold
+            )
 
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/api/v2/remote/reports/{self._plant_id}/energyAccount',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="Last month data read"
-                    )
-                    self._store_data(resp, request_type)
+        if request_type == self._REQUEST_ERRORS:
+            url = f'{self._ARISTON_URL}/api/v2/busErrors?gatewayId={self._plant_id}&blockingOnly=False&culture=en-US'
+            error_msg = "Errors read"
+        elif request_type == self._REQUEST_CH_SCHEDULE:
+            url = f'{self._ARISTON_URL}/api/v2/remote/timeProgs/{self._plant_id}/ChZn1?umsys=si'
+            error_msg = "CH Schedule read"
+        elif request_type == self._REQUEST_DHW_SCHEDULE:
+            url = f'{self._ARISTON_URL}/api/v2/remote/timeProgs/{self._plant_id}/Dhw?umsys=si'
+            error_msg = "DHW Schedule read"
+        elif request_type == self._REQUEST_ADDITIONAL:
+            url = f'{self._ARISTON_URL}/R2/PlantMenu/Refresh?id={self._plant_id}&paramIds={",".join(self._other_parameters)}'
+            error_msg = "Additional data read"
+        elif request_type == self._REQUEST_LAST_MONTH:
+            url = f'{self._ARISTON_URL}/api/v2/remote/reports/{self._plant_id}/energyAccount'
+            error_msg = "Last month data read"
+        elif request_type == self._REQUEST_ENERGY:
+            url = f'{self._ARISTON_URL}/api/v2/remote/reports/{self._plant_id}/consSequencesApi8?usages=Ch%2CDhw&hasSlp=False'
+            error_msg = "Energy data read"
+        else:
+            return None
+        return "get", url, None, self._TIMEOUT_AV, error_msg, True
 
-            elif request_type == self._REQUEST_ENERGY:
 
-                with self._data_lock:
-                    resp = self._request_get(
-                        url=f'{self._ARISTON_URL}/api/v2/remote/reports/{self._plant_id}/consSequencesApi8?usages=Ch%2CDhw&hasSlp=False',
-                        timeout=self._TIMEOUT_AV,
-                        error_msg="Energy data read"
-                    )
-                    self._store_data(resp, request_type)
+    def _store_read(self, resp, request_type, cold=True):
+        """Store reply of read request"""
+        with self._data_lock:
+            self._store_data(resp, request_type, partial=not cold)
+            if request_type == self._REQUEST_MAIN and cold:
+                self._main_cold_deadline = time.monotonic() + self._MAIN_COLD_PERIOD
 
-        else:
-            self._LOGGER.warning(f"Not properly logged in to read {request_type}")
-            raise Exception(f"Not properly logged in to read {request_type}")
-        self._LOGGER.info(f'Data read for {request_type}')
-        return True
 
+    def _main_request(self, cold=True):
+        """Body of main request with configured items only, cold items are included if requested"""
+        request_data = self._main_requests.get(cold)
+        if request_data is None:
+            items = [{"id": param, "zn": 0} for param in self._main_zone_0_items
+                     if cold or param not in self._MAIN_COLD_ITEMS]
+            for zone in self._zones:
+                items.extend({"id": param, "zn": zone} for param in self._main_zone_items
+                             if cold or param not in self._MAIN_COLD_ITEMS)
+            request_data = {
+                "useCache": False,
+                "items": items,
+                "features": self._features
+                }
+            self._main_requests[cold] = request_data
+        return request_data
 
     def _queue_get_data(self):
         """Queue all request items"""
@@ -1737,11 +2853,11 @@ class AristonHandler:
             self._timer_periodic_read.cancel()
             if not self.available or self._errors > 0:
                 # Initial or error situation, use main request
-                if self.available and self._last_request == self._REQUEST_ADDITIONAL and self._last_request in self._requests_lists[0]:
+                if self.available and self._last_request == self._REQUEST_ADDITIONAL and self._last_request in self._request_periods:
                     # Potential error with parameters where they are removed 1 by 1 request
                     request_to_send = self._last_request
                 else:
-                    request_to_send = self._requests_lists[0][0]
+                    request_to_send = self._REQUEST_MAIN
             else:
                 if self._set_requests[self._REQUEST_MAIN]:
                     # Changing parameters
@@ -1749,36 +2865,37 @@ class AristonHandler:
                 elif self._set_requests[self._REQUEST_ADDITIONAL]:
                     # Changing parameters
                     request_to_send = self._REQUEST_ADDITIONAL
-                elif self._last_request in self._requests_lists[0]:
-                    # High prio more frequent (e.g. current temperatures, flame, errors)
-                    last_index = self._requests_lists[0].index(self._last_request)
-                    if len(self._requests_lists[0]) <= last_index + 1:
-                        # Last request was the last item
-                        if self._requests_lists[1]:
-                            # There are requests
-                            last_index_low_prio = self._requests_lists[1].index(self._last_request_low_prio)
-                            if len(self._requests_lists[1]) <= last_index_low_prio + 1:
-                                # Last request in low prio item
-                                request_to_send = self._requests_lists[1][0]
-                            else:
-                                request_to_send = self._requests_lists[1][last_index_low_prio + 1]
-                            self._last_request_low_prio = request_to_send
-                        else:
-                            # No low prio requests
-                            request_to_send = self._requests_lists[0][0]
-                    else:
-                        request_to_send = self._requests_lists[0][last_index + 1]
                 else:
-                    # Low prio less frequent requests (e.g. energy use)
-                    request_to_send = self._requests_lists[0][0]
-            self._last_request = request_to_send
+                    # Most overdue request, none if no request is due yet
+                    request_to_send = self._most_overdue_request()
+            if request_to_send:
+                self._last_request = request_to_send
+                self._request_deadlines[request_to_send] = time.monotonic() + self._request_periods.get(
+                    request_to_send, self._REQUEST_PERIODS[request_to_send])
 
             if self._started:
-                self._LOGGER.info(f'Shall send next request in {retry_in} seconds, current request is {request_to_send}')
-                self._timer_queue_delay = threading.Timer(self._TIME_SPLIT, self._control_availability_state, [request_to_send])
-                self._timer_queue_delay.start()
-                self._timer_periodic_read = threading.Timer(retry_in, self._queue_get_data)
-                self._timer_periodic_read.start()
+                self._timer_periodic_read = self._scheduler.schedule(retry_in, self._queue_get_data)
+                if request_to_send:
+                    self._LOGGER.info(f'Shall send next request in {retry_in} seconds, current request is {request_to_send}')
+                    self._timer_queue_delay = self._scheduler.schedule(self._TIME_SPLIT, self._control_availability_state, [request_to_send])
+                else:
+                    self._LOGGER.info(f'Shall send next request in {retry_in} seconds, no request is due')
+
+
+    def _most_overdue_request(self):
+        """
+        Request which is overdue the most or None if no request is due.
+        Overdue time is relative to the period of the request, so frequent requests are not delayed by rare ones.
+        """
+        now = time.monotonic()
+        request_to_send = None
+        most_overdue = 0
+        for request, period in self._request_periods.items():
+            overdue = (now - self._request_deadlines[request]) / period
+            if overdue > most_overdue or (request_to_send is None and overdue >= 0):
+                request_to_send = request
+                most_overdue = overdue
+        return request_to_send
                 
 
     def _error_detected(self):
@@ -1804,6 +2921,55 @@ class AristonHandler:
             self._LOGGER.info("No more errors")
 
 
+    def _create_transport(self, transport):
+        """Transport to send requests with, wrapped to write capture file if it is enabled"""
+        if transport is None:
+            transport = AristonRequestsTransport()
+        if self._capture is not None:
+            transport = AristonCaptureTransport(transport, self._capture)
+        return transport
+
+
+    @classmethod
+    def _get_executor(cls, purpose=_EXECUTOR_READ):
+        """
+        Thread pool to send independent requests concurrently, reads and set requests use separate pools.
+        Pools are shared by all handlers, so number of threads does not grow with number of plants.
+        """
+        with AristonHandler._shared_executor_lock:
+            executor = AristonHandler._shared_executors.get(purpose)
+            if executor is None:
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=cls._MAX_WORKERS, thread_name_prefix=f"ariston_{purpose}")
+                AristonHandler._shared_executors[purpose] = executor
+            return executor
+
+
+    def _startup_requests(self):
+        """
+        Fetch data of all enabled requests at start, then continue with periodic requests.
+        Login and main request go first, other requests are independent and are sent concurrently.
+        """
+        self._control_availability_state(self._REQUEST_MAIN)
+        sent_requests = [self._REQUEST_MAIN]
+        if self._started and self.available:
+            other_requests = [request for request in self._request_periods if request != self._REQUEST_MAIN]
+            list(self._get_executor().map(self._control_availability_state, other_requests))
+            sent_requests.extend(other_requests)
+        self._startup_done(sent_requests)
+
+
+    def _startup_done(self, sent_requests):
+        """Set deadlines of requests sent at start and schedule periodic requests"""
+        with self._data_lock:
+            now = time.monotonic()
+            for request in sent_requests:
+                self._request_deadlines[request] = now + self._request_periods.get(
+                    request, self._REQUEST_PERIODS[request])
+            if self._started:
+                self._timer_periodic_read = self._scheduler.schedule(self._get_period_time, self._queue_get_data)
+
+
     def _control_availability_state(self, request_type=""):
         """Control component availability"""
         try:
@@ -1821,182 +2987,271 @@ class AristonHandler:
     def _preparing_setting_http_data(self):
         """Preparing and setting http data"""
         self._login_session()
+        requests_to_send = self._set_requests_to_send()
+        if requests_to_send is None:
+            return
+
+        # Network requests to different endpoints are sent concurrently without locking the data
+        executor = self._get_executor(self._EXECUTOR_SET)
+        futures = dict()
+        for url, (request_parameters, json_data, error_msg) in requests_to_send.items():
+            future = executor.submit(
+                self._request_post,
+                url=url,
+                json_data=json_data,
+                error_msg=error_msg,
+                timeout=self._TIMEOUT_AV
+            )
+            futures[future] = request_parameters
+        sent_parameters = []
+        failed_parameters = []
+        for future, request_parameters in futures.items():
+            try:
+                future.result()
+                sent_parameters.extend(request_parameters)
+            except Exception as ex:
+                self._LOGGER.warning(f"Problem setting {request_parameters}: {ex}")
+                failed_parameters.extend(request_parameters)
+        self._set_requests_sent(sent_parameters, failed_parameters)
+
+
+    def _set_requests_to_send(self):
+        """
+        Set requests as dictionary of url to (parameters, json data, error message), one request per endpoint.
+        None is returned if there is nothing to set.
+        """
         with self._data_lock:
-            if self._available and self._set_param:
+            if not self._available or not self._set_param:
+                return None
+
+            # All pending parameters are sent in one cycle, one request per endpoint.
+            # Requests are prepared while data is locked and sent after the lock is released.
+            # Parameters changed within coalescing window are left for the next cycle.
+            now = time.monotonic()
+            requests_to_send = dict()
+            ch_temperature_zones = dict()
+            dhw_program_parameters = []
+            set_additional_params = []
+            additional_parameters = []
+            parameters = [
+                key for key, value in self._set_param.items()
+                if now - value[self._REQUESTED] >= self._SET_COALESCE_WINDOW]
+
+            for parameter in parameters:
 
-                set_additional_params = []
-                parameters = [key for key in self._set_param.keys()]
+                try:
 
-                for parameter in parameters:
+                    original_parameter, zone = self._zone_sensor_split(parameter)
+                    set_value = self._set_param[parameter][self._SET_VALUE]
+                    self._LOGGER.info(f'Setting {parameter} new value {self._set_param[parameter][self._VALUE]} [{set_value}]')
+                    
+                    if original_parameter == self._PARAM_MODE:
 
-                    try:
+                        old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
+                        requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/mode'] = (
+                            [parameter], {"new": set_value,"old": old_value}, 'Set Mode')
 
-                        original_parameter, zone = self._zone_sensor_split(parameter)
-                        set_value = self._set_param[parameter][self._SET_VALUE]
-                        self._LOGGER.info(f'Setting {parameter} new value {self._set_param[parameter][self._VALUE]} [{set_value}]')
-                        
-                        if original_parameter == self._PARAM_MODE:
-
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/mode',
-                                json_data={"new": set_value,"old": old_value},
-                                error_msg='Set Mode',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_CH_MODE:
-
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/mode',
-                                json_data={"new": set_value,"old": old_value},
-                                error_msg='Set CH Mode',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_DHW_MODE:
-
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwMode',
-                                json_data={"new": set_value,"old": old_value},
-                                error_msg='Set DHW Mode',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_CH_SET_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            comfort_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._VALUE]
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            economy_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)][self._VALUE]
-                            set_temp = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone))
-                            if set_temp == economy_old and self._get_sensor_value(self._PARAM_CH_MODE) == "Time program":
-                                economy_new = set_value
-                            else:
-                                comfort_new = set_value
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/temperatures?umsys=si',
-                                json_data={"new":{"comf": comfort_new, "econ": economy_new}, "old":{"comf": comfort_old, "econ": economy_old}},
-                                error_msg='Set CH Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_CH_COMFORT_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            economy_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)][self._VALUE]
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/temperatures?umsys=si',
-                                json_data={"new":{"comf": set_value, "econ": economy_new}, "old":{"comf": comfort_old, "econ": economy_old}},
-                                error_msg='Set CH Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_CH_ECONOMY_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            comfort_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._VALUE]
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/temperatures?umsys=si',
-                                json_data={"new":{"comf": comfort_new, "econ": set_value}, "old":{"comf": comfort_old, "econ": economy_old}},
-                                error_msg='Set CH Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_DHW_SET_TEMPERATURE:
-
-                            old_value = self._get_sensor_value(parameter) 
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwTemp?umsys=si',
-                                json_data={"new": set_value,"old": old_value},
-                                error_msg='Set DHW Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_DHW_COMFORT_TEMPERATURE:
-
-                            comfort_old = self._get_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE) 
-                            economy_old= self._get_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE) 
-                            economy_new = self._ariston_sensors[self._PARAM_DHW_ECONOMY_TEMPERATURE][self._VALUE]
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwTimeProgTemperatures?umsys=si',
-                                json_data={"new":{"comf": set_value, "econ": economy_new}, "old":{"comf": comfort_old, "econ": economy_old}},
-                                error_msg='Set DHW Comfort Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter == self._PARAM_DHW_ECONOMY_TEMPERATURE:
-
-                            comfort_old = self._get_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE)
-                            comfort_new = self._ariston_sensors[self._PARAM_DHW_COMFORT_TEMPERATURE][self._VALUE]
-                            economy_old= self._get_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE) 
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwTimeProgTemperatures?umsys=si',
-                                json_data={"new":{"comf": comfort_new, "econ": set_value}, "old":{"comf": comfort_old, "econ": economy_old}},
-                                error_msg='Set DHW Economy Temperature',
-                                timeout=self._TIMEOUT_AV
-                            )
-                            break
-
-                        elif original_parameter in self._LIST_ARISTON_WEB_PARAMS:
-
-                            # Many parameters in one request
-                            
-                            set_additional_params.append(
-                                {
-                                    "id": self._MAP_ARISTON_WEB_MENU_PARAMS[parameter],
-                                    "value": set_value,
-                                    "prevValue": self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                                }
-                            )
+                    elif original_parameter == self._PARAM_CH_MODE:
 
-                        else:
-                            self._LOGGER.error(f"Unsupported parameter to set {parameter}")
-                            raise Exception(f"Unsupported parameter to set {parameter}")
+                        old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
+                        requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/mode'] = (
+                            [parameter], {"new": set_value,"old": old_value}, 'Set CH Mode')
 
-                    except Exception as ex:
-                        self._LOGGER.warning(f"Problem setting {parameter}: {ex}")
-                        del self._set_param[parameter]
-                        continue
+                    elif original_parameter == self._PARAM_DHW_MODE:
+
+                        old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
+                        requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwMode'] = (
+                            [parameter], {"new": set_value,"old": old_value}, 'Set DHW Mode')
+
+                    elif original_parameter in (
+                        self._PARAM_CH_SET_TEMPERATURE,
+                        self._PARAM_CH_COMFORT_TEMPERATURE,
+                        self._PARAM_CH_ECONOMY_TEMPERATURE,
+                    ):
+
+                        # Comfort and economy temperatures of the zone are sent together
+                        ch_temperature_zones.setdefault(zone, []).append(parameter)
+
+                    elif original_parameter == self._PARAM_DHW_SET_TEMPERATURE:
+
+                        old_value = self._get_sensor_value(parameter) 
+                        requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwTemp?umsys=si'] = (
+                            [parameter], {"new": set_value,"old": old_value}, 'Set DHW Temperature')
+
+                    elif original_parameter in (self._PARAM_DHW_COMFORT_TEMPERATURE, self._PARAM_DHW_ECONOMY_TEMPERATURE):
+
+                        # Comfort and economy temperatures are sent together
+                        dhw_program_parameters.append(parameter)
+
+                    elif original_parameter in self._LIST_ARISTON_WEB_PARAMS:
 
+                        # Many parameters in one request
+                        set_additional_params.append(
+                            {
+                                "id": self._MAP_ARISTON_WEB_MENU_PARAMS[parameter],
+                                "value": set_value,
+                                "prevValue": self._string_option_to_number(parameter, self._get_sensor_value(parameter))
+                            }
+                        )
+                        additional_parameters.append(parameter)
+
+                    else:
+                        self._LOGGER.error(f"Unsupported parameter to set {parameter}")
+                        raise Exception(f"Unsupported parameter to set {parameter}")
+
+                except Exception as ex:
+                    self._LOGGER.warning(f"Problem setting {parameter}: {ex}")
+                    del self._set_param[parameter]
+                    continue
+
+            for zone, zone_parameters in ch_temperature_zones.items():
+                comfort_sensor = self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)
+                economy_sensor = self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)
+                set_sensor = self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)
+                comfort_old = self._get_sensor_value(comfort_sensor)
+                economy_old = self._get_sensor_value(economy_sensor)
+                comfort_new = self._ariston_sensors[comfort_sensor].value
+                economy_new = self._ariston_sensors[economy_sensor].value
+                if comfort_sensor in self._set_param:
+                    comfort_new = self._set_param[comfort_sensor][self._SET_VALUE]
+                if economy_sensor in self._set_param:
+                    economy_new = self._set_param[economy_sensor][self._SET_VALUE]
+                if set_sensor in self._set_param:
+                    set_value = self._set_param[set_sensor][self._SET_VALUE]
+                    set_temp = self._get_sensor_value(set_sensor)
+                    ch_mode_sensor = self._zone_sensor_name(self._PARAM_CH_MODE, zone)
+                    if set_temp == economy_old and self._get_sensor_value(ch_mode_sensor) == "Time program":
+                        economy_new = set_value
+                    else:
+                        comfort_new = set_value
+                requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/zones/{self._plant_id}/{zone}/temperatures?umsys=si'] = (
+                    zone_parameters,
+                    {"new":{"comf": comfort_new, "econ": economy_new}, "old":{"comf": comfort_old, "econ": economy_old}},
+                    'Set CH Temperature'
+                )
+
+            if dhw_program_parameters:
+                comfort_old = self._get_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE)
+                economy_old = self._get_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE)
+                comfort_new = self._ariston_sensors[self._PARAM_DHW_COMFORT_TEMPERATURE].value
+                economy_new = self._ariston_sensors[self._PARAM_DHW_ECONOMY_TEMPERATURE].value
+                if self._PARAM_DHW_COMFORT_TEMPERATURE in self._set_param:
+                    comfort_new = self._set_param[self._PARAM_DHW_COMFORT_TEMPERATURE][self._SET_VALUE]
+                if self._PARAM_DHW_ECONOMY_TEMPERATURE in self._set_param:
+                    economy_new = self._set_param[self._PARAM_DHW_ECONOMY_TEMPERATURE][self._SET_VALUE]
+                requests_to_send[f'{self._ARISTON_URL}/api/v2/remote/plantData/{self._plant_id}/dhwTimeProgTemperatures?umsys=si'] = (
+                    dhw_program_parameters,
+                    {"new":{"comf": comfort_new, "econ": economy_new}, "old":{"comf": comfort_old, "econ": economy_old}},
+                    'Set DHW Temperatures'
+                )
+
+            if set_additional_params:
+                requests_to_send[f'{self._ARISTON_URL}/R2/PlantMenu/Submit/{self._plant_id}'] = (
+                    additional_parameters, set_additional_params, 'Set additional parameters')
+        return requests_to_send
+
+
+    def _set_requests_sent(self, sent_parameters, failed_parameters):
+        """Count attempts of sent parameters, drop failed ones and schedule next set and verification"""
+        with self._data_lock:
+            for parameter in failed_parameters:
+                self._set_param.pop(parameter, None)
+
+            self._set_metrics["sent"] += len(sent_parameters)
+            for parameter in sent_parameters:
+                if parameter in self._set_param:
                     self._set_param[parameter][self._ATTEMPT] += 1
                     if self._set_param[parameter][self._ATTEMPT] > self._max_set_retries:
                         del self._set_param[parameter]
 
+            self._subscribers_sensors_inform()
+            self._subscribers_statuses_inform()
+            self._reset_set_requests()
+
+            if self._set_param:
+                self._timer_set_delay.cancel()
+                if self._started:
+                    delay = self._set_period_time
+                    unsent = [value[self._REQUESTED] for value in self._set_param.values() if value[self._ATTEMPT] == 0]
+                    if unsent:
+                        # Send parameters as soon as their coalescing window ends
+                        delay = max(min(unsent) + self._SET_COALESCE_WINDOW - time.monotonic(), self._TIME_SPLIT)
+                    self._LOGGER.info(f"Attempting to set parameter values in {delay} seconds")
+                    self._timer_set_delay = self._set_scheduler.schedule(delay, self._preparing_setting_http_data)
+
+            if sent_parameters and self._started:
+                # Confirm sent values by reading only their items instead of waiting for periodic requests
+                self._timer_verify.cancel()
+                self._timer_verify = self._set_scheduler.schedule(self._VERIFY_DELAYS[0], self._verify_set_data, [0])
+
+
+    def _verify_set_data(self, attempt=0):
+        """
+        Read only items of parameters being set, values matching the set ones are confirmed while storing data.
+        Reads are repeated with increasing delays while parameters remain unconfirmed.
+        """
+        reads = self._verify_requests()
+        if reads is None:
+            return
+        try:
+            for request_type, method, url, json_data, error_msg in reads:
+                if method == "post":
+                    resp = self._request_post(url=url, json_data=json_data, timeout=self._TIMEOUT_AV, error_msg=error_msg)
                 else:
-                    try:
-                        if set_additional_params:
-                            self._request_post(
-                                url=f'{self._ARISTON_URL}/R2/PlantMenu/Submit/{self._plant_id}',
-                                json_data=set_additional_params,
-                                error_msg='Set additional parameters',
-                                timeout=self._TIMEOUT_AV
-                            )
-                    except Exception as ex:
-                        self._LOGGER.warning(f"Problem setting multiple parameters: {ex}")
+                    resp = self._request_get(url=url, timeout=self._TIMEOUT_AV, error_msg=error_msg)
+                with self._data_lock:
+                    self._store_data(resp, request_type, partial=True)
+        except Exception as ex:
+            self._LOGGER.warning(f"Problem verifying set parameters: {ex}")
+        self._verify_done(attempt)
 
-                self._subscribers_sensors_inform()
-                self._subscribers_statuses_inform()
-                self._reset_set_requests()
 
-                if self._set_param:
-                    self._timer_set_delay.cancel()
-                    if self._started:
-                        self._LOGGER.info(f"Attempting to set parameter values in {self._set_period_time} seconds")
-                        self._timer_set_delay = threading.Timer(self._set_period_time, self._preparing_setting_http_data)
-                        self._timer_set_delay.start()
+    def _verify_requests(self):
+        """
+        Reads of items being set as list of (request type, method, url, json data, error message).
+        None is returned if there is nothing to verify.
+        """
+        with self._data_lock:
+            if not self._available or not self._set_param:
+                return None
+            main_items = []
+            additional_items = []
+            for parameter in self._set_param:
+                request_type = self._get_request_for_parameter(parameter)
+                if request_type == self._REQUEST_MAIN:
+                    param, zone = self._MAP_SENSOR_TO_API_ITEM[parameter]
+                    main_items.append({"id": param, "zn": zone})
+                elif request_type == self._REQUEST_ADDITIONAL:
+                    additional_items.append(self._MAP_ARISTON_WEB_MENU_PARAMS[parameter])
+            features = self._features
+        reads = []
+        if main_items:
+            reads.append((
+                self._REQUEST_MAIN,
+                "post",
+                f'{self._ARISTON_URL}/api/v2/remote/dataItems/{self._plant_id}/get?umsys=si',
+                {"useCache": False, "items": main_items, "features": features},
+                "Verify main read"
+            ))
+        if additional_items:
+            reads.append((
+                self._REQUEST_ADDITIONAL,
+                "get",
+                f'{self._ARISTON_URL}/R2/PlantMenu/Refresh?id={self._plant_id}&paramIds={",".join(additional_items)}',
+                None,
+                "Verify additional data read"
+            ))
+        return reads
+
+
+    def _verify_done(self, attempt):
+        """Schedule next verification while parameters remain unconfirmed"""
+        with self._data_lock:
+            if self._set_param and self._started and attempt + 1 < len(self._VERIFY_DELAYS):
+                self._timer_verify = self._set_scheduler.schedule(
+                    self._VERIFY_DELAYS[attempt + 1], self._verify_set_data, [attempt + 1])
+            elif not self._set_param:
+                self._LOGGER.info("All set parameters are confirmed")
                 
 
     def _reset_set_requests(self):
@@ -2014,10 +3269,22 @@ class AristonHandler:
 
 
     def _string_option_to_number(self, sensor, value):
-        if self._ariston_sensors[sensor][self._OPTIONS_TXT]:
-            index = self._ariston_sensors[sensor][self._OPTIONS_TXT].index(value)
-            return self._ariston_sensors[sensor][self._OPTIONS][index]
-        return self._ariston_sensors[sensor][self._VALUE]
+        if self._ariston_sensors[sensor].options_text:
+            index = self._ariston_sensors[sensor].options_text.index(value)
+            return self._ariston_sensors[sensor].options[index]
+        return self._ariston_sensors[sensor].value
+
+
+    def _request_set(self, parameter, value, set_value):
+        """Store value to be set and show it at once, value not sent yet is replaced by the newer one"""
+        previous = self._set_param.get(parameter)
+        if previous is not None and previous[self._ATTEMPT] == 0:
+            self._set_metrics["coalesced"] += 1
+        self._set_metrics["requested"] += 1
+        self._set_param[parameter] = {
+            self._VALUE: value, self._SET_VALUE: set_value, self._ATTEMPT: 0, self._REQUESTED: time.monotonic()}
+        self._ariston_sensors[parameter].value = value
+        self._dirty_sensors.add(parameter)
 
 
     def set_http_data(self, **parameter_list: Union[str, int, float, bool]) -> None:
@@ -2038,38 +3305,39 @@ class AristonHandler:
                 # First check values and pre-process the value
                 bad_values = {}
                 for parameter, value in parameter_list.items():
-                    if parameter not in self._SENSOR_SET_LIST:
+                    if parameter not in self._sensor_set_list:
                         bad_values[parameter] = value
                         continue
-                    if self._ariston_sensors[parameter][self._OPTIONS_TXT] != None:
-                        if value in self._ariston_sensors[parameter][self._OPTIONS_TXT]:
+                    if self._ariston_sensors[parameter].options_text != None:
+                        if value in self._ariston_sensors[parameter].options_text:
                             set_value = self._string_option_to_number(parameter, value)
-                            if value != self._ariston_sensors[parameter][self._VALUE]:
-                                self._set_param[parameter] = {self._VALUE: value, self._SET_VALUE: set_value, self._ATTEMPT: 0}
-                                self._ariston_sensors[parameter][self._VALUE] = value
+                            if value != self._ariston_sensors[parameter].value:
+                                self._request_set(parameter, value, set_value)
                         else:
                             bad_values[parameter] = value
                     if self._is_digit_string(value) != None:
                         value = self._is_digit_string(value)
-                        if self._ariston_sensors[parameter][self._MIN] != None and \
-                            self._ariston_sensors[parameter][self._MAX] != None and \
-                            self._ariston_sensors[parameter][self._STEP] != None and \
-                            value >= self._ariston_sensors[parameter][self._MIN] and \
-                            value <= self._ariston_sensors[parameter][self._MAX]:
-                            if self._ariston_sensors[parameter][self._STEP] == 0.5:
+                        if self._ariston_sensors[parameter].min != None and \
+                            self._ariston_sensors[parameter].max != None and \
+                            self._ariston_sensors[parameter].step != None and \
+                            value >= self._ariston_sensors[parameter].min and \
+                            value <= self._ariston_sensors[parameter].max:
+                            if self._ariston_sensors[parameter].step == 0.5:
                                 value = round(value * 2.0) / 2.0
                             else:
                                 value = round(value)
-                            if value != self._ariston_sensors[parameter][self._VALUE]:
-                                self._set_param[parameter] = {self._VALUE: value, self._SET_VALUE: value, self._ATTEMPT: 0}
-                                self._ariston_sensors[parameter][self._VALUE] = value
+                            if value != self._ariston_sensors[parameter].value:
+                                self._request_set(parameter, value, value)
                         else:
                             bad_values[parameter] = value
 
+                # Optimistic values are shown at once, setting status is updated before sensors are reported
+                self._publish_sensors()
+                self._subscribers_statuses_inform()
+                self._subscribers_sensors_inform()
                 self._timer_set_delay.cancel()
                 if self._started:
-                    self._timer_set_delay = threading.Timer(self._TIME_SPLIT, self._preparing_setting_http_data)
-                    self._timer_set_delay.start()
+                    self._timer_set_delay = self._set_scheduler.schedule(self._SET_COALESCE_WINDOW, self._preparing_setting_http_data)
 
                 if bad_values:
                     self._LOGGER.error(f"Unsupported parameters to be set: {bad_values}")
@@ -2082,29 +3350,35 @@ class AristonHandler:
     def _clear_data(self):
         with self._plant_id_lock:
             self._login = False
-        self._features = {}
-        self._main_data = {}
-        self._additional_data = {}
-        self._error_data = {}
-        self._ch_schedule_data = {}
-        self._dhw_schedule_data = {}
-        self._set_param = {}
-        self._last_month_data = {}
-        self._energy_use_data = {}
-        self._last_dhw_storage_temp = None
-        self._zones = []
-        for sensor in self._ariston_sensors:
-            self._reset_sensor(sensor)
-        self._reset_set_requests()
-        self._subscribers_sensors_inform()
-        self._subscribers_statuses_inform()
+        # Requests sent concurrently at startup may still be storing their replies
+        with self._data_lock:
+            self._features = {}
+            self._main_requests = {}
+            self._main_cold_deadline = 0
+            self._main_data = {}
+            self._main_index = {}
+            self._additional_data = {}
+            self._additional_index = {}
+            self._error_data = {}
+            self._ch_schedule_data = {}
+            self._dhw_schedule_data = {}
+            self._set_param = {}
+            self._last_month_data = {}
+            self._energy_use_data = {}
+            self._last_dhw_storage_temp = None
+            self._zones = []
+            for sensor in self._ariston_sensors:
+                self._reset_sensor(sensor)
+            self._reset_set_requests()
+            self._publish_sensors()
+            self._subscribers_sensors_inform()
+            self._subscribers_statuses_inform()
 
     def start(self) -> None:
         """Start communication with the server."""
         self._started = True
         self._LOGGER.info("Connection started")
-        self._timer_periodic_read = threading.Timer(self._TIME_SPLIT, self._queue_get_data)
-        self._timer_periodic_read.start()
+        self._timer_periodic_read = self._scheduler.schedule(self._TIME_SPLIT, self._startup_requests)
 
 
     def stop(self) -> None:
@@ -2112,14 +3386,211 @@ class AristonHandler:
         self._started = False
         self._timer_periodic_read.cancel()
         self._timer_queue_delay.cancel()
+        self._timer_verify.cancel()
 
         if self._login and self.available:
             self._request_get(
-                url=f'{self._ARISTON_URL}/R2/Account/Logout',
+                url=f'{self._ARISTON_URL}{self._URL_LOGOUT}',
                 error_msg="Logout",
                 ignore_errors=True
             )
         self._session.close()
+        if self._capture is not None:
+            self._capture.flush(self._TIMEOUT_MIN)
+        self._clear_data()
+        self._subscribers_statuses_inform()
+        self._LOGGER.info("Connection stopped")
+
+
+class AsyncAristonHandler(AristonHandler):
+    """
+    Ariston API handler running within asyncio event loop, requests are sent by aiohttp.
+
+    Arguments, sensors, decoding of replies and setting of parameters are the same as in AristonHandler.
+    Additional optional argument:
+
+    'session' - aiohttp.ClientSession to send requests with, it shall have its own cookie jar for the login.
+                If not specified then session is created and it is closed by 'async_stop'.
+
+    Methods 'start', 'set_http_data' and subscriptions must be called from the event loop.
+    Communication is stopped by awaiting 'async_stop'.
+    """
+
+    def __init__(self, *args, session=None, **kwargs) -> None:
+        if aiohttp is None:
+            raise Exception("aiohttp is required by AsyncAristonHandler")
+        if kwargs.get("transport") is not None:
+            raise Exception("AsyncAristonHandler sends requests by aiohttp session, transport is not supported")
+        super().__init__(*args, **kwargs)
+        self._session = session
+        self._own_session = session is None
+        # Jobs run as tasks of the event loop, so set jobs do not wait for reads and share the scheduler
+        self._scheduler = AristonLoopScheduler(self._LOGGER)
+        self._set_scheduler = self._scheduler
+        self._dispatcher = AristonLoopDispatcher(self._LOGGER)
+
+
+    def _create_transport(self, transport):
+        """Requests are sent by aiohttp session, no transport is created"""
+        return None
+
+
+    async def _async_request(self, method, url, json_data=None, timeout=AristonHandler._TIMEOUT_MIN, error_msg='', ignore_errors=False):
+        """Send request, reply is checked the same way as by synchronous requests"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        started = time.time()
+        start = time.monotonic()
+        try:
+            async with self._session.request(
+                method,
+                url,
+                json=json_data,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as reply:
+                resp = AristonResponse(reply.status, await reply.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            if self._capture is not None:
+                self._capture.record(method, url, json_data, started, time.monotonic() - start)
+            self._LOGGER.warning(f'{error_msg} exception: {ex}')
+            if method == "post" or not ignore_errors:
+                raise Exception(f'{error_msg} exception: {ex}')
+            return None
+        if self._capture is not None:
+            self._capture.record(method, url, json_data, started, time.monotonic() - start, resp)
+        if method == "post":
+            self._check_post_reply(resp, error_msg)
+        else:
+            self._check_get_reply(resp, error_msg, ignore_errors)
+        return resp
+
+
+    async def _login_session(self):
+        """Login to fetch Ariston Plant ID and confirm login"""
+        if not self._login and self._started:
+            await self._async_request(
+                "post",
+                url=f'{self._ARISTON_URL}{self._URL_LOGIN}',
+                json_data=self._login_data(),
+                error_msg='Login'
+            )
+            resp = await self._async_request(
+                "get",
+                url=f'{self._ARISTON_URL}{self._URL_GATEWAYS}',
+                error_msg='Gateways'
+            )
+            plant_id = self._select_plant(resp)
+            resp = await self._async_request(
+                "get",
+                url=f'{self._ARISTON_URL}{self._URL_FEATURES.format(plant_id)}',
+                error_msg='Features'
+            )
+            self._store_login(plant_id, self._parse_json(resp))
+
+
+    async def _get_http_data(self, request_type=""):
+        """Common fetching of http data"""
+        await self._login_session()
+        read = self._read_request(request_type)
+        if read:
+            method, url, json_data, timeout, error_msg, cold = read
+            resp = await self._async_request(method, url, json_data, timeout, error_msg)
+            self._store_read(resp, request_type, cold)
+        self._LOGGER.info(f'Data read for {request_type}')
+        return True
+
+
+    async def _startup_requests(self):
+        """
+        Fetch data of all enabled requests at start, then continue with periodic requests.
+        Login and main request go first, other requests are independent and are sent concurrently.
+        """
+        await self._control_availability_state(self._REQUEST_MAIN)
+        sent_requests = [self._REQUEST_MAIN]
+        if self._started and self.available:
+            other_requests = [request for request in self._request_periods if request != self._REQUEST_MAIN]
+            await asyncio.gather(*(self._control_availability_state(request) for request in other_requests))
+            sent_requests.extend(other_requests)
+        self._startup_done(sent_requests)
+
+
+    async def _control_availability_state(self, request_type=""):
+        """Control component availability"""
+        try:
+            result_ok = await self._get_http_data(request_type)
+            self._LOGGER.info(f"ariston action ok for {request_type}")
+        except Exception as ex:
+            self._error_detected()
+            self._LOGGER.warning(f"ariston action nok for {request_type}: {ex}")
+            return
+        if result_ok:
+            self._no_error_detected()
+
+
+    async def _preparing_setting_http_data(self):
+        """Preparing and setting http data"""
+        await self._login_session()
+        requests_to_send = self._set_requests_to_send()
+        if requests_to_send is None:
+            return
+
+        # Requests to different endpoints are sent concurrently
+        results = await asyncio.gather(
+            *(self._async_request("post", url, json_data, self._TIMEOUT_AV, error_msg)
+              for url, (_, json_data, error_msg) in requests_to_send.items()),
+            return_exceptions=True
+        )
+        sent_parameters = []
+        failed_parameters = []
+        for (request_parameters, _, _), result in zip(requests_to_send.values(), results):
+            if isinstance(result, Exception):
+                self._LOGGER.warning(f"Problem setting {request_parameters}: {result}")
+                failed_parameters.extend(request_parameters)
+            else:
+                sent_parameters.extend(request_parameters)
+        self._set_requests_sent(sent_parameters, failed_parameters)
+
+
+    async def _verify_set_data(self, attempt=0):
+        """Read only items of parameters being set, reads are repeated while parameters remain unconfirmed."""
+        reads = self._verify_requests()
+        if reads is None:
+            return
+        try:
+            for request_type, method, url, json_data, error_msg in reads:
+                resp = await self._async_request(method, url, json_data, self._TIMEOUT_AV, error_msg)
+                with self._data_lock:
+                    self._store_data(resp, request_type, partial=True)
+        except Exception as ex:
+            self._LOGGER.warning(f"Problem verifying set parameters: {ex}")
+        self._verify_done(attempt)
+
+
+    def stop(self) -> None:
+        raise Exception("AsyncAristonHandler is stopped by awaiting async_stop")
+
+
+    async def async_stop(self) -> None:
+        """Stop communication with the server."""
+        self._started = False
+        self._timer_periodic_read.cancel()
+        self._timer_queue_delay.cancel()
+        self._timer_set_delay.cancel()
+        self._timer_verify.cancel()
+        self._scheduler.cancel_tasks()
+
+        if self._login and self.available:
+            await self._async_request(
+                "get",
+                url=f'{self._ARISTON_URL}{self._URL_LOGOUT}',
+                error_msg="Logout",
+                ignore_errors=True
+            )
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._capture is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._capture.flush, self._TIMEOUT_MIN)
         self._clear_data()
         self._subscribers_statuses_inform()
         self._LOGGER.info("Connection stopped")
@@ -1,6 +1,5 @@
 """Suppoort for Ariston binary sensors."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -9,6 +8,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import CONF_BINARY_SENSORS, CONF_NAME
 
 from .const import param_zoned
+from .coordinator import AristonEntity
 from .const import (
     DATA_ARISTON,
     DEVICES,
@@ -24,7 +24,6 @@ from .const import (
     PARAM_DHW_FLAME,
     PARAM_THERMAL_CLEANSE_FUNCTION,
     PARAM_CH_PILOT,
-    VALUE,
     VAL_ON,
     ZONED_PARAMS
 )
@@ -42,7 +41,6 @@ BINARY_SENSOR_INTERNET_WEATHER = "Internet Weather"
 BINARY_SENSOR_THERMAL_CLEANSE_FUNCTION = "Thermal Cleanse Function"
 BINARY_SENSOR_CH_PILOT = "CH Pilot"
 
-SCAN_INTERVAL = timedelta(seconds=2)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,27 +79,27 @@ for param in binary_sensors_default:
         del BINARY_SENSORS[param]
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up a binary sensor for Ariston."""
     if discovery_info is None:
         return
 
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
-    add_entities(
+    async_add_entities(
         [
             AristonBinarySensor(name, device, sensor_type)
             for sensor_type in discovery_info[CONF_BINARY_SENSORS]
-        ],
-        True,
+        ]
     )
 
 
-class AristonBinarySensor(BinarySensorEntity):
+class AristonBinarySensor(AristonEntity, BinarySensorEntity):
     """Binary sensor for Ariston."""
 
     def __init__(self, name, device, sensor_type):
         """Initialize entity."""
+        super().__init__(device, [sensor_type])
         self._api = device.api.ariston_api
         self._attrs = {}
         self._device_class = BINARY_SENSORS[sensor_type][1]
@@ -120,11 +118,6 @@ class AristonBinarySensor(BinarySensorEntity):
         """Return the state attributes."""
         return self._attrs
 
-    @property
-    def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
-
     @property
     def name(self):
         """Return entity name."""
@@ -150,7 +143,7 @@ class AristonBinarySensor(BinarySensorEntity):
         else:
             return (
                 self._api.available
-                and not self._api.sensor_values[self._sensor_type][VALUE] is None
+                and not self._api.get_value(self._sensor_type) is None
             )
 
     @property
@@ -168,7 +161,7 @@ class AristonBinarySensor(BinarySensorEntity):
             else:
                 if not self._api.available:
                     return
-                if self._api.sensor_values[self._sensor_type][VALUE] == VAL_ON:
+                if self._api.get_value(self._sensor_type) == VAL_ON:
                     self._state = True
                 else:
                     self._state = False
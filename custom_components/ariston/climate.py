@@ -2,8 +2,8 @@
 Adds support for the Ariston Boiler
 """
 import logging
-from datetime import timedelta
 from .const import param_zoned
+from .coordinator import AristonEntity
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
@@ -37,35 +37,32 @@ from .const import (
     VAL_PROGRAM,
     VAL_HOLIDAY,
     VAL_OFFLINE,
-    VALUE,
     UNITS,
     MIN,
     MAX,
     STEP,
 )
 
-SCAN_INTERVAL = timedelta(seconds=2)
 SUPPORT_FLAGS = ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.TARGET_TEMPERATURE
 UNKNOWN_TEMP = 0.0
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Setup the Ariston Platform."""
     if discovery_info is None:
         return
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
-    add_entities(
+    async_add_entities(
         [
             AristonThermostat(name, device, climate_name)
             for climate_name in discovery_info[CONF_CLIMATES]
-        ],
-        True,
+        ]
     )
 
-class AristonThermostat(ClimateEntity):
+class AristonThermostat(AristonEntity, ClimateEntity):
     """Representation of a Ariston Thermostat."""
 
     def __init__(self, name, device, climate_name):
@@ -75,6 +72,14 @@ class AristonThermostat(ClimateEntity):
         self._device = device.device
         self._climate_name = climate_name
         self._zone = int(climate_name[-1])
+        super().__init__(device, [
+            PARAM_MODE,
+            PARAM_HOLIDAY_MODE,
+            param_zoned(PARAM_CH_MODE, self._zone),
+            param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone),
+            param_zoned(PARAM_CH_DETECTED_TEMPERATURE, self._zone),
+            param_zoned(PARAM_CH_FLAME, self._zone),
+        ])
 
     @property
     def unique_id(self):
@@ -86,7 +91,7 @@ class AristonThermostat(ClimateEntity):
         """Return the name of the Climate device."""
         try:
             if self._api.ch_available:
-                current_mode = self._api.sensor_values[PARAM_MODE][VALUE]
+                current_mode = self._api.get_value(PARAM_MODE)
             else:
                 current_mode = VAL_OFFLINE
         except KeyError:
@@ -101,16 +106,11 @@ class AristonThermostat(ClimateEntity):
         """Return the name of the Climate device."""
         return self._climate_name
 
-    @property
-    def should_poll(self):
-        """Polling is required."""
-        return True
-
     @property
     def min_temp(self):
         """Return minimum temperature."""
         try:
-            minimum_temp = self._api.sensor_values[param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone)][MIN]
+            minimum_temp = self._api.get_sensor(param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone))[MIN]
         except KeyError:
             return UNKNOWN_TEMP
         return minimum_temp
@@ -119,7 +119,7 @@ class AristonThermostat(ClimateEntity):
     def max_temp(self):
         """Return the maximum temperature."""
         try:
-            maximum_temp = self._api.sensor_values[param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone)][MAX]
+            maximum_temp = self._api.get_sensor(param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone))[MAX]
         except KeyError:
             return UNKNOWN_TEMP
         return maximum_temp
@@ -128,7 +128,7 @@ class AristonThermostat(ClimateEntity):
     def temperature_unit(self):
         """Return the unit of measurement."""
         try:
-            units = self._api.sensor_values[param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone)][UNITS]
+            units = self._api.get_sensor(param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone))[UNITS]
         except KeyError:
             return UnitOfTemperature.CELSIUS
         return units
@@ -137,7 +137,7 @@ class AristonThermostat(ClimateEntity):
     def current_temperature(self):
         """Return the current temperature."""
         try:
-            current_temp = self._api.sensor_values[param_zoned(PARAM_CH_DETECTED_TEMPERATURE, self._zone)][VALUE]
+            current_temp = self._api.get_value(param_zoned(PARAM_CH_DETECTED_TEMPERATURE, self._zone))
         except KeyError:
             return UNKNOWN_TEMP
         return current_temp
@@ -146,7 +146,7 @@ class AristonThermostat(ClimateEntity):
     def target_temperature(self):
         """Return the temperature we try to reach."""
         try:
-            target_temp = self._api.sensor_values[param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone)][VALUE]
+            target_temp = self._api.get_value(param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone))
         except KeyError:
             return UNKNOWN_TEMP
         return target_temp
@@ -155,8 +155,8 @@ class AristonThermostat(ClimateEntity):
     def hvac_mode(self):
         """Return hvac operation ie. heat, cool mode."""
         try:
-            climate_mode = self._api.sensor_values[PARAM_MODE][VALUE] 
-            climate_ch_mode = self._api.sensor_values[param_zoned(PARAM_CH_MODE, self._zone)][VALUE] 
+            climate_mode = self._api.get_value(PARAM_MODE) 
+            climate_ch_mode = self._api.get_value(param_zoned(PARAM_CH_MODE, self._zone)) 
             curr_hvac_mode = HVACMode.OFF
             if climate_mode and climate_mode in [VAL_WINTER, VAL_HEATING_ONLY]:
                 if climate_ch_mode == VAL_MANUAL:
@@ -176,7 +176,7 @@ class AristonThermostat(ClimateEntity):
     def hvac_modes(self):
         """HVAC modes."""
         try:
-            supported_ch_modes = self._api.sensor_values[param_zoned(PARAM_CH_MODE, self._zone)][OPTIONS_TXT] 
+            supported_ch_modes = self._api.get_sensor(param_zoned(PARAM_CH_MODE, self._zone))[OPTIONS_TXT] 
             supported_modes = []
             if supported_ch_modes and VAL_MANUAL in supported_ch_modes:
                 supported_modes.append(HVACMode.HEAT)
@@ -193,15 +193,15 @@ class AristonThermostat(ClimateEntity):
         """Return the current running hvac operation."""
         try:
             curr_hvac_action = HVACAction.OFF
-            climate_mode = self._api.sensor_values[PARAM_MODE][VALUE]
+            climate_mode = self._api.get_value(PARAM_MODE)
             if climate_mode in [VAL_WINTER, VAL_HEATING_ONLY]:
-                ch_flame = self._api.sensor_values[param_zoned(PARAM_CH_FLAME, self._zone)][VALUE]
+                ch_flame = self._api.get_value(param_zoned(PARAM_CH_FLAME, self._zone))
                 if ch_flame == VAL_ON:
                     curr_hvac_action = HVACAction.HEATING
                 else:
                     curr_hvac_action = HVACAction.IDLE
             if climate_mode in [VAL_COOLING]:
-                ch_flame = self._api.sensor_values[param_zoned(PARAM_CH_FLAME, self._zone)][VALUE]
+                ch_flame = self._api.get_value(param_zoned(PARAM_CH_FLAME, self._zone))
                 if ch_flame == VAL_ON:
                     curr_hvac_action = HVACAction.COOLING
                 else:
@@ -214,8 +214,8 @@ class AristonThermostat(ClimateEntity):
     def preset_mode(self):
         """Return the current preset mode, e.g., home, away, temp."""
         try:
-            curr_preset_mode = self._api.sensor_values[PARAM_MODE][VALUE]
-            if self._api.sensor_values[PARAM_HOLIDAY_MODE][VALUE] == VAL_ON:
+            curr_preset_mode = self._api.get_value(PARAM_MODE)
+            if self._api.get_value(PARAM_HOLIDAY_MODE) == VAL_ON:
                 curr_preset_mode = VAL_HOLIDAY
         except KeyError:
             return VAL_OFFLINE
@@ -225,10 +225,12 @@ class AristonThermostat(ClimateEntity):
     def preset_modes(self):
         """Return a list of available preset modes."""
         try:
-            all_presets = self._api.sensor_values[PARAM_MODE][OPTIONS_TXT]
+            all_presets = self._api.get_sensor(PARAM_MODE)[OPTIONS_TXT]
         except KeyError:
             return []
-        return all_presets
+        if all_presets is None:
+            return []
+        return list(all_presets)
 
     @property
     def supported_features(self):
@@ -244,15 +246,15 @@ class AristonThermostat(ClimateEntity):
     def target_temperature_step(self):
         """Return the supported step of target temperature."""
         try:
-            step = self._api.sensor_values[param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone)][STEP]
+            step = self._api.get_sensor(param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone))[STEP]
         except KeyError:
             return 0.5
         return step
 
-    def set_hvac_mode(self, hvac_mode):
+    async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
-        supported_modes = self._api.sensor_values[PARAM_MODE][OPTIONS_TXT]
-        current_mode = self._api.sensor_values[PARAM_MODE][VALUE]
+        supported_modes = self._api.get_sensor(PARAM_MODE)[OPTIONS_TXT]
+        current_mode = self._api.get_value(PARAM_MODE)
         if hvac_mode == HVACMode.OFF:
             self._api.set_http_data(**{PARAM_MODE: VAL_SUMMER})
         elif hvac_mode == HVACMode.AUTO:
@@ -299,11 +301,11 @@ class AristonThermostat(ClimateEntity):
             ch_mode = VAL_MANUAL
             self._api.set_http_data(**{PARAM_MODE: VAL_COOLING, param_zoned(PARAM_CH_MODE, self._zone): ch_mode})
 
-    def set_preset_mode(self, preset_mode):
+    async def async_set_preset_mode(self, preset_mode):
         """Set new target preset mode."""
         self._api.set_http_data(**{PARAM_MODE: preset_mode})
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
         new_temperature = kwargs.get(ATTR_TEMPERATURE)
         if new_temperature is not None:
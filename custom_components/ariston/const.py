@@ -164,6 +164,25 @@ CONF_PERIOD_SET = "period_set"
 CONF_PERIOD_GET = "period_get"
 CONF_MAX_SET_RETRIES = "max_set_retries"
 CONF_CH_ZONES = "num_ch_zones"
+CONF_REQUEST_PERIODS = "request_periods"
+CONF_CAPTURE_FILE = "capture_file"
+
+REQUEST_MAIN = "main"
+REQUEST_ADDITIONAL = "additional_params"
+REQUEST_ERRORS = "errors"
+REQUEST_CH_SCHEDULE = "ch_schedule"
+REQUEST_DHW_SCHEDULE = "dhw_schedule"
+REQUEST_LAST_MONTH = "last_month"
+REQUEST_ENERGY = "energy"
+REQUESTS = [
+    REQUEST_MAIN,
+    REQUEST_ADDITIONAL,
+    REQUEST_ERRORS,
+    REQUEST_CH_SCHEDULE,
+    REQUEST_DHW_SCHEDULE,
+    REQUEST_LAST_MONTH,
+    REQUEST_ENERGY,
+]
 
 VALUE = "value"
 UNITS = "units"
@@ -0,0 +1,77 @@
+"""Coordinator pushing Ariston data to entities."""
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AristonCoordinator(DataUpdateCoordinator):
+    """
+    Coordinator of one Ariston device.
+
+    It does not poll, it is updated by AristonHandler subscriptions within Home Assistant event loop.
+    Changes of API statuses (availability, setting of data) update all entities,
+    changed sensors are delivered only to listeners of those sensors.
+    """
+
+    def __init__(self, hass, ariston_api, name):
+        super().__init__(hass, _LOGGER, name=name)
+        self._ariston_api = ariston_api
+        ariston_api.subscribe_statuses(self._statuses_changed, event_loop=hass.loop)
+
+    @callback
+    def async_add_sensors_listener(self, update_callback, sensors):
+        """Call update_callback with changed data of the sensors, function removing the listener is returned"""
+        self._ariston_api.subscribe_sensors(update_callback, sensors=sensors, event_loop=self.hass.loop)
+
+        @callback
+        def remove_listener():
+            self._ariston_api.unsubscribe_sensors(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _statuses_changed(self, changed_data):
+        self.async_set_updated_data(changed_data)
+
+    async def _async_update_data(self):
+        """Requested refresh makes all entities to update from the latest data"""
+        return {}
+
+
+class AristonEntity(CoordinatorEntity):
+    """
+    Base of Ariston entities.
+
+    State is calculated by 'update' and written when one of 'sensors'
+    or API statuses have changed.
+    """
+
+    def __init__(self, device, sensors):
+        super().__init__(device.coordinator)
+        self._coordinator_sensors = frozenset(sensors)
+
+    def update(self):
+        """Update data"""
+
+    async def async_added_to_hass(self):
+        """Listen to own sensors only and calculate initial state before it is written"""
+        self.async_on_remove(
+            self.coordinator.async_add_sensors_listener(self._handle_sensors_update, self._coordinator_sensors))
+        self.update()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_sensors_update(self, changed_data):
+        self.update()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self):
+        self.update()
+        self.async_write_ha_state()
@@ -1,12 +1,12 @@
 """Suppoort for Ariston seletion."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.const import CONF_SELECTOR, CONF_NAME
 
 from .const import param_zoned
+from .coordinator import AristonEntity
 from .const import (
     DATA_ARISTON,
     DEVICES,
@@ -45,7 +45,6 @@ SELECT_DHW_SET_TEMPERATURE = "DHW Set Temperature"
 SELECT_DHW_COMFORT_TEMPERATURE = "DHW Comfort Temperature"
 SELECT_DHW_ECONOMY_TEMPERATURE = "DHW Economy Temperature"
 
-SCAN_INTERVAL = timedelta(seconds=2)
 
 selects_deafult = {
     PARAM_MODE: (SELECT_MODE, "mdi:water-boiler"),
@@ -73,27 +72,27 @@ for param in selects_deafult:
 
 _LOGGER = logging.getLogger(__name__)
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up a select for Ariston."""
     if discovery_info is None:
         return
 
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
-    add_entities(
+    async_add_entities(
         [
             AristonSelect(name, device, select_type)
             for select_type in discovery_info[CONF_SELECTOR]
-        ],
-        True,
+        ]
     )
 
 
-class AristonSelect(SelectEntity):
+class AristonSelect(AristonEntity, SelectEntity):
     """Select for Ariston."""
 
     def __init__(self, name, device, select_type):
         """Initialize entity."""
+        super().__init__(device, [select_type])
         self._api = device.api.ariston_api
         self._icon = SELECTS[select_type][1]
         self._name = "{} {}".format(name, SELECTS[select_type][0])
@@ -106,11 +105,6 @@ class AristonSelect(SelectEntity):
         """Return the unique id."""
         return f"{self._name}-SELECT-{self._select_type}"
 
-    @property
-    def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
-
     @property
     def name(self):
         """Return the name of this select device if any."""
@@ -127,7 +121,7 @@ class AristonSelect(SelectEntity):
         try:
             return (
                 self._api.available
-                and self._api.sensor_values[self._select_type][VALUE] is not None
+                and self._api.get_value(self._select_type) is not None
             )
         except KeyError:
             return False
@@ -136,7 +130,7 @@ class AristonSelect(SelectEntity):
     def current_option(self):
         """Return current option."""
         try:
-            return str(self._api.sensor_values[self._select_type][VALUE])
+            return str(self._api.get_value(self._select_type))
         except KeyError:
             return None
 
@@ -144,13 +138,13 @@ class AristonSelect(SelectEntity):
     def options(self):
         """Return options."""
         try:
-            if self._api.sensor_values[self._select_type][VALUE] is not None and \
-                self._api.sensor_values[self._select_type][OPTIONS_TXT] is not None:
-                return self._api.sensor_values[self._select_type][OPTIONS_TXT]
-            elif self._api.sensor_values[self._select_type][VALUE] is not None:
-                min_val = self._api.sensor_values[self._select_type][MIN]
-                max_val = self._api.sensor_values[self._select_type][MAX]
-                step_val = self._api.sensor_values[self._select_type][STEP]
+            sensor = self._api.get_sensor(self._select_type)
+            if sensor[VALUE] is not None and sensor[OPTIONS_TXT] is not None:
+                return list(sensor[OPTIONS_TXT])
+            elif sensor[VALUE] is not None:
+                min_val = sensor[MIN]
+                max_val = sensor[MAX]
+                step_val = sensor[STEP]
                 values = list()
                 value = min_val
                 while value < max_val + .1:
@@ -162,7 +156,7 @@ class AristonSelect(SelectEntity):
         except:
             return []
 
-    def select_option(self, option):
+    async def async_select_option(self, option):
         """Change the selected option."""
         self._api.set_http_data(**{self._select_type: option})
 
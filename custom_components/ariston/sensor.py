@@ -1,6 +1,5 @@
 """Suppoort for Ariston sensors."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 
 from homeassistant.const import CONF_NAME, CONF_SENSORS
@@ -15,6 +14,7 @@ from homeassistant.components.sensor import (
 )
 
 from .const import param_zoned
+from .coordinator import AristonEntity
 from .const import (
     DATA_ARISTON,
     DEVICES,
@@ -90,7 +90,6 @@ from .const import (
     PARAM_DHW_ENERGY_DELTA_THIS_YEAR,
     PARAM_DHW_ENERGY_DELTA_LAST_YEAR,
     PARAM_VERSION,
-    VALUE,
     UNITS,
     ATTRIBUTES,
     MIN,
@@ -100,7 +99,6 @@ from .const import (
     ZONED_PARAMS
 )
 
-SCAN_INTERVAL = timedelta(seconds=2)
 
 STATE_AVAILABLE = "available"
 
@@ -268,27 +266,27 @@ for param in sensors_default:
         del SENSORS[param]
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up a sensor for Ariston."""
     if discovery_info is None:
         return
 
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
-    add_entities(
+    async_add_entities(
         [
             AristonSensor(name, device, sensor_type)
             for sensor_type in discovery_info[CONF_SENSORS]
-        ],
-        True,
+        ]
     )
 
 
-class AristonSensor(Entity):
+class AristonSensor(AristonEntity, Entity):
     """A sensor implementation for Ariston."""
 
     def __init__(self, name, device, sensor_type):
         """Initialize a sensor for Ariston."""
+        super().__init__(device, [sensor_type])
         self._name = "{} {}".format(name, SENSORS[sensor_type][0])
         self._signal_name = name
         self._api = device.api.ariston_api
@@ -328,7 +326,7 @@ class AristonSensor(Entity):
     def native_unit_of_measurement(self):
         """Return unit of sensor."""
         try:
-            return self._api.sensor_values[self._sensor_type][UNITS]
+            return self._api.get_sensor(self._sensor_type)[UNITS]
         except KeyError:
             return None
 
@@ -347,7 +345,7 @@ class AristonSensor(Entity):
         """Icon to use in the frontend, if any."""
         if self._sensor_type == PARAM_ERRORS_COUNT:
             try:
-                if self._api.sensor_values[PARAM_ERRORS_COUNT][VALUE] == 0:
+                if self._api.get_value(PARAM_ERRORS_COUNT) == 0:
                     return "mdi:shield"
             except KeyError:
                 pass
@@ -357,7 +355,7 @@ class AristonSensor(Entity):
     def unit_of_measurement(self):
         """Return the units of measurement."""
         try:
-            return self._api.sensor_values[self._sensor_type][UNITS]
+            return self._api.get_sensor(self._sensor_type)[UNITS]
         except KeyError:
             return None
 
@@ -368,7 +366,7 @@ class AristonSensor(Entity):
             return True
         return (
             self._api.available
-            and not self._api.sensor_values[self._sensor_type][VALUE] is None
+            and not self._api.get_value(self._sensor_type) is None
         )
 
 
@@ -380,18 +378,17 @@ class AristonSensor(Entity):
                 return
             if not self._api.available:
                 return
-            self._state = self._api.sensor_values[self._sensor_type][VALUE]
-            self._attrs = self._api.sensor_values[self._sensor_type][ATTRIBUTES]
+            self._state = self._api.get_value(self._sensor_type)
+            meta = self._api.get_meta(self._sensor_type)
+            self._attrs = dict(meta[ATTRIBUTES])
             if not self._attrs:
-                if self._api.sensor_values[self._sensor_type][OPTIONS_TXT]:
-                    self._attrs[OPTIONS_TXT] = self._api.sensor_values[self._sensor_type][OPTIONS_TXT]
-                    self._attrs[OPTIONS] = self._api.sensor_values[self._sensor_type][OPTIONS]
-                elif self._api.sensor_values[self._sensor_type][MIN] and \
-                    self._api.sensor_values[self._sensor_type][MAX] and \
-                    self._api.sensor_values[self._sensor_type][STEP]:
-                    self._attrs[MIN] = self._api.sensor_values[self._sensor_type][MIN]
-                    self._attrs[MAX] = self._api.sensor_values[self._sensor_type][MAX]
-                    self._attrs[STEP] = self._api.sensor_values[self._sensor_type][STEP]
+                if meta[OPTIONS_TXT]:
+                    self._attrs[OPTIONS_TXT] = list(meta[OPTIONS_TXT])
+                    self._attrs[OPTIONS] = list(meta[OPTIONS])
+                elif meta[MIN] and meta[MAX] and meta[STEP]:
+                    self._attrs[MIN] = meta[MIN]
+                    self._attrs[MAX] = meta[MAX]
+                    self._attrs[STEP] = meta[STEP]
             if self._state_class:
                 self._attrs["state_class"] = self._state_class
 
@@ -1,10 +1,10 @@
 """Suppoort for Ariston switch."""
-from datetime import timedelta
 from copy import deepcopy
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import CONF_SWITCHES, CONF_NAME
 
 from .const import param_zoned
+from .coordinator import AristonEntity
 from .const import (
     DATA_ARISTON,
     DEVICES,
@@ -12,7 +12,6 @@ from .const import (
     PARAM_INTERNET_WEATHER,
     PARAM_CH_AUTO_FUNCTION,
     PARAM_THERMAL_CLEANSE_FUNCTION,
-    VALUE,
     VAL_OFF,
     VAL_ON,
     ZONED_PARAMS
@@ -24,7 +23,6 @@ SWITCH_INTERNET_WEATHER = "Internet Weather"
 SWITCH_THERMAL_CLEANSE_FUNCTION = "Thermal Cleanse Function"
 SWITCH_POWER = "Power"
 
-SCAN_INTERVAL = timedelta(seconds=2)
 
 switches_default = {
     PARAM_INTERNET_TIME: (SWITCH_INTERNET_TIME, "mdi:update"),
@@ -44,27 +42,27 @@ for param in switches_default:
         del SWITCHES[param]
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up a switches for Ariston."""
     if discovery_info is None:
         return
 
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
-    add_entities(
+    async_add_entities(
         [
             AristonSwitch(name, device, switch_type)
             for switch_type in discovery_info[CONF_SWITCHES]
-        ],
-        True,
+        ]
     )
 
 
-class AristonSwitch(SwitchEntity):
+class AristonSwitch(AristonEntity, SwitchEntity):
     """Switch for Ariston."""
 
     def __init__(self, name, device, switch_type):
         """Initialize entity."""
+        super().__init__(device, [switch_type])
         self._api = device.api.ariston_api
         self._icon = SWITCHES[switch_type][1]
         self._name = "{} {}".format(name, SWITCHES[switch_type][0])
@@ -77,11 +75,6 @@ class AristonSwitch(SwitchEntity):
         """Return the unique id."""
         return f"{self._name}-{self._switch_type}"
 
-    @property
-    def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
-
     @property
     def name(self):
         """Return the name of this Switch device if any."""
@@ -98,7 +91,7 @@ class AristonSwitch(SwitchEntity):
         try:
             return (
                 self._api.available
-                and not self._api.sensor_values[self._switch_type][VALUE] is None
+                and not self._api.get_value(self._switch_type) is None
             )
         except KeyError:
             return False
@@ -109,15 +102,15 @@ class AristonSwitch(SwitchEntity):
         try:
             if not self._api.available:
                 return False
-            return self._api.sensor_values[self._switch_type][VALUE] == VAL_ON
+            return self._api.get_value(self._switch_type) == VAL_ON
         except KeyError:
             return False
 
-    def turn_on(self, **kwargs):
+    async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
         self._api.set_http_data(**{self._switch_type: VAL_ON})
 
-    def turn_off(self, **kwargs):
+    async def async_turn_off(self, **kwargs):
         """Turn the device off."""
         self._api.set_http_data(**{self._switch_type: VAL_OFF})
 
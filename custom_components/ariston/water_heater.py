@@ -1,6 +1,5 @@
 """Support for Ariston water heaters."""
 import logging
-from datetime import timedelta
 
 from homeassistant.components.water_heater import (
     WaterHeaterEntity,
@@ -13,6 +12,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 
+from .coordinator import AristonEntity
 from .const import (
     DATA_ARISTON,
     DEVICES,
@@ -27,7 +27,6 @@ from .const import (
     VAL_WINTER,
     VAL_OFFLINE,
     VAL_DISABLED,
-    VALUE,
     UNITS,
     MIN,
     MAX,
@@ -40,12 +39,10 @@ ACTION_IDLE = "idle"
 ACTION_HEATING = "heating"
 UNKNOWN_TEMP = 0.0
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 _LOGGER = logging.getLogger(__name__)
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Ariston water heater devices."""
     if discovery_info is None:
         return
@@ -53,16 +50,23 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     name = discovery_info[CONF_NAME]
     device = hass.data[DATA_ARISTON][DEVICES][name]
 
-    add_entities([AristonWaterHeater(name, device)])
+    async_add_entities([AristonWaterHeater(name, device)])
 
 
-class AristonWaterHeater(WaterHeaterEntity):
+class AristonWaterHeater(AristonEntity, WaterHeaterEntity):
     """Ariston Water Heater Device."""
 
     def __init__(self, name, device):
         """Initialize the thermostat."""
         self._name = name
         self._api = device.api.ariston_api
+        super().__init__(device, [
+            PARAM_MODE,
+            PARAM_DHW_MODE,
+            PARAM_DHW_STORAGE_TEMPERATURE,
+            PARAM_DHW_SET_TEMPERATURE,
+            PARAM_DHW_FLAME,
+        ])
 
     @property
     def unique_id(self):
@@ -79,7 +83,7 @@ class AristonWaterHeater(WaterHeaterEntity):
         """Return the name of the Water Heater device."""
         try:
             if self._api.dhw_available:
-                current_mode = self._api.sensor_values[PARAM_MODE][VALUE]
+                current_mode = self._api.get_value(PARAM_MODE)
             else:
                 current_mode = VAL_OFFLINE
         except KeyError:
@@ -89,11 +93,6 @@ class AristonWaterHeater(WaterHeaterEntity):
         else:
             return "mdi:water-pump-off"
 
-    @property
-    def should_poll(self):
-        """Polling is required."""
-        return True
-
     @property
     def available(self):
         """Return True if entity is available."""
@@ -103,7 +102,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def supported_features(self):
         """Return the list of supported features."""
         try:
-            if self._api.sensor_values[PARAM_DHW_MODE][OPTIONS_TXT]:
+            if self._api.get_sensor(PARAM_DHW_MODE)[OPTIONS_TXT]:
                 features = WaterHeaterEntityFeature.OPERATION_MODE | WaterHeaterEntityFeature.TARGET_TEMPERATURE
             else:
                 features = WaterHeaterEntityFeature.TARGET_TEMPERATURE
@@ -115,7 +114,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def current_temperature(self):
         """Return the temperature"""
         try:
-            current_temp = self._api.sensor_values[PARAM_DHW_STORAGE_TEMPERATURE][VALUE]
+            current_temp = self._api.get_value(PARAM_DHW_STORAGE_TEMPERATURE)
             if current_temp == 0:
                 # Not supported
                 current_temp = None
@@ -127,7 +126,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def temperature_unit(self):
         """Return the unit of measurement."""
         try:
-            units = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][UNITS]
+            units = self._api.get_sensor(PARAM_DHW_SET_TEMPERATURE)[UNITS]
         except KeyError:
             return UnitOfTemperature.CELSIUS
         return units
@@ -136,7 +135,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def min_temp(self):
         """Return minimum temperature."""
         try:
-            minimum_temp = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][MIN]
+            minimum_temp = self._api.get_sensor(PARAM_DHW_SET_TEMPERATURE)[MIN]
         except KeyError:
             return UNKNOWN_TEMP
         return minimum_temp
@@ -145,7 +144,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def max_temp(self):
         """Return the maximum temperature."""
         try:
-            maximum_temp = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][MAX]
+            maximum_temp = self._api.get_sensor(PARAM_DHW_SET_TEMPERATURE)[MAX]
         except KeyError:
             return UNKNOWN_TEMP
         return maximum_temp
@@ -154,7 +153,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def target_temperature(self):
         """Return the temperature we try to reach."""
         try:
-            target_temp = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][VALUE]
+            target_temp = self._api.get_value(PARAM_DHW_SET_TEMPERATURE)
         except KeyError:
             return UNKNOWN_TEMP
         return target_temp
@@ -163,7 +162,7 @@ class AristonWaterHeater(WaterHeaterEntity):
     def target_temperature_step(self):
         """Return the supported step of target temperature."""
         try:
-            step = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][STEP]
+            step = self._api.get_sensor(PARAM_DHW_SET_TEMPERATURE)[STEP]
         except KeyError:
             return 1.0
         return step
@@ -172,11 +171,11 @@ class AristonWaterHeater(WaterHeaterEntity):
     def extra_state_attributes(self):
         """Return the supported step of target temperature."""
         try:
-            step = self._api.sensor_values[PARAM_DHW_SET_TEMPERATURE][STEP]
+            step = self._api.get_sensor(PARAM_DHW_SET_TEMPERATURE)[STEP]
         except KeyError:
             step = 1.0
         try:
-            if self._api.sensor_values[PARAM_DHW_FLAME][VALUE] == VAL_ON:
+            if self._api.get_value(PARAM_DHW_FLAME) == VAL_ON:
                 action = ACTION_HEATING
             else:
                 action = ACTION_IDLE
@@ -188,16 +187,18 @@ class AristonWaterHeater(WaterHeaterEntity):
     def operation_list(self):
         """List of available operation modes."""
         try:
-            op_list = self._api.sensor_values[PARAM_DHW_MODE][OPTIONS_TXT]
+            op_list = self._api.get_sensor(PARAM_DHW_MODE)[OPTIONS_TXT]
         except KeyError:
             return []
-        return op_list
+        if op_list is None:
+            return []
+        return list(op_list)
 
     @property
     def current_operation(self):
         """Return current operation"""
         try:
-            current_op = self._api.sensor_values[PARAM_DHW_MODE][VALUE]
+            current_op = self._api.get_value(PARAM_DHW_MODE)
         except KeyError:
             if self._api.dhw_available:
                 return VAL_DISABLED
@@ -205,13 +206,13 @@ class AristonWaterHeater(WaterHeaterEntity):
                 return VAL_OFFLINE
         return current_op
 
-    def set_temperature(self, **kwargs):
+    async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
         new_temperature = kwargs.get(ATTR_TEMPERATURE)
         if new_temperature is not None:
             self._api.set_http_data(**{PARAM_DHW_SET_TEMPERATURE: new_temperature})
 
-    def set_operation_mode(self, operation_mode):
+    async def async_set_operation_mode(self, operation_mode):
         """Set operation mode."""
         self._api.set_http_data(**{PARAM_DHW_MODE: operation_mode})
 